@@ -8,39 +8,16 @@ import os
 import struct
 from dataclasses import dataclass
 
+from FF8GameData.fs import lzs
+
 COMP_NONE = 0
 COMP_LZSS = 1
 
 
 def lzss_decompress(src: bytes, expected_size: int | None = None) -> bytes:
-    """FF7/FF8 LZSS: 12-bit window offset, 4-bit length (+3), 18-byte bias."""
-    out = bytearray()
-    i, n = 0, len(src)
-    while i < n:
-        control = src[i]
-        i += 1
-        for bit in range(8):
-            if i >= n:
-                break
-            if control & (1 << bit):
-                out.append(src[i])
-                i += 1
-            else:
-                if i + 1 >= n:
-                    break
-                b1, b2 = src[i], src[i + 1]
-                i += 2
-                ofs = ((b2 & 0xF0) << 4) | b1
-                length = (b2 & 0x0F) + 3
-                pos = len(out) - ((len(out) - 18 - ofs) & 0xFFF)
-                for _ in range(length):
-                    out.append(out[pos] if pos >= 0 else 0)
-                    pos += 1
-        if expected_size is not None and len(out) >= expected_size:
-            break
-    if expected_size is not None:
-        del out[expected_size:]
-    return bytes(out)
+    """FF7/FF8 LZSS: 12-bit window offset, 4-bit length (+3), 18-byte bias.
+    Same codec as the fs archives, see FF8GameData/fs/lzs.py."""
+    return bytes(lzs.decode(src, expected_size, truncate=expected_size is not None))
 
 
 @dataclass
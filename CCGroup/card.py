@@ -70,13 +70,13 @@ class Card:
 
     def change_card_mod(self, mod=0, size=64):
         if mod == 1:
-            self._image = self.card_info["img_remaster"]
+            self._image = self.game_data.get_card_image(self.card_info, "img_remaster")
             self._name = self.card_info["name"]
         elif mod == 2:
-            self._image = self.card_info["img_xylomod"]
+            self._image = self.game_data.get_card_image(self.card_info, "img_xylomod")
             self._name = self.card_info["name_xylomod"]
         else:
-            self._image = self.card_info["img"]
+            self._image = self.game_data.get_card_image(self.card_info)
             self._name = self.card_info["name"]
         self._image = self._image.resize((size, size), Image.BILINEAR)
         self._image = QPixmap.fromImage(ImageQt(self._image))
@@ -10,7 +10,7 @@ from CCGroup.cardwidget import CardWidget
 from CCGroup.npccardgamewidget import NpcCardGameWidget
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 
 
 class CCGroupWidget(QWidget):
@@ -97,7 +97,7 @@ class CCGroupWidget(QWidget):
         self.__layout_top.addStretch(1)
 
         self.current_file_data = bytearray()
-        self.game_data = GameData(game_data_path)
+        self.game_data = get_shared_game_data(game_data_path)
         self.game_data.load_card_data()
         self.game_data.load_exe_data()
 
@@ -13,7 +13,7 @@ from Cid.drawillustrationwidget import DrawIllustrationWidget
 from Cid.worlddrawsection import WorldDrawSection
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import GameData, get_shared_game_data
 
 
 class CidWidget(QWidget):
@@ -42,7 +42,7 @@ class CidWidget(QWidget):
         if field_images_folder is None:
             field_images_folder = os.path.join(icon_path, 'field_image')
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_field_data()
         self.game_data.load_exe_data()
         self.game_data.load_magic_data()
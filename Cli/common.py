@@ -21,9 +21,8 @@ def load_game_data():
     command needs it at most once, and the test suite runs many commands)."""
     global _game_data
     if _game_data is None:
-        from FF8GameData.gamedata import GameData
-        _game_data = GameData(str(PROJECT_ROOT / "FF8GameData"))
-        _game_data.load_all()
+        from FF8GameData.gamedata import get_shared_game_data
+        _game_data = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
     return _game_data
 
 
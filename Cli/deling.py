@@ -0,0 +1,80 @@
+"""
+Deling CLI Tool.
+
+Headless access to the game archives (.fs/.fi/.fl), without deling-cli:
+  • list     (print the fl path and size of every entry, nested archives included)
+  • extract  (write every entry to a folder, one at a time so the memory stays low
+              even on field.fs; entries already extracted with the right size are skipped)
+"""
+
+import argparse
+import os
+import sys
+
+from .base import BaseCliTool
+
+
+def _archive(fs_path: str):
+    from FF8GameData.fs.fsmanager import Archive
+    base_path = os.path.splitext(fs_path)[0]
+    archive = Archive(base_path + ".fs", base_path + ".fi", base_path + ".fl", cache_size=0)
+    archive.load_data(use_mmap=True)
+    return archive
+
+
+def _cmd_list(args) -> int:
+    archive = _archive(args.input)
+    for path, size in archive.iter_entry_info(nested=not args.no_nested):
+        print(f"{size:>10} {path}")
+    return 0
+
+
+def _cmd_extract(args) -> int:
+    archive = _archive(args.input)
+    nb_written, nb_skipped = archive.extract_to_folder(args.output, nested=not args.no_nested,
+                                                       skip_existing=not args.overwrite)
+    print(f"[ok] {nb_written} entries extracted to {args.output}" +
+          (f" ({nb_skipped} already there)" if nb_skipped else ""))
+    return 0
+
+
+class DelingCliTool(BaseCliTool):
+    """CLI tool for the game archives (.fs/.fi/.fl)."""
+
+    @property
+    def name(self) -> str:
+        return "deling"
+
+    @property
+    def description(self) -> str:
+        return "Archive tool: list and extract the .fs/.fi/.fl game archives, nested ones included"
+
+    def build_parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser(
+            prog="ff8-cli deling",
+            description="Headless access to the game archives (.fs/.fi/.fl)",
+        )
+        sub = parser.add_subparsers(dest="command", required=True)
+
+        p_list = sub.add_parser("list", help="List the entries of an archive")
+        p_list.add_argument("--input", "-i", required=True, help="Path to the .fs (the .fi and .fl must be next to it)")
+        p_list.add_argument("--no-nested", action="store_true", help="List the nested archives as their fs/fi/fl files")
+        p_list.set_defaults(func=_cmd_list)
+
+        p_extract = sub.add_parser("extract", help="Extract every entry of an archive to a folder")
+        p_extract.add_argument("--input", "-i", required=True, help="Path to the .fs (the .fi and .fl must be next to it)")
+        p_extract.add_argument("--output", "-o", required=True, help="Folder where the entries are written")
+        p_extract.add_argument("--no-nested", action="store_true",
+                               help="Write the nested archives as their fs/fi/fl files instead of their content")
+        p_extract.add_argument("--overwrite", action="store_true",
+                               help="Write every entry, even the ones already extracted with the right size")
+        p_extract.set_defaults(func=_cmd_extract)
+
+        return parser
+
+    def execute(self, args: argparse.Namespace) -> int:
+        try:
+            return args.func(args)
+        except Exception as e:
+            print(f"[error] {e}", file=sys.stderr)
+            return 1
@@ -20,9 +20,8 @@ AI_SECTION_TITLES = ["# Init code", "# Enemy turn", "# Counter-attack", "# Death
 
 
 def _load_game_data():
-    from FF8GameData.gamedata import GameData
-    gd = GameData(str(pathlib.Path(__file__).resolve().parent.parent / "FF8GameData"))
-    gd.load_all()
+    from FF8GameData.gamedata import get_shared_game_data
+    gd = get_shared_game_data(str(pathlib.Path(__file__).resolve().parent.parent / "FF8GameData"))
     return gd
 
 
@@ -42,7 +41,7 @@ def _load_enemy(dat_path: str):
 
     enemy = MonsterAnalyser(game_data)
     enemy.load_file_data(dat_path, game_data)
-    enemy.analyse_loaded_data(game_data, decompiler)
+    enemy.analyse_loaded_data(game_data, decompiler, lazy=True)  # Only the AI and its texts are needed
     compiler.set_battle_text_info_stat(enemy.battle_script_data['battle_text'], enemy.info_stat_data)
     return game_data, enemy, compiler, decompiler
 
@@ -30,12 +30,11 @@ class _Holder:
 
 def _load_enemy(dat_path: str):
     """Headless monster load (no QApplication, no textures)."""
-    from FF8GameData.gamedata import GameData
+    from FF8GameData.gamedata import get_shared_game_data
     from FF8GameData.dat.monsteranalyser import MonsterAnalyser
     from Ifrit.IfritAI.AICompiler.AIDecompiler import AIDecompiler
 
-    game_data = GameData(str(PROJECT_ROOT / "FF8GameData"))
-    game_data.load_all()
+    game_data = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
     decompiler = AIDecompiler(game_data, [], None)
     enemy = MonsterAnalyser(game_data)
     enemy.load_file_data(dat_path, game_data)
@@ -6,6 +6,7 @@ Provides command-line interface for ShumiTranslator operations:
   • export CSV  (load → csv)
   • import CSV  (csv → save binary)
   • compress / uncompress  (kernel only)
+  • check-overflow  (csv → texts leaving their box)
 """
 
 import argparse
@@ -37,8 +38,8 @@ DEFAULT_DELIMITER = "|"
 
 def _load_game_data():
     """Load game data from FF8GameData module."""
-    from FF8GameData.gamedata import GameData
-    gd = GameData(str(pathlib.Path(__file__).resolve().parent.parent / "FF8GameData"))
+    from FF8GameData.gamedata import get_shared_game_data
+    gd = get_shared_game_data(str(pathlib.Path(__file__).resolve().parent.parent / "FF8GameData"))
     gd.load_kernel_data()
     gd.load_mngrp_data()
     gd.load_item_data()
@@ -240,6 +241,7 @@ def _get_csv_delimiter(csv_path: str) -> str:
 
 def _apply_csv_to_sections(csv_path: str, delimiter: str, sections: List[Tuple]):
     """Read CSV and push text values back into section objects."""
+    text_by_widget = {}
     with open(csv_path, newline="", encoding="utf-8") as f:
         reader = csv.reader(f, delimiter=delimiter, quotechar='"')
         for row_idx, row in enumerate(reader):
@@ -250,11 +252,18 @@ def _apply_csv_to_sections(csv_path: str, delimiter: str, sections: List[Tuple])
             text = row[3].replace("`", "'")
             if not text:
                 continue
-            _, section = sections[widget_id]
-            # Same logic the GUI uses (SectionWidget.set_text_from_id ->
-            # TranslationWidget.change_custom_text -> FF8Text.set_str): the CLI
-            # yields model sections, which expose the text objects via get_text_list().
-            text_list = section.get_text_list()
+            text_by_widget.setdefault(widget_id, {})[text_sub_id] = text
+    for widget_id, text_by_sub_id in text_by_widget.items():
+        _, section = sections[widget_id]
+        # Same logic the GUI uses (SectionWidget.set_text_from_id ->
+        # TranslationWidget.change_custom_text -> FF8Text.set_str): the CLI
+        # yields model sections, which expose the text objects via get_text_list().
+        text_list = section.get_text_list()
+        if hasattr(section, "set_text_list"):  # All the changed texts of the section encoded in one batch
+            section.set_text_list([text_by_sub_id[i] if text_by_sub_id.get(i, ff8_text.get_str()) != ff8_text.get_str()
+                                   else None for i, ff8_text in enumerate(text_list)])
+            continue
+        for text_sub_id, text in text_by_sub_id.items():
             if text_sub_id < len(text_list):
                 text_list[text_sub_id].set_str(text)
 
@@ -367,6 +376,63 @@ def _import_world_csv(gd, input_file: str, csv_file: str, output_dir: str):
     return str(out_dir)
 
 
+# ---------------------------------------------------------------------------
+# Text Overflow Check
+# ---------------------------------------------------------------------------
+
+def _read_csv_text(csv_path: str):
+    """Yield (section name, widget id, text sub id, text) for each text row of a CSV."""
+    delimiter = _get_csv_delimiter(csv_path)
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter, quotechar='"')
+        for row_idx, row in enumerate(reader):
+            if row_idx == 0 or len(row) < 4:
+                continue
+            yield row[0], int(row[1]), int(row[2]), row[3].replace("`", "'")
+
+
+def _get_reference_box(layout_cache, reference_csv: str) -> dict:
+    """The box of each section (widget id) of a reference CSV: the widest line and the most lines of its texts,
+    what the game already shows in it."""
+    box_by_widget = {}
+    for _, widget_id, _, text in _read_csv_text(reference_csv):
+        try:
+            layout = layout_cache.layout(text)
+        except ValueError:
+            continue
+        max_width, max_lines = box_by_widget.get(widget_id, (0, 0))
+        box_by_widget[widget_id] = (max(max_width, layout.max_width), max(max_lines, layout.line_count))
+    return box_by_widget
+
+
+def _check_csv_overflow(layout_cache, csv_file: str, max_width: int = None, max_lines: int = None,
+                        reference_csv: str = None) -> List[Tuple]:
+    """
+    Lay out every text of a CSV and list the ones leaving their box
+    :param layout_cache: The TextLayoutCache (font and line height) used for every text
+    :param max_width: Box width in px, for the sections not in the reference CSV (None: no width limit)
+    :param max_lines: Box line count, for the sections not in the reference CSV (None: no line limit)
+    :param reference_csv: CSV of the same file (the vanilla one), giving the box of each section
+    :return: (section name, widget id, text sub id, text, layout or the encoding error, box width, box lines)
+    of each overflowing text
+    """
+    box_by_widget = _get_reference_box(layout_cache, reference_csv) if reference_csv else {}
+    overflow_list = []
+    for section_name, widget_id, text_sub_id, text in _read_csv_text(csv_file):
+        if not text:
+            continue
+        box_width, box_lines = box_by_widget.get(widget_id, (max_width, max_lines))
+        try:
+            layout = layout_cache.layout(text)
+        except ValueError as e:  # Can't be shown at all
+            overflow_list.append((section_name, widget_id, text_sub_id, text, e, box_width, box_lines))
+            continue
+        if layout.overflows(box_width if box_width is not None else layout.max_width,
+                            box_lines if box_lines is not None else layout.line_count):
+            overflow_list.append((section_name, widget_id, text_sub_id, text, layout, box_width, box_lines))
+    return overflow_list
+
+
 # ---------------------------------------------------------------------------
 # Command Handlers
 # ---------------------------------------------------------------------------
@@ -615,6 +681,30 @@ def _cmd_export_all_world(args):
     print(f"[export-all-world] Done! CSV files saved to {output_dir}")
 
 
+def _cmd_check_overflow(args):
+    """Report every text of a CSV overflowing its box."""
+    from FF8GameData.font.textlayout import FontMetrics, TextLayoutCache
+    from FF8GameData.gamedata import get_shared_game_data
+    gd = get_shared_game_data(str(pathlib.Path(__file__).resolve().parent.parent / "FF8GameData"))
+    metrics = FontMetrics.from_folder(args.font_dir)
+    if not metrics.exact:
+        print("[check-overflow] No sysfnt.tdw found, using a uniform glyph width")
+    if args.reference is None and args.max_width is None and args.max_lines is None:
+        print("[error] Give a --reference CSV or a --max-width/--max-lines box.", file=sys.stderr)
+        return 1
+    layout_cache = TextLayoutCache(gd, metrics, line_height=args.line_height)
+    overflow_list = _check_csv_overflow(layout_cache, args.csv, args.max_width, args.max_lines, args.reference)
+    for section_name, widget_id, text_sub_id, text, layout, box_width, box_lines in overflow_list:
+        if isinstance(layout, ValueError):
+            print(f"{section_name}|{widget_id}|{text_sub_id}: can't be encoded ({layout}): {text!r}")
+        else:
+            print(f"{section_name}|{widget_id}|{text_sub_id}: width {layout.max_width}/{box_width} px, "
+                  f"lines {layout.line_count}/{box_lines}: {text!r}")
+    print(f"[check-overflow] {len(overflow_list)} overflowing text(s) in {args.csv} "
+          f"({len(layout_cache)} distinct layouts)")
+    return 1 if overflow_list else 0
+
+
 def _cmd_compress(args):
     """Compress kernel.bin text strings."""
     gd = _load_game_data()
@@ -787,6 +877,18 @@ class ShumiTranslatorCliTool(BaseCliTool):
         p_export_world.add_argument("--output-dir", "-o", required=True, help="Directory where CSV files will be saved.")
         p_export_world.set_defaults(func=_cmd_export_all_world)
 
+        # check-overflow
+        p_check = sub.add_parser("check-overflow", help="Lay out every text of a CSV and report the ones overflowing their box")
+        p_check.add_argument("--csv", "-c", required=True, help="CSV file to check (as produced by export-csv).")
+        p_check.add_argument("--reference", "-r",
+                             help="CSV of the vanilla file: each section's box is the widest line and the most lines of its texts.")
+        p_check.add_argument("--max-width", type=int, help="Box width in px (sections not in --reference).")
+        p_check.add_argument("--max-lines", type=int, help="Box line count (sections not in --reference).")
+        p_check.add_argument("--font-dir", default="", help="Folder containing sysfnt.tdw (uniform widths if omitted).")
+        p_check.add_argument("--line-height", type=int, default=13,
+                             help="Px per line break: 13 for the menus, 16 for the SeeD test.")
+        p_check.set_defaults(func=_cmd_check_overflow)
+
         # compress
         p_compress = sub.add_parser("compress", help="Compress kernel.bin text strings (kernel only)")
         p_compress.add_argument("--input", "-i", required=True, help="kernel.bin path.")
@@ -813,8 +915,7 @@ class ShumiTranslatorCliTool(BaseCliTool):
             if not hasattr(args, 'func'):
                 print(f"[error] No command specified", file=sys.stderr)
                 return 1
-            args.func(args)
-            return 0
+            return args.func(args) or 0
         except Exception as e:
             print(f"[error] {e}", file=sys.stderr)
             return 1
@@ -1,32 +1,46 @@
+import re
+
 from .section import Section
 from ..gamedata import GameData, SectionType
 
+# Pairs of characters having a one byte code in the font
+COMPRESS_LIST = ["{in}", "{e }", "{ne}", "{to}", "{re}", "{HP}", "{l }", "{ll}", "{GF}", "{nt}", "{il}", "{o }",
+                 "{ef}", "{on}", "{ w}", "{ r}", "{wi}", "{fi}", "{EC}", "{s }", "{ar}", "{FE}", "{ S}", "{ag}"]
+COMPRESS_DICT = {compress_el[1:-1]: compress_el for compress_el in COMPRESS_LIST}
+# Parts of a text never compressed: the {tags} and the escaped characters
+TEXT_TAG_PATTERN = re.compile(r'\{[^}]*\}|\\.', re.DOTALL)
+
 
 class FF8Text(Section):
     def __init__(self, game_data: GameData, own_offset: int, data_hex: bytearray, id: int, cursor_location_size=2, first_hex_literal=False):
         Section.__init__(self, game_data=game_data, own_offset=own_offset, data_hex=data_hex, id=id, name="")
         self._cursor_location_size = cursor_location_size
-        self._text_str = self._game_data.translate_hex_to_str(self._data_hex,
-                                                              cursor_location_size=self._cursor_location_size, first_hex_literal=first_hex_literal)
-        self.set_str(self._text_str)  # To remove unwanted 0 for example
+        self._first_hex_literal = first_hex_literal
+        # The text is decoded on the first get_str, the bytes only have their unwanted 0 removed
+        self._text_str = None
+        data_hex = self._game_data.remove_text_zero(self._data_hex, cursor_location_size=self._cursor_location_size,
+                                                    first_hex_literal=first_hex_literal)
+        if data_hex:  # If empty don't put \x00
+            data_hex.append(0x00)
+        self._set_data_hex(data_hex)
         self.type = SectionType.FF8_TEXT
 
     def __str__(self):
         return self.get_str()
 
     def __repr__(self):
-        return f"FF8Text({self._text_str})"  # - Hex: {self._data_hex.hex(sep=" ")}"
+        return f"FF8Text({self.get_str()})"  # - Hex: {self._data_hex.hex(sep=" ")}"
 
     def __add__(self, other):
         if self.own_offset <= other.own_offset:
             own_offset = self.own_offset
-            data_hex = self._data_hex
+            data_hex = bytearray(self._data_hex)  # Copy, the text of self being decoded from its bytes
             data_hex.extend(other._data_hex)
             new_id = self.id
             new_cursor_location_size = self._cursor_location_size
         else:
             own_offset = other.own_offset
-            data_hex = other.get_data_hex()
+            data_hex = bytearray(other.get_data_hex())
             data_hex.extend(self._data_hex)
             new_id = other.id
             new_cursor_location_size = other._cursor_location_size
@@ -35,9 +49,16 @@ class FF8Text(Section):
                        cursor_location_size=new_cursor_location_size)
 
     def get_str(self):
+        if self._text_str is None:
+            # Without the ending 0x00, so a control byte missing its argument is decoded alone
+            self._text_str = self._game_data.translate_hex_to_str(self._data_hex[:-1],
+                                                                  cursor_location_size=self._cursor_location_size,
+                                                                  first_hex_literal=self._first_hex_literal)
         return self._text_str
 
     def set_str(self, text: str):
+        if text == self._text_str:  # Same text, the bytes are kept
+            return
         converted_data_list = self._game_data.translate_str_to_hex(text)
         self._data_hex = bytearray(converted_data_list)
         self._text_str = text
@@ -45,28 +66,65 @@ class FF8Text(Section):
             self._data_hex.extend([0x00])
         self._size = len(self._data_hex)
 
+    def _set_str_and_data_hex(self, text: str, data_hex: bytearray):
+        """Set a text already encoded (see ListFF8Text.set_text_list)"""
+        self._text_str = text
+        self._set_data_hex(data_hex)
+
     def compress_str(self, compressible=3):
+        """
+        Replace the pairs of characters having a one byte code (see COMPRESS_LIST) so the text takes the fewest bytes
+        :param compressible: The compressibility_factor of the section: 0 not compressible, 1 only the first text of
+        each subsection, 2 only the second one, 3 all
+        """
         if compressible == 0:  # Not compressible
             return
         if compressible == 2 and self.id % 2 == 0:  # Only second is compressible but we are id 0 of the subsection
             return
         if compressible == 1 and self.id % 2 == 1:  # Only first is compressible but we are id 1 of the subsection (not 0)
             return
+        self.set_str(FF8Text.compress_text(self.get_str()))
+
+    @staticmethod
+    def compress_text(text: str) -> str:
+        """
+        Compress a text with the fewest bytes, the tags ({Squall}, {x0400}, the already compressed {in}...) and the
+        escaped characters being kept as is
+        """
+        compressed_list = []
+        last_index = 0
+        for tag in TEXT_TAG_PATTERN.finditer(text):
+            compressed_list.append(FF8Text.__compress_plain_text(text[last_index:tag.start()]))
+            compressed_list.append(tag.group())
+            last_index = tag.end()
+        compressed_list.append(FF8Text.__compress_plain_text(text[last_index:]))
+        return ''.join(compressed_list)
 
-        compress_list = ["{in}", "{e }", "{ne}", "{to}", "{re}", "{HP}", "{l }", "{ll}", "{GF}", "{nt}", "{il}", "{o }",
-                         "{ef}", "{on}", "{ w}", "{ r}", "{wi}", "{fi}", "{EC}", "{s }", "{ar}", "{FE}", "{ S}", "{ag}"]
-        for compress_el in compress_list:
-            if compress_el[1:-1] not in self._text_str:
-                continue
-            new_str_double_bracket = self._text_str.replace(compress_el[1:-1], compress_el)
-            new_str_double_bracket = new_str_double_bracket.replace('{{', '{')
-            new_str_double_bracket = new_str_double_bracket.replace('}}', '}')
-            self.set_str(new_str_double_bracket)
+    @staticmethod
+    def __compress_plain_text(text: str) -> str:
+        # nb_byte[i] is the fewest bytes for text[i:], a char being 1 byte, a pair of COMPRESS_DICT too
+        text_size = len(text)
+        nb_byte = [0] * (text_size + 2)
+        use_pair = [False] * text_size
+        for i in range(text_size - 1, -1, -1):
+            nb_byte[i] = nb_byte[i + 1] + 1
+            if text[i:i + 2] in COMPRESS_DICT and nb_byte[i + 2] <= nb_byte[i + 1]:
+                nb_byte[i] = nb_byte[i + 2] + 1
+                use_pair[i] = True
+        compressed_list = []
+        i = 0
+        while i < text_size:
+            if use_pair[i]:
+                compressed_list.append(COMPRESS_DICT[text[i:i + 2]])
+                i += 2
+            else:
+                compressed_list.append(text[i])
+                i += 1
+        return ''.join(compressed_list)
 
     def uncompress_str(self):
-        compress_list = ["{in}", "{e }", "{ne}", "{to}", "{re}", "{HP}", "{l }", "{ll}", "{GF}", "{nt}", "{il}", "{o }",
-                         "{ef}", "{on}", "{ w}", "{ r}", "{wi}", "{fi}", "{EC}", "{s }", "{ar}", "{FE}", "{ S}", "{ag}"]
-        for compress_el in compress_list:
-            if compress_el not in self._text_str:
-                continue
-            self.set_str(self._text_str.replace(compress_el, compress_el[1:-1]))
+        text = self.get_str()
+        for compress_el in COMPRESS_LIST:
+            if compress_el in text:
+                text = text.replace(compress_el, compress_el[1:-1])
+        self.set_str(text)
@@ -7,6 +7,7 @@ class ListFF8Text(Section):
     def __init__(self, game_data: GameData, data_hex: bytearray, id: int, own_offset: int, name: str, section_data_linked=None, cursor_location_size=2):
         Section.__init__(self, game_data=game_data, data_hex=data_hex, id=id, own_offset=own_offset, name=name)
         self._text_list = []
+        self._offset_list = []  # Offset of each text in data_hex, set by update_data_hex
         self.section_data_linked = section_data_linked
         self.type = SectionType.FF8_TEXT
         self.cursor_location_size = cursor_location_size
@@ -23,22 +24,8 @@ class ListFF8Text(Section):
     def init_text(self, offset_list: list):
         if not offset_list:
             return
-        for i, offset in enumerate(offset_list):
-            next_offset = 0
-            if i == len(offset_list) - 1:  # Last one, compare with end of data
-                for j in range(offset+1, len(self._data_hex)):
-                    if self._data_hex[j] == 0: # Searching the last 0, as we don't know exactly the end
-                        next_offset = j
-                        break
-                if next_offset == 0:# If end not found, let's try to make it work with end of data
-                    next_offset = len(self._data_hex)
-            else:
-                next_offset = offset_list[i + 1] # Default value
-                for j in range(i + 1, len(offset_list)):  # We are searching the next valid offset
-                    if offset_list[j] != 0xFFFF:  # Unused data:
-                        next_offset = offset_list[j]
-                        break
-            text_hex = self._data_hex[offset:next_offset]
+        # Cut as GameData.decode_text_list does, each FF8Text decoding its text on demand
+        for text_hex in GameData.split_text_list(self._data_hex, offset_list):
             self.add_text(text_hex)
 
     def add_text(self, text_hex: bytearray):
@@ -60,9 +47,27 @@ class ListFF8Text(Section):
     def get_text_from_id(self, id_text: int):
         return self._text_list[id_text].get_str()
 
-    def update_data_hex(self):
-        self._data_hex = bytearray()
-        for data in self._text_list:
-            self._data_hex.extend(data.get_data_hex())
+    def set_text_list(self, text_list: list):
+        """
+        Set the text of every FF8Text, all the new texts being encoded in one batch
+        :param text_list: The new text of each FF8Text, None to keep one
+        """
+        index_list = [i for i, text in enumerate(text_list[:len(self._text_list)]) if text is not None]
+        data_hex, offset_list = self._game_data.encode_text_list([text_list[i] for i in index_list])
+        offset_list.append(len(data_hex))
+        for offset_index, i in enumerate(index_list):
+            self._text_list[i]._set_str_and_data_hex(text_list[i],
+                                                     data_hex[offset_list[offset_index]:offset_list[offset_index + 1]])
+
+    def get_offset_list(self):
+        """The offset of each text in data_hex, as computed by the last update_data_hex"""
+        return self._offset_list
+
+    def update_data_hex(self, deduplicate=False):
+        """
+        :param deduplicate: If True, the identical texts are written once, sharing the same offset
+        """
+        self._data_hex, self._offset_list = GameData.pack_text_list(
+            [data.get_data_hex() for data in self._text_list], deduplicate)
         self._size = len(self._data_hex)
         return self._data_hex
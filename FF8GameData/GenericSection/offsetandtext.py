@@ -9,15 +9,17 @@ class SectionOffsetAndText(Section):
     HEADER_SIZE = 2
 
     def __init__(self, game_data: GameData, data_hex, id=0, own_offset=0, name="", offset_size=2, nb_offset=1, ignore_empty_offset=True, nb_byte_shift=0,
-                 text_offset_start_0=False):
+                 text_offset_start_0=False, deduplicate=False):
         """text_offset_start_0 means that the first offset of the list is equal to zero as it is the offset from the text section itself.
-        Usually, the offset is from the start of the file or the section containing the offset itself, so it doesn't start at 0"""
+        Usually, the offset is from the start of the file or the section containing the offset itself, so it doesn't start at 0
+        deduplicate means that the identical texts are written once on save, their offsets being the same"""
         Section.__init__(self, game_data=game_data, data_hex=data_hex, id=id, own_offset=own_offset, name=name)
         self._offset_size = offset_size
         self._text_offset_start_0 = text_offset_start_0
         self._nb_offset = nb_offset
         self._nb_byte_shift = nb_byte_shift
         self._ignore_empty_offset = ignore_empty_offset
+        self._deduplicate = deduplicate
         self._offset_section = None
         self._text_section = None
         self.type = SectionType.OFFSET_AND_TEXT
@@ -43,8 +45,9 @@ class SectionOffsetAndText(Section):
         return self.__str__()
 
     def update_data_hex(self):
-        self._text_section.update_data_hex()
-        self._offset_section.set_all_offset_by_text_list(self._text_section.get_text_list(), shift=self.OFFSET_SIZE * self._nb_offset)
+        self._text_section.update_data_hex(deduplicate=self._deduplicate)
+        self._offset_section.set_all_offset_by_text_offset_list(self._text_section.get_offset_list(),
+                                                                shift=self.OFFSET_SIZE * self._nb_offset)
         self._offset_section.update_data_hex()
 
         self._data_hex = bytearray()
@@ -92,3 +95,7 @@ class SectionOffsetAndText(Section):
 
     def get_text_list(self):
         return self._text_section.get_text_list()
+
+    def set_text_list(self, text_list: list):
+        """Set all the texts, encoded in one batch (see ListFF8Text.set_text_list)"""
+        self._text_section.set_text_list(text_list)
@@ -50,19 +50,30 @@ class SectionData(Section):
     def set_all_offset_by_text_list(self, text_list, shift=0):
         # Only the offsets that are not empty get a text: an empty one keeps its place with no
         # string, so the text list is shorter than the offset list when ignore_empty_offset is off.
-        if len(text_list) != self.get_nb_offset_not_empty():
-            print(f"The size of the text list ({len(text_list)}) is different than the nb of "
+        text_offset_list = []
+        current_offset = 0
+        for text in text_list:
+            text_offset_list.append(current_offset)
+            current_offset += len(text)
+        self.set_all_offset_by_text_offset_list(text_offset_list, shift=shift)
+
+    def set_all_offset_by_text_offset_list(self, text_offset_list, shift=0):
+        """
+        Same as set_all_offset_by_text_list, with the offsets of the texts already known (texts sharing an offset)
+        :param text_offset_list: The offset of each text in the text section
+        :param shift: Added to each offset
+        """
+        if len(text_offset_list) != self.get_nb_offset_not_empty():
+            print(f"The size of the text list ({len(text_offset_list)}) is different than the nb of "
                   f"offset holding a text ({self.get_nb_offset_not_empty()})")
 
         new_list = []
         index_value_list = 0
-        current_offset = shift
         for i in range(len(self._offset_list)):  # Assuming offset data is always at the beginning of the subsection
             if self._offset_list[i].get_offset_value() == 0:
                 new_hex = bytes([0, 0])
             else:
-                new_hex = current_offset.to_bytes(length=self.OFFSET_SIZE, byteorder='little')
-                current_offset += len(text_list[index_value_list])
+                new_hex = (text_offset_list[index_value_list] + shift).to_bytes(length=self.OFFSET_SIZE, byteorder='little')
                 index_value_list += 1
             new_data = FF8Data(game_data=self._game_data, own_offset=i * self.OFFSET_SIZE,
                                data_hex=new_hex, id=i,
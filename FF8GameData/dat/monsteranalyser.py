@@ -16,6 +16,58 @@ class GarbageFileError(IndexError):
     pass
 
 
+class SectionRawDataList(list):
+    """The raw bytes of each .dat section.
+    A section sliced from the loaded file is kept as a read-only memoryview into file_raw_data (no copy), and only
+    becomes its own bytearray the first time it is accessed by index, so the callers can still edit it in place
+    (extend, slice assignment...). get_view reads a section without making that copy."""
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        section = list.__getitem__(self, index)
+        if isinstance(section, memoryview):
+            section = bytearray(section)
+            list.__setitem__(self, index, section)
+        return section
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reduce__(self):  # A memoryview can't be copied nor pickled
+        return self.__class__, ([bytearray(section) if isinstance(section, memoryview) else section
+                                 for section in list.__iter__(self)],)
+
+    def get_view(self, index: int) -> memoryview:
+        """Read-only access to a section, without copying it. Not to be kept: a view on a bytearray section
+        prevents it from being resized."""
+        return memoryview(list.__getitem__(self, index)).toreadonly()
+
+    def is_view(self, index: int) -> bool:
+        """True if the section is still the untouched slice of the loaded file"""
+        return isinstance(list.__getitem__(self, index), memoryview)
+
+
+class LazySectionData:
+    """Parsed data of a section (bone_data, info_stat_data...), parsed on first access when analyse_loaded_data was
+    called with lazy=True"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.attribute_name = "_" + name
+
+    def __get__(self, monster_analyser, owner=None):
+        if monster_analyser is None:
+            return self
+        monster_analyser._run_pending_analysis(self.name)
+        return monster_analyser.__dict__[self.attribute_name]
+
+    def __set__(self, monster_analyser, value):
+        monster_analyser.__dict__.get('_pending_analysis_dict', {}).pop(self.name, None)  # Replaced, not to be parsed
+        monster_analyser.__dict__[self.attribute_name] = value
+
+
 class MonsterAnalyser:
     DAT_FILE_SECTION_LIST = ['header', 'skeleton', 'model_geometry', 'model_animation', 'unknown_section4', 'unknown_section5', 'unknown_section6', 'info_stat',
                              'battle_script', 'sound', 'unknown_section10', 'texture']
@@ -34,13 +86,40 @@ class MonsterAnalyser:
         EntityType.MONSTER_NO_MODEL: 3,
     }
 
+    # Section data parsed from each section, by entity type, in parsing order (section number: section data)
+    SECTION_DATA_BY_ENTITY = {
+        EntityType.WEAPON_NO_ANIM: {1: 'geometry_data', 2: 'seq_animation_data'},
+        EntityType.WEAPON: {1: 'bone_data', 2: 'geometry_data', 3: 'animation_data', 4: 'seq_animation_data'},
+        EntityType.CHARACTER: {1: 'bone_data', 2: 'geometry_data', 3: 'animation_data'},
+        # Section 4: dynamic texture, section 5: camera sequence (both kept raw, as for a character), section 6: the
+        # animation sequences a weapon would normally carry.
+        EntityType.CHARACTER_NO_WEAPON: {1: 'bone_data', 2: 'geometry_data', 3: 'animation_data', 6: 'seq_animation_data'},
+        EntityType.MONSTER: {1: 'bone_data', 2: 'geometry_data', 3: 'animation_data', 4: 'dynamic_texture_data',
+                             5: 'seq_animation_data', 7: 'info_stat_data', 8: 'battle_script_data', 11: 'texture_data'},
+        # No skeleton/geometry/animation/dynamic-texture/camera/seq_anim/sound/texture sections at all - just info_stat
+        # then AI, the same formats and byte sizes as a normal monster's sections 7 and 8.
+        EntityType.MONSTER_NO_MODEL: {1: 'info_stat_data', 2: 'battle_script_data'},
+    }
+
+    bone_data = LazySectionData()
+    geometry_data = LazySectionData()
+    animation_data = LazySectionData()
+    dynamic_texture_data = LazySectionData()
+    seq_animation_data = LazySectionData()
+    info_stat_data = LazySectionData()
+    battle_script_data = LazySectionData()
+    texture_data = LazySectionData()
+
     def __init__(self, game_data):
+        # Section data not parsed yet (analyse_loaded_data with lazy=True): section data name -> (section number,
+        # game_data, decompiler)
+        self._pending_analysis_dict = {}
         self.file_raw_data = bytearray()
         self.origin_file_name = ""
         self.origin_path = ""
         self.origin_file_checksum = ""
         self.subsection_ai_offset = {'init_code': 0, 'ennemy_turn': 0, 'counter_attack': 0, 'death': 0, 'unknown': 0}
-        self.section_raw_data = [bytearray()]
+        self.section_raw_data = SectionRawDataList([bytearray()])
         self.header_data = copy.deepcopy(AIData.SECTION_HEADER_DICT)
         self.bone_data = BoneSection()
         self.geometry_data = GeometrySection()
@@ -92,7 +171,7 @@ class MonsterAnalyser:
         header_size = 4 + nb_section * 4 + 4
         header = bytearray(header_size)
         header[0:4] = (nb_section - 1).to_bytes(4, 'little')
-        self.section_raw_data = [header] + [bytearray() for _ in range(nb_section - 1)]
+        self.section_raw_data = SectionRawDataList([header] + [bytearray() for _ in range(nb_section - 1)])
         self.header_data['section_pos'] = [0] * (nb_section + 1)
         # Nothing was ever freed - the (empty) animation is already fully expanded.
         self._animation_section_index = None
@@ -100,6 +179,7 @@ class MonsterAnalyser:
         return self
 
     def load_file_data(self, file:str, game_data:GameData):
+        self._pending_analysis_dict = {}
         self.subsection_ai_offset = {'init_code': 0, 'ennemy_turn': 0, 'counter_attack': 0, 'death': 0, 'unknown': 0}
         self.bone_data = BoneSection()
         self.geometry_data = GeometrySection()
@@ -109,77 +189,108 @@ class MonsterAnalyser:
         self.info_stat_data = copy.deepcopy(AIData.SECTION_INFO_STAT_DICT)
         self.battle_script_data = copy.deepcopy(AIData.SECTION_BATTLE_SCRIPT_DICT)
         self.texture_data = copy.deepcopy(AIData.SECTION_TEXTURE_DICT)
-        self.file_raw_data = bytearray()
-        with open(file, "rb") as f:
-            while el := f.read(1):
-                self.file_raw_data.extend(el)
+        self.file_raw_data = self.read_file(file)
         self.__analyze_header_section()
-        self.section_raw_data = [bytearray()] * self.header_data['nb_section']
+        self.section_raw_data = SectionRawDataList(bytearray() for _ in range(self.header_data['nb_section']))
         self.origin_file_name = os.path.basename(file)
         self.origin_path = file
         id_match = re.search(r'\d{3}', self.origin_file_name)
         self.id = int(id_match.group()) if id_match else 0
         # self.origin_file_checksum = get_checksum(file, algorithm='SHA256')
 
-    def analyse_loaded_data(self, game_data: GameData, decompiler: AIDecompiler=None):
+    @staticmethod
+    def read_file(file: str) -> bytearray:
+        """The whole file in one read, straight into the buffer (no mmap: the file stays free to be overwritten on save)"""
+        with open(file, "rb") as f:
+            file_raw_data = bytearray(os.fstat(f.fileno()).st_size)
+            nb_read = f.readinto(file_raw_data)
+        del file_raw_data[nb_read:]  # Only if the file shrank meanwhile
+        return file_raw_data
+
+    def _split_sections(self) -> SectionRawDataList:
+        """Each section as a view into file_raw_data, following the header section positions"""
+        nb = self.header_data['nb_section']
+        pos = self.header_data['section_pos']
+        file_view = memoryview(self.file_raw_data).toreadonly()
+        section_list = [file_view[pos[i]:pos[i + 1]] for i in range(nb - 1)]
+        # The last section always runs to the physical end of the file. header_data['file_size']
+        # is NOT a reliable end boundary here: it's read from a fixed offset right after the
+        # section-position table on the assumption that a real trailing size field lives there,
+        # but for at least WEAPON_NO_ANIM (reduced weapon, 5 real sections) that offset actually
+        # falls inside section 1's own payload, so the "size" is just whatever those bytes
+        # happen to decode to as a little-endian uint32 - e.g. 1 for d1w008.dat, which slices
+        # to an empty last section instead of its real 4652 bytes. For other entity types this
+        # garbage value happened to exceed the real file size, so Python's slice clamping masked
+        # the same bug (seq[start:huge_number] silently clamps to len(seq)) - it was never a
+        # real size field, just coincidentally harmless there. len(self.file_raw_data) is the
+        # one boundary that is always correct, for every entity type.
+        section_list.append(file_view[pos[nb - 1]:len(self.file_raw_data)])
+        return SectionRawDataList(section_list)
+
+    def analyse_loaded_data(self, game_data: GameData, decompiler: AIDecompiler=None, lazy=False):
+        """
+        Parse the sections of the loaded file
+        :param lazy: If True, each section is only parsed on the first access to its data (bone_data,
+        battle_script_data...), so a caller only reading the names and texts doesn't pay for the animation and the
+        geometry. A section never accessed is saved back as it was read. A garbage section raises GarbageFileError
+        on that first access instead of here.
+        """
+        self._pending_analysis_dict = {}
         try:
-            for i in range(0, self.header_data['nb_section'] - 1):
-                self.section_raw_data[i] = self.file_raw_data[self.header_data['section_pos'][i]: self.header_data['section_pos'][i + 1]]
-
-            # The last section always runs to the physical end of the file. header_data['file_size']
-            # is NOT a reliable end boundary here: it's read from a fixed offset right after the
-            # section-position table on the assumption that a real trailing size field lives there,
-            # but for at least WEAPON_NO_ANIM (reduced weapon, 5 real sections) that offset actually
-            # falls inside section 1's own payload, so the "size" is just whatever those bytes
-            # happen to decode to as a little-endian uint32 - e.g. 1 for d1w008.dat, which slices
-            # to an empty last section instead of its real 4652 bytes. For other entity types this
-            # garbage value happened to exceed the real file size, so Python's slice clamping masked
-            # the same bug (seq[start:huge_number] silently clamps to len(seq)) - it was never a
-            # real size field, just coincidentally harmless there. len(self.file_raw_data) is the
-            # one boundary that is always correct, for every entity type.
-            self.section_raw_data[self.header_data['nb_section'] - 1] = self.file_raw_data[
-                                                             self.header_data['section_pos'][self.header_data['nb_section'] - 1]:len(self.file_raw_data)]
-            if self.entity_type == EntityType.WEAPON_NO_ANIM:
-                self.__analyze_geometry_section(1)
-                self.__analyze_sequence_animation(2)
-            elif self.entity_type == EntityType.WEAPON:
-                self.__analyze_bone_section(1)
-                self.__analyze_geometry_section(2)
-                self.__analyze_animation_section(3)
-                self.__analyze_sequence_animation(4)
-            elif self.entity_type == EntityType.CHARACTER:
-                self.__analyze_bone_section(1)
-                self.__analyze_geometry_section(2)
-                self.__analyze_animation_section(3)
-            elif self.entity_type == EntityType.CHARACTER_NO_WEAPON:
-                self.__analyze_bone_section(1)
-                self.__analyze_geometry_section(2)
-                self.__analyze_animation_section(3)
-                # Section 4: dynamic texture, section 5: camera sequence (both kept raw,
-                # as for a character), section 6: the animation sequences a weapon would
-                # normally carry.
-                self.__analyze_sequence_animation(6)
-            elif self.entity_type == EntityType.MONSTER:
-                self.__analyze_bone_section(1)
-                self.__analyze_geometry_section(2)
-                self.__analyze_animation_section(3)
-                self.__analyze_section_texture_anim(4)
-                self.__analyze_sequence_animation(5)
-                self.__analyze_info_stat(game_data, 7)
-                self.analyze_battle_script_section(game_data, decompiler, 8)
-                self._analyze_texture_section(11)
-            elif self.entity_type == EntityType.MONSTER_NO_MODEL:
-                # No skeleton/geometry/animation/dynamic-texture/camera/seq_anim/sound/texture
-                # sections at all - just info_stat then AI, the same formats and byte sizes as
-                # a normal monster's sections 7 and 8.
-                self.__analyze_info_stat(game_data, 1)
-                self.analyze_battle_script_section(game_data, decompiler, 2)
-            else:
+            self.section_raw_data = self._split_sections()
+            if self.entity_type not in self.SECTION_DATA_BY_ENTITY:
                 print(f"Unexpected entity type: {self.entity_type}")
+                return
+            for section_number, section_data_name in self.SECTION_DATA_BY_ENTITY[self.entity_type].items():
+                if lazy:
+                    self._pending_analysis_dict[section_data_name] = (section_number, game_data, decompiler)
+                else:
+                    self.__analyze_section_data(section_data_name, section_number, game_data, decompiler)
+        except IndexError as e:
+            print(f"Garbage file {self.origin_file_name}")
+            raise GarbageFileError
+
+    def __analyze_section_data(self, section_data_name: str, section_number: int, game_data: GameData,
+                               decompiler: AIDecompiler = None):
+        if section_data_name == 'bone_data':
+            self.__analyze_bone_section(section_number)
+        elif section_data_name == 'geometry_data':
+            self.__analyze_geometry_section(section_number)
+        elif section_data_name == 'animation_data':
+            self.__analyze_animation_section(section_number)
+        elif section_data_name == 'dynamic_texture_data':
+            self.__analyze_section_texture_anim(section_number)
+        elif section_data_name == 'seq_animation_data':
+            self.__analyze_sequence_animation(section_number)
+        elif section_data_name == 'info_stat_data':
+            self.__analyze_info_stat(game_data, section_number)
+        elif section_data_name == 'battle_script_data':
+            self.analyze_battle_script_section(game_data, decompiler, section_number)
+        elif section_data_name == 'texture_data':
+            self._analyze_texture_section(section_number)
+
+    def _run_pending_analysis(self, section_data_name: str):
+        """Parse a section not parsed yet by a lazy analyse_loaded_data. No-op otherwise."""
+        pending_analysis = self.__dict__.get('_pending_analysis_dict', {}).pop(section_data_name, None)
+        if pending_analysis is None:
+            return
+        try:
+            self.__analyze_section_data(section_data_name, *pending_analysis)
         except IndexError as e:
             print(f"Garbage file {self.origin_file_name}")
             raise GarbageFileError
 
+    def is_section_data_parsed(self, section_data_name: str) -> bool:
+        """False while a lazy analyse_loaded_data didn't parse the section yet"""
+        return section_data_name not in self._pending_analysis_dict
+
+    def __write_pending_section(self, raw_data_to_write: bytearray, section_data_name: str, section_position: int) -> bool:
+        """Write a section never parsed as it was read, as there is nothing to re-encode"""
+        if self.is_section_data_parsed(section_data_name):
+            return False
+        raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
+        return True
+
     def restore_sections_from_snapshot(self, snapshot: bytes, section_numbers, game_data: GameData,
                                        decompiler: AIDecompiler = None):
         """Restore the given .dat sections to the state encoded in `snapshot` (a whole .dat byte
@@ -195,11 +306,7 @@ class MonsterAnalyser:
         self.file_raw_data = bytearray(snapshot)
         self.__analyze_header_section()          # refresh nb_section / section_pos / entity_type
         nb = self.header_data['nb_section']
-        pos = self.header_data['section_pos']
-        self.section_raw_data = [bytearray() for _ in range(nb)]
-        for i in range(nb - 1):
-            self.section_raw_data[i] = self.file_raw_data[pos[i]:pos[i + 1]]
-        self.section_raw_data[nb - 1] = self.file_raw_data[pos[nb - 1]:len(self.file_raw_data)]
+        self.section_raw_data = self._split_sections()
         for i in sorted(section_numbers):
             if 0 <= i < nb:
                 self.reanalyze_section(i, game_data, decompiler)
@@ -210,41 +317,17 @@ class MonsterAnalyser:
         section. Used by undo/redo to rebuild only the section a step changed instead of re-parsing
         the entire file (the animation section alone costs ~0.5 s). Sections kept raw (camera, sound)
         and the header need no parsed form, so they are a no-op here - updating section_raw_data is
-        enough and their widgets read it directly. Mirrors analyse_loaded_data exactly; keep in sync."""
-        et = self.entity_type
-        n = section_number
-        if et == EntityType.MONSTER:
-            if   n == 1:  self.__analyze_bone_section(1)
-            elif n == 2:  self.__analyze_geometry_section(2)
-            elif n == 3:  self.__analyze_animation_section(3)
-            elif n == 4:  self.__analyze_section_texture_anim(4)
-            elif n == 5:  self.__analyze_sequence_animation(5)
-            elif n == 7:  self.__analyze_info_stat(game_data, 7)
-            elif n == 8:  self.analyze_battle_script_section(game_data, decompiler, 8)
-            elif n == 11: self._analyze_texture_section(11)
-        elif et == EntityType.WEAPON:
-            if   n == 1:  self.__analyze_bone_section(1)
-            elif n == 2:  self.__analyze_geometry_section(2)
-            elif n == 3:  self.__analyze_animation_section(3)
-            elif n == 4:  self.__analyze_sequence_animation(4)
-        elif et == EntityType.CHARACTER:
-            if   n == 1:  self.__analyze_bone_section(1)
-            elif n == 2:  self.__analyze_geometry_section(2)
-            elif n == 3:  self.__analyze_animation_section(3)
-        elif et == EntityType.CHARACTER_NO_WEAPON:
-            if   n == 1:  self.__analyze_bone_section(1)
-            elif n == 2:  self.__analyze_geometry_section(2)
-            elif n == 3:  self.__analyze_animation_section(3)
-            elif n == 6:  self.__analyze_sequence_animation(6)
-        elif et == EntityType.WEAPON_NO_ANIM:
-            if   n == 1:  self.__analyze_geometry_section(1)
-            elif n == 2:  self.__analyze_sequence_animation(2)
-        elif et == EntityType.MONSTER_NO_MODEL:
-            if   n == 1:  self.__analyze_info_stat(game_data, 1)
-            elif n == 2:  self.analyze_battle_script_section(game_data, decompiler, 2)
+        enough and their widgets read it directly. Both read SECTION_DATA_BY_ENTITY."""
+        section_data_name = self.SECTION_DATA_BY_ENTITY.get(self.entity_type, {}).get(section_number)
+        if section_data_name is None:
+            return
+        self._pending_analysis_dict.pop(section_data_name, None)
+        self.__analyze_section_data(section_data_name, section_number, game_data, decompiler)
 
     def prepare_seq_animation(self, raw_data_to_write:bytearray, section_position:int=5):
-        # raw_data_to_write.extend(self.section_raw_data[section_position])
+        if self.__write_pending_section(raw_data_to_write, 'seq_animation_data', section_position):
+            return
+        # raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
         self.section_raw_data[section_position] = bytearray()
         nb_seq = len(self.seq_animation_data['seq_animation_data'])
         ## Now compute offset
@@ -276,9 +359,11 @@ class MonsterAnalyser:
         # sequence section shifts every following section and crashes the game in battle.
         while len(self.section_raw_data[section_position]) % 4 != 0:
             self.section_raw_data[section_position].extend([0x00])
-        raw_data_to_write.extend(self.section_raw_data[section_position])
+        raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
 
     def prepare_info(self, raw_data_to_write: bytearray, section_position:int, game_data:GameData):
+        if self.__write_pending_section(raw_data_to_write, 'info_stat_data', section_position):
+            return
         self.section_raw_data[section_position] = bytearray()
         for param_name, value in self.info_stat_data.items():
             property_elem = [x for ind, x in enumerate(AIData.SECTION_INFO_STAT_LIST_DATA) if x['name'] == param_name][0]
@@ -333,9 +418,11 @@ class MonsterAnalyser:
                 # self.file_raw_data[self.header_data['section_pos'][section_position] + property_elem['offset']:
                 #                    self.header_data['section_pos'][section_position] + property_elem['offset'] + property_elem['size']] = value_to_set
 
-        raw_data_to_write.extend(self.section_raw_data[section_position])
+        raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
 
     def prepare_ai(self, raw_data_to_write: bytearray, section_position : int=8):
+        if self.__write_pending_section(raw_data_to_write, 'battle_script_data', section_position):
+            return
         # Now creating the section 8
         # 3 subsection in section 8: The offset subsection (header), the AI and the texts
         self.section_raw_data[section_position] = bytearray()
@@ -408,9 +495,11 @@ class MonsterAnalyser:
         self.section_raw_data[section_position].extend(raw_text_section)
 
         # And now we can add section 8 !
-        raw_data_to_write.extend(self.section_raw_data[section_position])
+        raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
 
     def prepare_texture(self, raw_data_to_write: bytearray, section_position: int = 11):
+        if self.__write_pending_section(raw_data_to_write, 'texture_data', section_position):
+            return
         self.section_raw_data[section_position] = bytearray()
         nb_texture = len(self.texture_data['texture_data'])
         ## Now compute offset
@@ -431,7 +520,7 @@ class MonsterAnalyser:
         for tex in self.texture_data['texture_data']:
             self.section_raw_data[section_position].extend(tex['data'])
 
-        raw_data_to_write.extend(self.section_raw_data[section_position])
+        raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
 
     def get_bytes(self, game_data: GameData) -> bytearray:
         """Serialize the whole enemy to its .dat byte stream - exactly what gets written to disk.
@@ -449,7 +538,7 @@ class MonsterAnalyser:
         # Section 0: Header (fix size, will be modified later) - the only part truly common
         # to every entity type.
         section_position = 0
-        raw_data_to_write.extend(self.section_raw_data[section_position])
+        raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
 
         if self.entity_type == EntityType.WEAPON_NO_ANIM:
             # Reduced weapon (Zell/Kiros unarmed, 5 real sections): section 1 is geometry, not
@@ -459,13 +548,13 @@ class MonsterAnalyser:
             # falling into the shared preamble + per-type elif chain.
             # Section 1: Geometry (untouched for the moment, like every other entity type)
             section_position = 1
-            raw_data_to_write.extend(self.section_raw_data[section_position])
+            raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
             # Section 2: Seq anim
             section_position = 2
             self.prepare_seq_animation(raw_data_to_write, section_position)
             # Section 3: Sounds, 4: Sound sample bank, 5: Textures (unchanged atm)
             for section_position in (3, 4, 5):
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
         elif self.entity_type == EntityType.MONSTER_NO_MODEL:
             # No-model monster (c0m127.dat / Ultimecia-Apocalypse): no skeleton/geometry/
             # animation at all - the shared preamble below does not apply. Just info_stat
@@ -477,73 +566,76 @@ class MonsterAnalyser:
         else:
             # Section 1: Skeleton/Bones
             section_position = 1
-            bone_data = self.bone_data.to_binary()
-            raw_data_to_write.extend(bone_data)
-            self.section_raw_data[section_position] = bone_data
+            if not self.__write_pending_section(raw_data_to_write, 'bone_data', section_position):
+                bone_data = self.bone_data.to_binary()
+                raw_data_to_write.extend(bone_data)
+                self.section_raw_data[section_position] = bone_data
             # Section 2: Geometry (untouched for the moment)
             section_position = 2
-            raw_data_to_write.extend(self.section_raw_data[section_position])
+            raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
             # Section 3: Animation
             section_position = 3
-            animation_data = self.animation_data.to_binary()
-            raw_data_to_write.extend(animation_data)
-            self.section_raw_data[section_position] = animation_data
-            #raw_data_to_write.extend(self.section_raw_data[section_position])
+            if not self.__write_pending_section(raw_data_to_write, 'animation_data', section_position):
+                animation_data = self.animation_data.to_binary()
+                raw_data_to_write.extend(animation_data)
+                self.section_raw_data[section_position] = animation_data
+            #raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
 
             # Now changing depending on which file is loaded
             if self.entity_type == EntityType.CHARACTER:
                 ## Section 4 unknown
                 section_position = 4
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 5 unknown
                 section_position = 5
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 6 unknown
                 section_position = 6
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 7 unknown
                 section_position = 7
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
             elif self.entity_type == EntityType.CHARACTER_NO_WEAPON:
                 ## Section 4: Dynamic texture, Section 5: Camera sequence (unchanged atm)
                 for section_position in (4, 5):
-                    raw_data_to_write.extend(self.section_raw_data[section_position])
+                    raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 6: Seq anim
                 section_position = 6
                 self.prepare_seq_animation(raw_data_to_write, section_position)
                 ## Section 7: Sounds, 8: Sound bank, 9: Textures, 10: Extra animation
                 ## (unchanged atm)
                 for section_position in (7, 8, 9, 10):
-                    raw_data_to_write.extend(self.section_raw_data[section_position])
+                    raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
             elif self.entity_type == EntityType.WEAPON:
                 ## Section 4 : Seq anim
                 section_position = 4
                 self.prepare_seq_animation(raw_data_to_write, section_position)
                 ## Section 5 unknown
                 section_position = 5
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 6 unknown
                 section_position = 6
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 7 unknown
                 section_position = 7
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 ## Section 8 unknown
                 section_position = 8
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
             elif self.entity_type == EntityType.MONSTER:
                 # Section 4:Texture animation (unchanged atm)
                 section_position = 4
-                #raw_data_to_write.extend(self.section_raw_data[section_position])
-                dynamic_texture = self.dynamic_texture_data.to_binary()
-                raw_data_to_write.extend(dynamic_texture)
-                self.section_raw_data[section_position] = dynamic_texture
+                #raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
+                if not self.__write_pending_section(raw_data_to_write, 'dynamic_texture_data', section_position):
+                    dynamic_texture = self.dynamic_texture_data.to_binary()
+                    raw_data_to_write.extend(dynamic_texture)
+                    self.section_raw_data[section_position] = dynamic_texture
                 # Section 5: Seq anim
                 section_position = 5
                 self.prepare_seq_animation(raw_data_to_write, section_position)
                 # Section 6: Camera sequence (unchanged atm)
                 section_position = 6
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 # Section 7: Monster info
                 section_position = 7
                 self.prepare_info(raw_data_to_write, section_position, game_data)
@@ -552,10 +644,10 @@ class MonsterAnalyser:
                 self.prepare_ai(raw_data_to_write, section_position)
                 # Section 9: Sound (unchanged atm)
                 section_position = 9
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 # Section 10: Sound/Unk (unchanged atm)
                 section_position = 10
-                raw_data_to_write.extend(self.section_raw_data[section_position])
+                raw_data_to_write.extend(self.section_raw_data.get_view(section_position))
                 # Section 11: Texture
                 section_position = 11
                 self.prepare_texture(raw_data_to_write, section_position)
@@ -567,7 +659,7 @@ class MonsterAnalyser:
         for i in range(0, self.header_data['nb_section']):
             start = header_pos_data['offset'] + i * header_pos_data['size']
             end = start + header_pos_data['size']
-            file_size += len(self.section_raw_data[i])
+            file_size += len(self.section_raw_data.get_view(i))
             self.section_raw_data[0][start:end] = self.__get_byte_from_int_from_game_data(file_size, header_pos_data)
 
         header_file_data = AIData.SECTION_HEADER_FILE_SIZE
@@ -646,22 +738,22 @@ class MonsterAnalyser:
             AIData.SECTION_HEADER_FILE_SIZE['byteorder'])
 
     def __analyze_bone_section(self, section_number:int=1):
-        if self.section_raw_data[section_number]:
-            self.bone_data.analyze(self.section_raw_data[section_number])
+        if self.section_raw_data.get_view(section_number):  # Only read, so not copied
+            self.bone_data.analyze(self.section_raw_data.get_view(section_number))
             #print(self.bone_data)
 
 
 
     def __analyze_geometry_section(self, section_number:int=2):
         #print("__analyze_geometry_section")
-        if self.section_raw_data[section_number]:
-            self.geometry_data.analyze(self.section_raw_data[section_number])
+        if self.section_raw_data.get_view(section_number):  # Only read, so not copied
+            self.geometry_data.analyze(self.section_raw_data.get_view(section_number))
 
     def __analyze_animation_section(self, section_number = 3):
         #print("__analyze_animation_section")
         self._animation_section_index = section_number   # remembered for re-expansion after a free
-        if self.section_raw_data[section_number]:
-            self.animation_data.analyze(self.section_raw_data[section_number], self.bone_data)
+        if self.section_raw_data.get_view(section_number):  # Only read, so not copied
+            self.animation_data.analyze(self.section_raw_data.get_view(section_number), self.bone_data)
             #print(self.animation_data)
 
     def free_animation(self):
@@ -682,9 +774,9 @@ class MonsterAnalyser:
         if self._animation_expanded:
             return
         idx = self._animation_section_index
-        if idx is not None and idx < len(self.section_raw_data) and self.section_raw_data[idx]:
-            self.animation_data.analyze(self.section_raw_data[idx], self.bone_data)
-            self.animation_data.matrices_built = True   # analyze()'s add_frame builds them
+        if idx is not None and idx < len(self.section_raw_data) and self.section_raw_data.get_view(idx):
+            self.animation_data.analyze(self.section_raw_data.get_view(idx), self.bone_data)
+            self.animation_data.matrices_built = True   # Built with the frames, on first access
         self._animation_expanded = True
 
         #self.test_full_animation_section_roundtrip(game_data)
@@ -823,8 +915,8 @@ class MonsterAnalyser:
         return all_matched
 
     def __analyze_section_texture_anim(self, section_number:int = 4):
-        if self.section_raw_data[section_number]:
-            self.dynamic_texture_data.analyze(self.section_raw_data[section_number])
+        if self.section_raw_data.get_view(section_number):  # Only read, so not copied
+            self.dynamic_texture_data.analyze(self.section_raw_data.get_view(section_number))
             #print(self.dynamic_texture_data)
 
     def __analyze_section_6(self, game_data: GameData):
@@ -874,7 +966,8 @@ class MonsterAnalyser:
         # An empty/missing section still has a position in the header, but it points at the
         # start of the following section. Reading the count from there would fabricate phantom
         # sequences (from the neighbouring section's data), so keep the default empty state.
-        if not self.section_raw_data[section_number]:
+        section = self.section_raw_data.get_view(section_number)  # Only read, so not copied
+        if not section:
             self.seq_animation_data = copy.deepcopy(AIData.SECTION_MODEL_SEQ_ANIM_DICT)
             return
         self.seq_animation_data['nb_anim_seq'] = self.__get_int_value_from_info(AIData.SECTION_MODEL_SEQ_ANIM_NB_SEQ, section_number)
@@ -883,7 +976,7 @@ class MonsterAnalyser:
         start_offset = AIData.SECTION_MODEL_SEQ_ANIM_NB_SEQ['size']
         for index_offset in range(self.seq_animation_data['nb_anim_seq']):
             list_seq_anim_offset.append(
-                int.from_bytes(self.section_raw_data[section_number][start_offset + index_offset * offset_size:start_offset + (index_offset + 1) * offset_size],
+                int.from_bytes(section[start_offset + index_offset * offset_size:start_offset + (index_offset + 1) * offset_size],
                                byteorder="little"))
         self.seq_animation_data['seq_anim_offset'] = list_seq_anim_offset
         animation_seq_list = []
@@ -897,14 +990,14 @@ class MonsterAnalyser:
                 if next_offset:
                     end_anim = min(next_offset)
                 else:
-                    end_anim = len(self.section_raw_data[section_number])
+                    end_anim = len(section)
             # Insert the data to have a continuous byte structure
 
             self.insert_sorted_with_zeros(offset_list_done, anim_offset)
             if anim_offset == 0:
-                animation_seq_list.append({"id": index+1, "data":self.section_raw_data[section_number][start_anim: end_anim]})
+                animation_seq_list.append({"id": index+1, "data": bytearray(section[start_anim: end_anim])})
             else:
-                animation_seq_list.insert(offset_list_done.index(anim_offset), {"id": index+1, "data":self.section_raw_data[section_number][start_anim: end_anim]})
+                animation_seq_list.insert(offset_list_done.index(anim_offset), {"id": index+1, "data": bytearray(section[start_anim: end_anim])})
 
         self.seq_animation_data['seq_animation_data'] = animation_seq_list
 
@@ -1130,7 +1223,8 @@ class MonsterAnalyser:
         del self.battle_script_data['ai_data'][code_section_id]["command"][index_removal]
 
     def _analyze_texture_section(self, section_number:int=11):
-        if not self.section_raw_data[section_number]:
+        section = self.section_raw_data.get_view(section_number)  # Only read, so not copied
+        if not section:
             self.texture_data = copy.deepcopy(AIData.SECTION_TEXTURE_DICT)
             return
         self.texture_data['nb_texture'] = self.__get_int_value_from_info(AIData.SECTION_TEXTURE_NB, section_number)
@@ -1139,12 +1233,12 @@ class MonsterAnalyser:
         start_offset = AIData.SECTION_TEXTURE_NB['size']
         for index_offset in range(self.texture_data['nb_texture']):
             list_texture_offset.append(
-                int.from_bytes(self.section_raw_data[section_number][start_offset + index_offset * offset_size:start_offset + (index_offset + 1) * offset_size],
+                int.from_bytes(section[start_offset + index_offset * offset_size:start_offset + (index_offset + 1) * offset_size],
                                byteorder="little"))
         self.texture_data['tim_offset'] = list_texture_offset
 
 
-        self.texture_data['eof_texture'] = int.from_bytes(self.section_raw_data[section_number][start_offset + len(list_texture_offset) * offset_size:start_offset + len(list_texture_offset) * offset_size+AIData.SECTION_TEXTURE_END_OF_FILE['size']], AIData.SECTION_TEXTURE_END_OF_FILE['byteorder'])
+        self.texture_data['eof_texture'] = int.from_bytes(section[start_offset + len(list_texture_offset) * offset_size:start_offset + len(list_texture_offset) * offset_size+AIData.SECTION_TEXTURE_END_OF_FILE['size']], AIData.SECTION_TEXTURE_END_OF_FILE['byteorder'])
         tim_data_list = []
         offset_list_done = []
         for index, texture_offset in enumerate(list_texture_offset):
@@ -1156,15 +1250,14 @@ class MonsterAnalyser:
                 if next_offset:
                     end_tim = min(next_offset)
                 else:
-                    end_tim = len(self.section_raw_data[section_number])
+                    end_tim = len(section)
             # Insert the data to have a continuous byte structure
 
             self.insert_sorted_with_zeros(offset_list_done, texture_offset)
             if texture_offset == 0:
-                tim_data_list.append({"id": index, "data": self.section_raw_data[section_number][start_tim: end_tim]})
+                tim_data_list.append({"id": index, "data": bytearray(section[start_tim: end_tim])})
             else:
                 tim_data_list.insert(offset_list_done.index(texture_offset),
-                                          {"id": index, "data": self.section_raw_data[section_number][start_tim: end_tim]})
+                                          {"id": index, "data": bytearray(section[start_tim: end_tim])})
 
         self.texture_data['texture_data'] = tim_data_list
-
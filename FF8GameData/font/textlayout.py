@@ -37,6 +37,7 @@ class FontMetrics:
 
     def __init__(self, widths=None):
         self._widths = widths  # list[int] indexed by glyph (code - 0x20), or None
+        self._width_table = [self._compute_glyph_width(code) for code in range(256)]  # Indexed by code byte
 
     @property
     def exact(self):
@@ -64,6 +65,11 @@ class FontMetrics:
 
     def glyph_width(self, code):
         """Advance in pixels of the printable glyph with the given FF8 code byte."""
+        if 0 <= code < 256:
+            return self._width_table[code]
+        return self._compute_glyph_width(code)
+
+    def _compute_glyph_width(self, code):
         glyph = code - 0x20
         if glyph < 0:
             return 0
@@ -143,7 +149,12 @@ def _glyph_char(game_data, code):
 def layout_text(text_str, game_data, metrics: FontMetrics,
                 line_height=MENU_TEXT_LINE_HEIGHT) -> TextLayout:
     """Lay out a decoded FF8 string exactly as the engine would, pen starting at (0, 0)."""
-    text_hex = bytes(game_data.translate_str_to_hex(text_str))
+    return layout_text_hex(bytes(game_data.translate_str_to_hex(text_str)), game_data, metrics, line_height)
+
+
+def layout_text_hex(text_hex, game_data, metrics: FontMetrics,
+                    line_height=MENU_TEXT_LINE_HEIGHT) -> TextLayout:
+    """Same as layout_text, for a string already encoded as FF8 code bytes."""
     glyphs = []
     stops = []
     line_widths = []
@@ -181,3 +192,41 @@ def layout_text(text_str, game_data, metrics: FontMetrics,
             i += 1
     line_widths.append(x)  # The final (or only) line
     return TextLayout(glyphs, stops, line_widths, line_height)
+
+
+class TextLayoutCache:
+    """Layouts of many strings with the same font and line height (a whole translation CSV).
+
+    The layout only depends on the encoded bytes, so it is memoized by them: the
+    strings repeated across a CSV (names, menu entries) are walked once. The
+    returned TextLayout is shared between the calls and must not be modified."""
+
+    def __init__(self, game_data, metrics: FontMetrics, line_height=MENU_TEXT_LINE_HEIGHT):
+        self._game_data = game_data
+        self._metrics = metrics
+        self._line_height = line_height
+        self._text_hex_by_str = {}
+        self._layout_by_hex = {}
+
+    def encode(self, text_str):
+        """The FF8 code bytes of a string, encoded once per distinct string (raises ValueError as the encoder)."""
+        text_hex = self._text_hex_by_str.get(text_str)
+        if text_hex is None:
+            text_hex = bytes(self._game_data.translate_str_to_hex(text_str))
+            self._text_hex_by_str[text_str] = text_hex
+        return text_hex
+
+    def layout_hex(self, text_hex) -> TextLayout:
+        text_hex = bytes(text_hex)
+        layout = self._layout_by_hex.get(text_hex)
+        if layout is None:
+            layout = layout_text_hex(text_hex, self._game_data, self._metrics, self._line_height)
+            self._layout_by_hex[text_hex] = layout
+        return layout
+
+    def layout(self, text_str) -> TextLayout:
+        return self.layout_hex(self.encode(text_str))
+
+    def __len__(self):
+        """Number of distinct layouts computed"""
+        return len(self._layout_by_hex)
@@ -0,0 +1,109 @@
+"""
+Index of the entry paths of an archive and its nested archives (FF8GameData/fs/fsmanager.py).
+Built once during the analysis, it answers the lookups by exact path, by name (last element of the FL path) or by
+glob pattern in a folder without going through every FL path of every nested archive.
+"""
+from fnmatch import fnmatchcase
+
+PATH_SEPARATOR = "\\"
+GLOB_CHARS = "*?["
+
+
+class ArchiveIndex:
+    """
+    Each entry is a tuple (FL path, archive, index of the entry in the archive).
+    Besides the exact path and the name, the entries are indexed by extension and by folder element, so a search
+    like "*.msd" in "mapdata\\bc" only checks the entries being both in a "mapdata" and a "bc" folder and having
+    the "msd" extension.
+    """
+
+    def __init__(self):
+        self._entry_list = []
+        self._by_path = {}
+        self._by_name = {}
+        self._by_extension = {}
+        self._by_folder = {}
+
+    def __str__(self):
+        return f"ArchiveIndex(nb_entry:{len(self._entry_list)})"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __len__(self):
+        return len(self._entry_list)
+
+    def add(self, path: str, archive, index: int):
+        """
+        :param path: The FL path of the entry
+        :param archive: The archive containing the entry
+        :param index: The index of the entry in this archive
+        """
+        entry_id = len(self._entry_list)
+        self._entry_list.append((path, archive, index))
+        path_element_list = path.split(PATH_SEPARATOR)
+        name = path_element_list[-1]
+        self._by_path.setdefault(path, []).append(entry_id)
+        self._by_name.setdefault(name, []).append(entry_id)
+        if '.' in name:
+            self._by_extension.setdefault(name.rsplit('.', 1)[-1], []).append(entry_id)
+        for folder in set(path_element_list[:-1]):
+            self._by_folder.setdefault(folder, []).append(entry_id)
+
+    def extend(self, other: 'ArchiveIndex'):
+        """Add all the entries of another index (the one of a nested archive)"""
+        for entry in other._entry_list:
+            self.add(*entry)
+
+    def find_path(self, path: str) -> list[tuple]:
+        """
+        :param path: The exact FL path
+        :return: The entries with this path (more than one only if several nested archives have it)
+        """
+        return [self._entry_list[entry_id] for entry_id in self._by_path.get(path, [])]
+
+    def find_name(self, name: str) -> list[tuple]:
+        """
+        :param name: The name of the entry (last element of the FL path)
+        :return: The entries with this name, in archive order
+        """
+        return [self._entry_list[entry_id] for entry_id in self._by_name.get(name, [])]
+
+    def find(self, pattern: str = "*", folder: str | None = None) -> list[tuple]:
+        """
+        Search the entries by name pattern, optionally in a folder
+        :param pattern: Glob pattern (fnmatch) on the name of the entry, like "*.msd" or "chara.one"
+        :param folder: Folders (separated by "\\") the entry must be in, at any depth, like "mapdata\\bc"
+        :return: The entries found, in archive order
+        """
+        candidate_list = []
+        if not any(char in pattern for char in GLOB_CHARS):
+            candidate_list.append(self._by_name.get(pattern, []))
+        elif pattern.startswith("*.") and not any(char in pattern[2:] for char in GLOB_CHARS + "."):
+            candidate_list.append(self._by_extension.get(pattern[2:], []))
+        folder_element_list = [element for element in folder.split(PATH_SEPARATOR) if element] if folder else []
+        for element in folder_element_list:
+            candidate_list.append(self._by_folder.get(element, []))
+        if candidate_list:  # Start from the smallest list, the others only filtering it
+            candidate_list.sort(key=len)
+            other_set_list = [set(candidate) for candidate in candidate_list[1:]]
+            entry_id_list = [entry_id for entry_id in candidate_list[0]
+                             if all(entry_id in other_set for other_set in other_set_list)]
+        else:
+            entry_id_list = range(len(self._entry_list))
+        entry_list = []
+        for entry_id in entry_id_list:
+            path_element_list = self._entry_list[entry_id][0].split(PATH_SEPARATOR)
+            if not fnmatchcase(path_element_list[-1], pattern):
+                continue
+            if folder_element_list and not self._is_in_folder(path_element_list[:-1], folder_element_list):
+                continue
+            entry_list.append(self._entry_list[entry_id])
+        return entry_list
+
+    @staticmethod
+    def _is_in_folder(path_folder_list: list[str], folder_element_list: list[str]) -> bool:
+        """Check the folder elements follow each other in the path"""
+        nb_element = len(folder_element_list)
+        return any(path_folder_list[i:i + nb_element] == folder_element_list
+                   for i in range(len(path_folder_list) - nb_element + 1))
@@ -0,0 +1,118 @@
+"""
+Persistent on-disk cache of decompressed archive entries (FF8GameData/fs/fsmanager.py).
+The vanilla archives never change, so decoding the same field.fs/world.fs/battle.fs entries on every run is wasted
+time. An entry is addressed by a key (archive path, size, mtime, entry offset), its file in the cache folder being
+named by the hash of that key: a modified archive gets new keys, and its old entries are evicted in time.
+The cache size is capped, the least recently used entries being removed first.
+"""
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
+
+class EntryCache:
+    DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+    FILE_EXTENSION = ".bin"
+
+    def __init__(self, folder_path: str, max_size: int = DEFAULT_MAX_SIZE):
+        """
+        :param folder_path: The folder holding the cached entries, created if needed. Can be shared between runs.
+        :param max_size: The maximum total size in bytes of the cached entries
+        """
+        self._folder_path = folder_path
+        self._max_size = max_size
+        self._file_size = OrderedDict()  # File name -> size, most recently used last
+        self._total_size = 0
+        os.makedirs(folder_path, exist_ok=True)
+        self._scan_folder()
+
+    def __str__(self):
+        return f"EntryCache(folder:{self._folder_path}, nb_entry:{len(self._file_size)}, size:{self._total_size}/{self._max_size})"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def _scan_folder(self):
+        """Rebuild the LRU order of a previous run from the modification time of the files, updated on each hit"""
+        entry_list = []
+        for entry in os.scandir(self._folder_path):
+            if entry.is_file() and entry.name.endswith(self.FILE_EXTENSION):
+                stat = entry.stat()
+                entry_list.append((stat.st_mtime_ns, entry.name, stat.st_size))
+        for _, file_name, size in sorted(entry_list):
+            self._file_size[file_name] = size
+            self._total_size += size
+
+    @staticmethod
+    def make_archive_key(fs_path: str) -> tuple:
+        """
+        Give the part of the key identifying an archive file, changing as soon as the file is modified
+        :param fs_path: The path of the FS file
+        :return: The key (absolute path, size, mtime)
+        """
+        stat = os.stat(fs_path)
+        return os.path.abspath(fs_path), stat.st_size, stat.st_mtime_ns
+
+    def _get_file_name(self, key: tuple) -> str:
+        return hashlib.sha256(repr(key).encode("utf8")).hexdigest() + self.FILE_EXTENSION
+
+    def get_size(self) -> int:
+        return self._total_size
+
+    def get(self, key: tuple) -> bytes | None:
+        """
+        :param key: The key of the entry, made of the archive key and the entry offset
+        :return: The decoded entry, None if not in the cache
+        """
+        file_name = self._get_file_name(key)
+        if file_name not in self._file_size:
+            return None
+        file_path = os.path.join(self._folder_path, file_name)
+        try:
+            with open(file_path, "rb") as file:
+                data = file.read()
+            os.utime(file_path)  # The mtime keeps the LRU order for the next run
+        except FileNotFoundError:  # Removed by another process sharing the folder
+            self._total_size -= self._file_size.pop(file_name)
+            return None
+        self._file_size.move_to_end(file_name)
+        return data
+
+    def put(self, key: tuple, data: bytes):
+        """
+        Store a decoded entry, then remove the least recently used ones if the cache is too big
+        An entry bigger than the cache itself is not stored.
+        :param key: The key of the entry, made of the archive key and the entry offset
+        :param data: The decoded entry
+        """
+        if len(data) > self._max_size:
+            return
+        file_name = self._get_file_name(key)
+        # Written aside then renamed, so a reader never sees a partial entry
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self._folder_path, suffix=".tmp")
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, os.path.join(self._folder_path, file_name))
+        self._total_size += len(data) - self._file_size.pop(file_name, 0)
+        self._file_size[file_name] = len(data)
+        self._evict()
+
+    def _evict(self):
+        while self._total_size > self._max_size and self._file_size:
+            file_name, size = self._file_size.popitem(last=False)
+            self._total_size -= size
+            try:
+                os.remove(os.path.join(self._folder_path, file_name))
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        """Remove every cached entry"""
+        for file_name in self._file_size:
+            try:
+                os.remove(os.path.join(self._folder_path, file_name))
+            except FileNotFoundError:
+                pass
+        self._file_size.clear()
+        self._total_size = 0
@@ -1,13 +1,21 @@
 import glob
 import inspect
+import mmap
 import os
 import pathlib
+import sys
 import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Generator
 
-from fs.lzs import Lzs
+from FF8GameData.fs import lzs
+from FF8GameData.fs.archiveindex import ArchiveIndex
+from FF8GameData.fs.entrycache import EntryCache
+from FF8GameData.fs.lzs import Lzs, LzsLevel
 
 
 class FsFileType(Enum):
@@ -27,6 +35,53 @@ class FiSingleData:
     compression_used: bool
 
 
+def _decode_chunk(job_list: list[tuple[bytes, int]]) -> list[bytes]:
+    """Worker of the parallel analysis: decode a chunk of (packed data, uncompressed size)"""
+    return [bytes(lzs.decode(packed_data, length_unpack_file)) for packed_data, length_unpack_file in job_list]
+
+
+def _split_by_packed_length(job_list: list, nb_chunk: int) -> list[list]:
+    """
+    Split the jobs, in order, into chunks of about the same total compressed length
+    :param job_list: List of (packed data, uncompressed size)
+    :param nb_chunk: Number of chunks wanted
+    :return: The list of chunks
+    """
+    chunk_target = sum(len(packed_data) for packed_data, _ in job_list) / max(nb_chunk, 1)
+    chunk_list = [[]]
+    chunk_length = 0
+    for job in job_list:
+        if chunk_length >= chunk_target and chunk_list[-1]:
+            chunk_list.append([])
+            chunk_length = 0
+        chunk_list[-1].append(job)
+        chunk_length += len(job[0])
+    return [chunk for chunk in chunk_list if chunk]
+
+
+class _LazyFsDataList(Sequence):
+    """
+    Read-only list view over the entries of a lazily analysed archive.
+    Indexing it decompresses the entry through Archive.get_entry_data, so code written for the list returned by
+    get_fs_data_analysed works unchanged in both modes.
+    """
+
+    def __init__(self, archive: 'Archive'):
+        self._archive = archive
+
+    def __len__(self):
+        return self._archive.get_nb_file()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._archive.get_entry_data(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Entry index out of range: {index}")
+        return self._archive.get_entry_data(index)
+
+
 class Archive:
     """
     An archive is a composition of 3 files: FS, FI and FL.
@@ -43,14 +98,31 @@ class Archive:
     To limit the impact, this class create a generator.
     The advantage of a generator is to load only what is necessary, but it will be done only when needed.
     The disadvantage is that if you decide to read it all, it will not be done in advance.
+
+    When only a few entries are needed (some chara.one or .msd out of field.fs), analyse with lazy=True instead:
+    only the FI and FL are parsed into an index, and an entry is decompressed the first time it is asked for with
+    get_entry_data. The last cache_size decoded entries are kept (least recently used are dropped first).
+
+    To keep the memory low with the big archives (field.fs), load with use_mmap=True: the FS is mapped instead of read,
+    the uncompressed entries are memoryview slices of the mapped file, and the nested archives work on the slice of
+    their parent instead of a copy. Only the decompressed entries take memory.
+
+    Decompression is pure Python and CPU-bound, so for a full analysis use workers to spread it over a process pool.
+    When the same archives are read on every run, set_disk_cache keeps the decoded entries on disk between runs.
+
+    To go through every entry once (like extracting a full archive), iter_entries and extract_to_folder don't analyse
+    nor keep anything: one entry is decompressed at a time, and a nested archive only lives while it is walked.
     """
     FILE_NAME_STR_LIST = ("main", "menu", "world", "field", "magic", "battle")
     FILE_NAME_LIST = (FsFileType.MAIN, FsFileType.MENU, FsFileType.WORLD, FsFileType.FIELD, FsFileType.MAGIC, FsFileType.BATTLE)
     OFFSET_SIZE = 4
+    DEFAULT_CACHE_SIZE = 64
+    EXTRACT_BUFFER_SIZE = 1024 * 1024
 
-    def __init__(self, fs_path: str, fi_path: str, fl_path: str):
+    def __init__(self, fs_path: str, fi_path: str, fl_path: str, cache_size: int = DEFAULT_CACHE_SIZE):
         """
         The different path contains the name of the file
+        :param cache_size: Number of decoded entries kept in memory when the archive is analysed lazily
         """
         # Raw data
         self._fs_path = fs_path
@@ -59,11 +131,12 @@ class Archive:
         self._fs_data = bytearray()
         self._fi_data = bytearray()
         self._fl_data = []
+        self._fs_mmap = None
         self.lzs = Lzs()
 
         # Data analysed now
         self.name = pathlib.Path(fs_path).name.replace(".fs", "")
-        print(f"Creating archive for {self.name}")
+        print(f"Creating archive for {self.name}", file=sys.stderr)
         if self.name not in self.FILE_NAME_STR_LIST:
             # print(f"Type unknown, probably from nested archive: {self.name}")
             self.type = FsFileType.UNKNOWN
@@ -75,8 +148,15 @@ class Archive:
         self._fs_data_list = []
         self._fi_data_list = []
         self._archive_list = [] # For nested archive
+        self._index = ArchiveIndex()  # Paths of this archive and its nested ones
         self._nb_file = 0
         self._fs_file_size = 0
+        self._lazy = False
+        self._cache_size = cache_size
+        self._entry_cache = OrderedDict()  # Index -> decoded entry, most recently used last
+        self._disk_cache = None
+        self._archive_key = None  # Identify the archive in the disk cache
+        self._source_entry_dict = {}  # Nested archive: path in the parent -> data, of its FS, FI and FL
 
     def __str__(self):
         return f"Archive(name:{self.name}, loaded:{self.is_loaded()}, analysed:{self.is_analysed()})"
@@ -100,35 +180,83 @@ class Archive:
         """
         return cls(os.path.join(folder_path, name + ".fs"), os.path.join(folder_path, name + ".fi"), os.path.join(folder_path, name + ".fl"))
 
-    def load_data(self):
+    def load_data(self, use_mmap=False):
         """
         Read all data in memory
         No error management if the file path are invalid
+        :param use_mmap: If True, the FS is memory-mapped instead of read, and its entries are given as memoryview slices
         """
         with open(self._fs_path, "rb") as file:
-            self._fs_data.extend(file.read())
+            if use_mmap and os.fstat(file.fileno()).st_size > 0:  # An empty file can't be mapped
+                self._fs_mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._fs_data = memoryview(self._fs_mmap)
+            else:
+                self._fs_data.extend(file.read())
         with open(self._fi_path, "rb") as file:
             self._fi_data.extend(file.read())
         with open(self._fl_path, "r", encoding="utf8") as file:
             self._fl_data = file.read().splitlines()
 
-    def load_data_from_bytes(self, fs_data: bytearray, fi_data: bytearray, fl_data: bytearray):
+    def load_data_from_bytes(self, fs_data: bytearray | memoryview, fi_data: bytearray, fl_data: bytearray):
+        """
+        Use data already in memory, like a nested archive inside its parent
+        A memoryview FS (slice of a mapped parent) is kept as is, without copy
+        """
         self._fs_data = fs_data
         self._fi_data = bytes(fi_data)
         self._fl_data = bytes(fl_data).decode(encoding="utf8").splitlines()
+        self._source_entry_dict = {self._fs_path: fs_data, self._fi_path: self._fi_data, self._fl_path: bytes(fl_data)}
 
     def unload_data(self):
-        """Removing the data from memory"""
+        """
+        Removing the data from memory
+        A mapped FS is unmapped once the entries given as memoryview are not used anymore
+        """
         self._fs_data = bytearray()
+        self._fs_mmap = None
         self._fi_data = bytearray()
         self._fl_data = bytearray()
+        self._entry_cache.clear()
 
-    def analyse_data(self, nested=False):
+    def release_mapping(self):
         """
-        Analysing the data already loaded
+        Unmap the FS now, instead of once the entries given as memoryview are not used anymore: Windows can't replace
+        a mapped file. The archive is unloaded, with everything analysed from it.
+        Raises BufferError if some entries given as memoryview are still used.
+        """
+        if self._fs_mmap is None:
+            return
+        fs_mmap = self._fs_mmap
+        fs_view = self._fs_data
+        self.unload_data()
+        self._fs_data_list = []
+        self._archive_list = []
+        self._index = ArchiveIndex()
+        fs_view.release()
+        try:
+            fs_mmap.close()
+        except BufferError:
+            raise BufferError(f"Can't unmap {self._fs_path}, some of its entries are still used") from None
+
+    def is_mapped_file(self, path: str) -> bool:
+        """True if the FS is memory-mapped from the file at path"""
+        return (self._fs_mmap is not None and os.path.exists(path) and os.path.exists(self._fs_path)
+                and os.path.samefile(path, self._fs_path))
+
+    def is_lazy(self):
+        return self._lazy
+
+    def is_mapped(self):
+        """True if the FS data is a view (memory-mapped file, or slice of a mapped parent archive)"""
+        return isinstance(self._fs_data, memoryview)
+
+    def get_nb_file(self):
+        return self._nb_file
+
+    def _analyse_index(self):
+        """
+        Parse the FL and FI into the entry index, without touching the packed FS data
         If no data have been loaded, the data is loaded on itself
-        First the Fl file is analysed, then the Fi then the Fs
-        :param nested: If True, the sub archive will be analysed
         """
         # Checking if data have been loaded previously
         if not self._fs_data or not self._fi_data or not self._fl_data:
@@ -138,29 +266,130 @@ class Archive:
         self._fl_data_list = self._fl_data
         self._nb_file = len(self._fl_data_list)
         # FI analyse
+        self._fi_data_list = []
         for current_offset in range(0, len(self._fi_data), 3 * self.OFFSET_SIZE):
             length_unpack_file = int.from_bytes(self._fi_data[current_offset:current_offset + self.OFFSET_SIZE], byteorder="little")
             packed_file_location = int.from_bytes(self._fi_data[current_offset + self.OFFSET_SIZE:current_offset + self.OFFSET_SIZE * 2], byteorder="little")
             compression_used = bool(
                 int.from_bytes(self._fi_data[current_offset + self.OFFSET_SIZE * 2:current_offset + self.OFFSET_SIZE * 3], byteorder="little"))
             self._fi_data_list.append(FiSingleData(length_unpack_file, packed_file_location, compression_used))
-        # FS analyse
         if inspect.isgenerator(self._fs_data):
             self._fs_data = bytes(self._fs_data)
         self._fs_file_size = int.from_bytes(self._fs_data[0:4], byteorder='little')
+
+    def get_packed_entry(self, index: int):
+        """
+        Give the entry as stored in the FS, still compressed if it is.
+        A compressed entry starts with its compressed length on 4 bytes (not included in the returned data), an
+        uncompressed one is stored as is.
+        """
+        if not self._fi_data_list:
+            self._analyse_index()
+        fi_data = self._fi_data_list[index]
+        start_data = fi_data.packed_file_location
+        if fi_data.compression_used:
+            packed_length = int.from_bytes(self._fs_data[start_data:start_data + self.OFFSET_SIZE], byteorder="little")
+            start_data += self.OFFSET_SIZE
+            return self._fs_data[start_data:start_data + packed_length]
+        return self._fs_data[start_data:start_data + fi_data.length_unpack_file]
+
+    def set_disk_cache(self, disk_cache: EntryCache | None, archive_key: tuple | None = None):
+        """
+        Keep the decoded entries in a persistent cache, so the next runs don't decompress them again
+        The nested archives analysed afterward use the same cache.
+        :param disk_cache: The cache, None to stop using it
+        :param archive_key: The key identifying this archive, by default made from the path, size and mtime of the FS
+        """
+        self._disk_cache = disk_cache
+        self._archive_key = archive_key
+
+    def _get_archive_key(self) -> tuple:
+        if self._archive_key is None:
+            self._archive_key = EntryCache.make_archive_key(self._fs_path)
+        return self._archive_key
+
+    def _get_disk_cache_key(self, index: int) -> tuple:
+        return self._get_archive_key() + (self._fi_data_list[index].packed_file_location,)
+
+    def _decode_entry(self, index: int) -> bytes:
+        """Decompress a compressed entry, going through the disk cache if any"""
+        if self._disk_cache is not None:
+            entry_data = self._disk_cache.get(self._get_disk_cache_key(index))
+            if entry_data is not None:
+                return entry_data
+        entry_data = bytes(self.lzs.decode_bytes(self.get_packed_entry(index), self._fi_data_list[index].length_unpack_file))
+        if self._disk_cache is not None:
+            self._disk_cache.put(self._get_disk_cache_key(index), entry_data)
+        return entry_data
+
+    def get_entry_data(self, index: int) -> bytes:
+        """
+        Give the decompressed data of one entry, decompressing it only the first time it is asked for.
+        The last decoded entries are kept in a LRU cache of cache_size elements.
+        When the archive is mapped, an uncompressed entry is a memoryview on the mapped file.
+        :param index: The index of the entry in the FL/FI
+        :return: The entry data
+        """
+        if not self._fi_data_list:
+            self._analyse_index()
+        if index in self._entry_cache:
+            self._entry_cache.move_to_end(index)
+            return self._entry_cache[index]
+        if self._fi_data_list[index].compression_used:
+            entry_data = self._decode_entry(index)
+        elif isinstance(self._fs_data, memoryview):
+            entry_data = self.get_packed_entry(index)
+        else:
+            entry_data = bytes(self.get_packed_entry(index))
+        if self._cache_size > 0:
+            self._entry_cache[index] = entry_data
+            if len(self._entry_cache) > self._cache_size:
+                self._entry_cache.popitem(last=False)
+        return entry_data
+
+    def clear_cache(self):
+        """Drop every decoded entry kept by the lazy mode"""
+        self._entry_cache.clear()
+
+    def analyse_data(self, nested=False, lazy=False, workers=None):
+        """
+        Analysing the data already loaded
+        If no data have been loaded, the data is loaded on itself
+        First the Fl file is analysed, then the Fi then the Fs
+        :param nested: If True, the sub archive will be analysed
+        :param lazy: If True, only the index is built and each entry is decompressed on first access
+        :param workers: If more than 1 (and not lazy), all entries are decompressed in advance by a pool of this many
+        processes instead of being given as generators
+        With a disk cache, the compressed entries are given as bytes (from the cache, or decoded and cached) instead
+        of generators.
+        """
+        if workers and workers > 1 and not lazy:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                self.analyse_data_parallel(executor, workers, nested)
+            return
+        self._analyse_index()
+        self._fs_data_list = []
+        self._archive_list = []
+        self._entry_cache.clear()
+        self._lazy = lazy
+        self._index = ArchiveIndex()
+        for i, path in enumerate(self._fl_data_list):
+            self._index.add(path, self, i)
+        if lazy:
+            self._fs_data_list = _LazyFsDataList(self)
+        # FS analyse
         nested_archive = {}
         for i in range(0, self._nb_file):
-            if i == self._nb_file - 1:
-                end_data = len(self._fs_data)
+            if lazy:
+                new_fs_data = None
             else:
-                end_data = self._fi_data_list[i + 1].packed_file_location
-            start_data = self._fi_data_list[i].packed_file_location + 4  # 4 bytes for length of file at start
-
-            if self._fi_data_list[i].compression_used:
-                new_fs_data = self.lzs.decode(self._fs_data[start_data:end_data])
-            else:
-                new_fs_data = self._fs_data[start_data:end_data]
-            self._fs_data_list.append(new_fs_data)
+                if self._fi_data_list[i].compression_used and self._disk_cache is not None:
+                    new_fs_data = self._decode_entry(i)
+                elif self._fi_data_list[i].compression_used:
+                    new_fs_data = self.lzs.decode(self.get_packed_entry(i))
+                else:
+                    new_fs_data = self.get_packed_entry(i)
+                self._fs_data_list.append(new_fs_data)
 
             if nested:
                 extension = self._fl_data[i].split('.')[-1]
@@ -168,6 +397,8 @@ class Archive:
                 if extension in ("fs", "fi", "fl"):  # Means we have a nested archive
                     if name not in nested_archive:
                         nested_archive[name] = {}
+                    if lazy:  # The nested FI/FL are needed for the index anyway
+                        new_fs_data = self.get_entry_data(i)
                     nested_archive[name][extension + "_data"] = new_fs_data
                     nested_archive[name][extension + "_path"] = self._fl_data_list[i]
                     print("New archive soon")
@@ -199,15 +430,96 @@ class Archive:
                     elif extension == "fl_path":
                         path_fl = data
 
-                new_archive = Archive(path_fs, path_fi, path_fl)
+                new_archive = Archive(path_fs, path_fi, path_fl, cache_size=self._cache_size)
                 new_archive.load_data_from_bytes(nested_fs, nested_fi, nested_fl)
-                new_archive.analyse_data(nested=True)
+                if self._disk_cache is not None:
+                    new_archive.set_disk_cache(self._disk_cache, self._get_archive_key() + (path_fs,))
+                new_archive.analyse_data(nested=True, lazy=lazy)
                 self._archive_list.append(new_archive)
+                self._index.extend(new_archive.get_index())
 
-    def get_fs_data_analysed(self) -> list[Generator[bytes, None, None]] | list[bytes] :
+    def analyse_data_parallel(self, executor: Executor, workers: int, nested=False):
+        """
+        Analyse the archive (and its nested archives) with the decompression done by an executor.
+        The index of the whole archive tree is built first, then all the compressed entries are split in chunks of
+        about the same compressed length, decoded by the executor and put back in the FI order of their archive.
+        :param executor: The executor (normally a process pool) doing the decompression
+        :param workers: The number of workers of the executor, used to size the chunks
+        :param nested: If True, the sub archive will be analysed
+        """
+        self.analyse_data(nested=nested, lazy=True)
+        archive_list = [self]
+        for archive in archive_list:  # Grows while walking, to reach every nested level
+            archive_list.extend(archive.get_archive_list())
+        entry_list_by_archive = []
+        job_list = []
+        job_target_list = []
+        for archive_index, archive in enumerate(archive_list):
+            entry_list = archive.get_known_entry_list()
+            fi_data_list = archive.get_fi_data_analysed()
+            for i, entry_data in enumerate(entry_list):
+                if entry_data is None:
+                    job_list.append((bytes(archive.get_packed_entry(i)), fi_data_list[i].length_unpack_file))
+                    job_target_list.append((archive_index, i))
+            entry_list_by_archive.append(entry_list)
+        # Several chunks per worker so that a slow one doesn't leave the others idle
+        chunk_list = _split_by_packed_length(job_list, workers * 4)
+        job_target_iter = iter(job_target_list)
+        decoded_index_by_archive = [[] for _ in archive_list]
+        for decoded_list in executor.map(_decode_chunk, chunk_list):
+            for entry_data in decoded_list:
+                archive_index, i = next(job_target_iter)
+                entry_list_by_archive[archive_index][i] = entry_data
+                decoded_index_by_archive[archive_index].append(i)
+        for archive, entry_list, decoded_index_list in zip(archive_list, entry_list_by_archive,
+                                                           decoded_index_by_archive):
+            archive.set_fs_data_analysed(entry_list, decoded_index_list)
+
+    def get_known_entry_list(self) -> list[bytes | memoryview | None]:
+        """
+        The entries that are there without decompressing anything: the uncompressed ones, the ones in the disk cache
+        and the 3 files of each nested archive (which keeps them). None for the others.
+        """
+        if not self._fi_data_list:
+            self._analyse_index()
+        nested_entry_dict = {}
+        for nested_archive in self._archive_list:
+            nested_entry_dict.update(nested_archive.get_source_entry_dict())
+        entry_list = []
+        for i, fi_data in enumerate(self._fi_data_list):
+            entry_data = nested_entry_dict.get(self._fl_data_list[i])
+            if entry_data is None and not fi_data.compression_used:
+                entry_data = self.get_packed_entry(i)
+            elif entry_data is None and self._disk_cache is not None:
+                entry_data = self._disk_cache.get(self._get_disk_cache_key(i))
+            entry_list.append(entry_data)
+        return entry_list
+
+    def get_source_entry_dict(self) -> dict[str, bytes | memoryview]:
+        """For a nested archive, its FS, FI and FL entries in its parent (path -> data). Empty for the others."""
+        return self._source_entry_dict
+
+    def set_fs_data_analysed(self, fs_data_list: list[bytes | memoryview], decoded_index_list: Sequence[int] = ()):
+        """
+        Use entries decoded elsewhere (by a process pool) as the analysed FS data, the archive being analysed (not
+        lazily) from now on. The index must have been built (analyse_data).
+        :param fs_data_list: The data of every entry, in the FI order
+        :param decoded_index_list: The entries that were decompressed, to put in the disk cache if any
+        """
+        if len(fs_data_list) != len(self._fi_data_list):
+            raise ValueError(f"Expected {len(self._fi_data_list)} entries, got {len(fs_data_list)}")
+        self._fs_data_list = list(fs_data_list)
+        self._lazy = False
+        self._entry_cache.clear()
+        if self._disk_cache is not None:
+            for i in decoded_index_list:
+                self._disk_cache.put(self._get_disk_cache_key(i), self._fs_data_list[i])
+
+    def get_fs_data_analysed(self) -> list[Generator[bytes, None, None]] | list[bytes] | Sequence[bytes]:
         """
         Give the previously analysed data (empty if no analysed have been done), which can contains generator
         if there is compressed data AND the generator hasn't been used
+        When analysed lazily, this is a read-only sequence decompressing each entry when it is indexed
         :return: The FS data
         """
         return self._fs_data_list
@@ -221,25 +533,328 @@ class Archive:
     def get_archive_list(self) -> list[type['Archive']]:
         return self._archive_list
 
+    def _read_entry(self, index: int) -> bytes | memoryview:
+        """Give the data of an entry without keeping it in the cache of the lazy mode"""
+        if index in self._entry_cache:
+            return self._entry_cache[index]
+        if self._fi_data_list[index].compression_used:
+            return self._decode_entry(index)
+        return self.get_packed_entry(index)
+
+    def _iter_entry_index(self, nested=False) -> Generator[tuple['Archive', int], None, None]:
+        """
+        Walk the entries without analysing the archive, giving the archive containing each one and its index.
+        With nested, a nested archive is walked (in place of its fs, fi and fl entries) as soon as its 3 files are found.
+        """
+        if not self._fi_data_list:
+            self._analyse_index()
+        nested_part = {}
+        for i, path in enumerate(self._fl_data_list):
+            base_path, _, extension = path.rpartition('.')
+            if not nested or extension not in ("fs", "fi", "fl"):
+                yield self, i
+                continue
+            nested_part.setdefault(base_path, {})[extension] = i
+            if len(nested_part[base_path]) < 3:
+                continue
+            part = nested_part.pop(base_path)
+            nested_archive = Archive(base_path + ".fs", base_path + ".fi", base_path + ".fl", cache_size=0)
+            nested_archive.load_data_from_bytes(self._read_entry(part["fs"]), self._read_entry(part["fi"]),
+                                                self._read_entry(part["fl"]))
+            if self._disk_cache is not None:
+                nested_archive.set_disk_cache(self._disk_cache, self._get_archive_key() + (base_path + ".fs",))
+            yield from nested_archive._iter_entry_index(nested=True)
+        for part in nested_part.values():  # Incomplete nested archive, given as simple entries
+            print(f"Archive missing some file for {list(part.keys())}")
+            for i in sorted(part.values()):
+                yield self, i
+
+    def iter_entries(self, nested=False) -> Generator[tuple[str, bytes | memoryview], None, None]:
+        """
+        Give the entries one at a time, in archive order, without analysing the archive nor keeping them
+        :param nested: If True, the entries of the nested archives are given instead of their fs, fi and fl
+        :return: Generator of (fl path, entry data)
+        """
+        for archive, i in self._iter_entry_index(nested):
+            yield archive.get_fl_data_analysed()[i], archive._read_entry(i)
+
+    def iter_entry_info(self, nested=False) -> Generator[tuple[str, int], None, None]:
+        """
+        Give the fl path and the unpacked size of each entry, in archive order, from the FI and FL only: no entry is
+        decompressed (with nested, only the fs, fi and fl of the nested archives are read)
+        :param nested: If True, the entries of the nested archives are given instead of their fs, fi and fl
+        :return: Generator of (fl path, unpacked size)
+        """
+        for archive, i in self._iter_entry_index(nested):
+            yield archive.get_fl_data_analysed()[i], archive.get_fi_data_analysed()[i].length_unpack_file
+
+    @staticmethod
+    def get_extract_path(folder_path: str, path: str) -> str:
+        """
+        Give where an entry is extracted, the fl path without its drive being used as the relative path
+        :param folder_path: The folder where the archive is extracted
+        :param path: The fl path of the entry, like c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\chara.one
+        :return: The path of the extracted file
+        """
+        fl_path = pathlib.PureWindowsPath(path)
+        relative_parts = fl_path.parts[1:] if fl_path.anchor else fl_path.parts
+        return os.path.join(folder_path, *(part for part in relative_parts if part not in ("..", ".")))
+
+    def extract_to_folder(self, folder_path: str, nested=True, skip_existing=True) -> tuple[int, int]:
+        """
+        Extract the entries to a folder, one at a time so that the memory stays bounded whatever the archive size
+        (best used after load_data(use_mmap=True))
+        :param folder_path: The folder where the entries are written, following their fl path
+        :param nested: If True, the nested archives are extracted instead of their fs, fi and fl
+        :param skip_existing: If True, an entry already extracted with the right size is neither decompressed nor written
+        :return: The number of entries written and skipped
+        """
+        nb_written = 0
+        nb_skipped = 0
+        for archive, i in self._iter_entry_index(nested):
+            file_path = self.get_extract_path(folder_path, archive.get_fl_data_analysed()[i])
+            if skip_existing and os.path.isfile(file_path) and \
+                    os.path.getsize(file_path) == archive.get_fi_data_analysed()[i].length_unpack_file:
+                nb_skipped += 1
+                continue
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb", buffering=self.EXTRACT_BUFFER_SIZE) as file:
+                file.write(archive._read_entry(i))
+            nb_written += 1
+        return nb_written, nb_skipped
+
+    def get_index(self) -> ArchiveIndex:
+        """Give the index of the paths of this archive and its nested archives, built during the analysis"""
+        return self._index
+
+    @staticmethod
+    def _get_index_entry_data(entry_list: list[tuple]) -> list[(str, Generator[bytes, None, None])]:
+        return [(path, archive.get_fs_data_analysed()[i]) for path, archive, i in entry_list]
+
     def get_all_data_by_name(self, name) -> list[(str, Generator[bytes, None, None])]:
         """
         Give all element with a specific name (the name being the last element of the path in the fl file)
         :param name: The name of the element searched
         :return: The list of all element found with this name. Each element of the list is a tuple of (fl string, fs data)
         """
-        list_return = []
         if not self.is_analysed():
             print("get_all_data_by_name:Archive not analysed")
             return []
-        fs_data = self.get_fs_data_analysed()
-        fl_data = self.get_fl_data_analysed()
-        archive_list = self.get_archive_list()
-        for i, path_fl in enumerate(fl_data):
-            if path_fl.split('\\')[-1] == name:
-                list_return.append((path_fl, fs_data[i]))
-        for archive in archive_list:
-            list_return.extend(archive.get_all_data_by_name(name=name))
-        return list_return
+        return self._get_index_entry_data(self._index.find_name(name))
+
+    def get_data_by_path(self, path: str) -> list[(str, Generator[bytes, None, None])]:
+        """
+        Give the element with this exact fl path, in this archive or a nested one
+        :param path: The fl path of the element
+        :return: The list of element found (normally one). Each element of the list is a tuple of (fl string, fs data)
+        """
+        if not self.is_analysed():
+            print("get_data_by_path:Archive not analysed")
+            return []
+        return self._get_index_entry_data(self._index.find_path(path))
+
+    def find_data(self, pattern: str = "*", folder: str | None = None) -> list[(str, Generator[bytes, None, None])]:
+        """
+        Give all element whose name matches a glob pattern, optionally in a folder, like "*.msd" in "mapdata\\bc"
+        :param pattern: Glob pattern on the name of the element (the last element of the path in the fl file)
+        :param folder: Folders (separated by "\\") the element must be in, at any depth
+        :return: The list of all element found. Each element of the list is a tuple of (fl string, fs data)
+        """
+        if not self.is_analysed():
+            print("find_data:Archive not analysed")
+            return []
+        return self._get_index_entry_data(self._index.find(pattern, folder))
+
+
+@dataclass
+class _WriterEntry:
+    path: str
+    length_unpack_file: int
+    compression_used: bool
+    packed_data: bytes | None  # As stored in the FS, without the compressed length. None until packed
+    data: bytes | None = None  # New uncompressed data, packed when the archive is written
+    source: 'Archive | None' = None  # Archive holding the packed data of an unchanged entry, read only when writing
+    source_index: int = -1
+
+
+class ArchiveWriter:
+    """
+    Write an FS/FI/FL archive in pure Python, without DelingCli.
+    The writer is either filled entry by entry with add_entry, or started from an existing archive with from_archive.
+    In the second case the entries keep their packed (compressed) bytes as they are in the FS, and only the entries
+    changed with set_entry_data are compressed again when writing. The unchanged entries are read from the archive
+    one at a time while writing (a memoryview when it is mapped), so the archive must stay loaded until then.
+    Writing over a memory-mapped archive releases its mapping (see write).
+    The FI locations are recomputed on each write.
+    Nested archives (the mapdata ones of field.fs) are updated by writing them first and giving their 3 files to the
+    parent with set_nested_archive.
+    """
+
+    def __init__(self, level: LzsLevel = LzsLevel.FAST):
+        """
+        :param level: The LZS compression level used for the new or changed entries
+        """
+        self._entry_list = []
+        self._index_by_path = {}
+        self._level = level
+
+    def __str__(self):
+        return f"ArchiveWriter(nb_entry:{len(self._entry_list)}, nb_modified:{self.get_nb_modified_entry()})"
+
+    def __repr__(self):
+        return self.__str__()
+
+    @classmethod
+    def from_archive(cls, archive: Archive, level: LzsLevel = LzsLevel.FAST):
+        """
+        Start from an existing archive, reusing the packed bytes of every entry. Nothing is copied: the entries are
+        read from the archive when writing.
+        :param archive: The archive (loaded or not, it is loaded and indexed if needed)
+        :param level: The LZS compression level used for the new or changed entries
+        :return: The writer
+        """
+        writer = cls(level)
+        fi_data_list = archive.get_fi_data_analysed()
+        if not fi_data_list:
+            archive.analyse_data(lazy=True)
+            fi_data_list = archive.get_fi_data_analysed()
+        for i, path in enumerate(archive.get_fl_data_analysed()):
+            fi_data = fi_data_list[i]
+            writer._append_entry(_WriterEntry(path, fi_data.length_unpack_file, fi_data.compression_used, None,
+                                              source=archive, source_index=i))
+        return writer
+
+    def _append_entry(self, entry: _WriterEntry):
+        if entry.path in self._index_by_path:
+            raise ValueError(f"Entry already in the archive: {entry.path}")
+        self._index_by_path[entry.path] = len(self._entry_list)
+        self._entry_list.append(entry)
+
+    def get_fl_data(self) -> list[str]:
+        return [entry.path for entry in self._entry_list]
+
+    def get_nb_modified_entry(self) -> int:
+        return sum(1 for entry in self._entry_list if entry.data is not None)
+
+    def add_entry(self, path: str, data: bytes, compression_used: bool = True):
+        """
+        Add a new entry at the end of the archive
+        :param path: The path written in the FL
+        :param data: The uncompressed data
+        :param compression_used: If True, the entry is LZS compressed
+        """
+        self._append_entry(_WriterEntry(path, len(data), compression_used, None, bytes(data)))
+
+    def set_entry_data(self, path: str, data: bytes, compression_used: bool | None = None):
+        """
+        Replace the data of an entry, which is the only one compressed again when writing
+        :param path: The path of the entry in the FL
+        :param data: The new uncompressed data
+        :param compression_used: Change the compression of the entry, None keeps the current one
+        """
+        if path not in self._index_by_path:
+            raise KeyError(f"Entry not in the archive: {path}")
+        entry = self._entry_list[self._index_by_path[path]]
+        entry.data = bytes(data)
+        entry.length_unpack_file = len(data)
+        entry.packed_data = None
+        entry.source = None
+        if compression_used is not None:
+            entry.compression_used = compression_used
+
+    def set_nested_archive(self, base_path: str, nested_writer: 'ArchiveWriter'):
+        """
+        Replace the 3 entries of a nested archive by the content of its writer
+        :param base_path: The path of the nested archive in the FL, without the extension
+        :param nested_writer: The writer of the nested archive
+        """
+        fs_data, fi_data, fl_data = nested_writer.get_archive_data()
+        self.set_entry_data(base_path + ".fs", fs_data)
+        self.set_entry_data(base_path + ".fi", fi_data)
+        self.set_entry_data(base_path + ".fl", fl_data)
+
+    def remove_entry(self, path: str):
+        if path not in self._index_by_path:
+            raise KeyError(f"Entry not in the archive: {path}")
+        del self._entry_list[self._index_by_path[path]]
+        self._index_by_path = {entry.path: i for i, entry in enumerate(self._entry_list)}
+
+    def _pack_entry(self, entry: _WriterEntry) -> bytes | memoryview:
+        if entry.source is not None:
+            return entry.source.get_packed_entry(entry.source_index)
+        if entry.packed_data is None:
+            if entry.compression_used:
+                entry.packed_data = bytes(lzs.encode(entry.data, level=self._level))
+            else:
+                entry.packed_data = entry.data
+            entry.data = None
+        return entry.packed_data
+
+    def _iter_fs_chunk(self, fi_data: bytearray):
+        """Give the FS chunk by chunk, filling the FI along the way"""
+        location = 0
+        for entry in self._entry_list:
+            packed_data = self._pack_entry(entry)
+            fi_data.extend(entry.length_unpack_file.to_bytes(Archive.OFFSET_SIZE, byteorder="little"))
+            fi_data.extend(location.to_bytes(Archive.OFFSET_SIZE, byteorder="little"))
+            fi_data.extend(int(entry.compression_used).to_bytes(Archive.OFFSET_SIZE, byteorder="little"))
+            if entry.compression_used:
+                yield len(packed_data).to_bytes(Archive.OFFSET_SIZE, byteorder="little")
+                location += Archive.OFFSET_SIZE
+            yield packed_data
+            location += len(packed_data)
+
+    def _get_fl_bytes(self) -> bytes:
+        return "".join(entry.path + "\r\n" for entry in self._entry_list).encode("utf8")
+
+    def get_archive_data(self) -> tuple[bytes, bytes, bytes]:
+        """
+        Build the archive in memory
+        :return: The FS, FI and FL data
+        """
+        fi_data = bytearray()
+        fs_data = b"".join(self._iter_fs_chunk(fi_data))
+        return fs_data, bytes(fi_data), self._get_fl_bytes()
+
+    def write(self, fs_path: str, fi_path: str, fl_path: str):
+        """
+        Write the 3 files of the archive, the FS being streamed entry by entry
+        The files are written aside then renamed, so the archive the writer was started from can be overwritten:
+        its entries are read from the old files while writing. When that archive is memory-mapped, its mapping is
+        released before the renames (Windows can't replace a mapped file), which unloads it: load it again to read
+        the new files, and don't write this writer again. If some of its entries given as memoryview are still used,
+        nothing is replaced and BufferError is raised.
+        """
+        path_list = (fs_path, fi_path, fl_path)
+        fi_data = bytearray()
+        try:
+            with open(fs_path + ".tmp", "wb") as file:
+                file.writelines(self._iter_fs_chunk(fi_data))  # No chunk left referenced, for release_mapping
+            with open(fi_path + ".tmp", "wb") as file:
+                file.write(fi_data)
+            with open(fl_path + ".tmp", "wb") as file:
+                file.write(self._get_fl_bytes())
+            source_dict = {id(entry.source): entry.source for entry in self._entry_list if entry.source is not None}
+            for source in source_dict.values():
+                if source.is_mapped_file(fs_path):
+                    source.release_mapping()
+        except BaseException:
+            for path in path_list:
+                if os.path.exists(path + ".tmp"):
+                    os.remove(path + ".tmp")
+            raise
+        for path in path_list:
+            os.replace(path + ".tmp", path)
+
+    def write_to_folder(self, folder_path: str, name: str):
+        """
+        Write the archive in a folder, the 3 files having the same name
+        :param folder_path: The folder where to write the files
+        :param name: The name of the archive (the common name of the 3 files fs, fi and fl)
+        """
+        os.makedirs(folder_path, exist_ok=True)
+        self.write(os.path.join(folder_path, name + ".fs"), os.path.join(folder_path, name + ".fi"),
+                   os.path.join(folder_path, name + ".fl"))
 
 
 class FsManager:
@@ -287,20 +902,53 @@ class FsManager:
             else:
                 print(f"File {fs_file.replace(".fs", ".fi")} doesn't exist")
 
-    def load_all_archive(self):
+    def set_disk_cache(self, disk_cache: EntryCache | None):
+        """
+        Keep the decoded entries of all archives in a persistent cache
+        :param disk_cache: The cache, None to stop using it
+        """
+        for archive in self._archive_list:
+            archive.set_disk_cache(disk_cache)
+
+    def load_all_archive(self, use_mmap=False):
         """
         Load in memory the archive.
+        :param use_mmap: If True, the FS files are memory-mapped instead of read
         """
         for archive in self._archive_list:
-            archive.load_data()
+            archive.load_data(use_mmap)
 
-    def analyse_all_archive(self, nested=False):
+    def analyse_all_archive(self, nested=False, lazy=False, workers=None):
         """
         Analyse all archive
         :param nested: If True, the sub archive will be analysed
+        :param lazy: If True, the entries are only decompressed when first accessed
+        :param workers: If more than 1 (and not lazy), the entries are decompressed by a pool of this many processes,
+        shared by all the archives
         """
+        if workers and workers > 1 and not lazy:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for archive in self._archive_list:
+                    archive.analyse_data_parallel(executor, workers, nested)
+            return
         for archive in self._archive_list:
-            archive.analyse_data(nested)
+            archive.analyse_data(nested, lazy)
+
+    def extract_all_archive(self, folder_path: str, nested=True, skip_existing=True) -> tuple[int, int]:
+        """
+        Extract all archive to a folder, one entry at a time
+        :param folder_path: The folder where the entries are written, following their fl path
+        :param nested: If True, the nested archives are extracted instead of their fs, fi and fl
+        :param skip_existing: If True, an entry already extracted with the right size is skipped
+        :return: The number of entries written and skipped
+        """
+        nb_written = 0
+        nb_skipped = 0
+        for archive in self._archive_list:
+            archive_written, archive_skipped = archive.extract_to_folder(folder_path, nested, skip_existing)
+            nb_written += archive_written
+            nb_skipped += archive_skipped
+        return nb_written, nb_skipped
 
     def unload_all_archive(self):
         """
@@ -309,16 +957,18 @@ class FsManager:
         for archive in self._archive_list:
             archive.unload_data()
 
-    def load_archive_by_name(self, name: str):
-        self.get_archive_by_name(name).load_data()
+    def load_archive_by_name(self, name: str, use_mmap=False):
+        self.get_archive_by_name(name).load_data(use_mmap)
 
-    def analyse_archive_by_name(self, name, nested=False):
+    def analyse_archive_by_name(self, name, nested=False, lazy=False, workers=None):
         """
         Analyse the archive by name
         :param name: The name of the archive (the common name of the 3 files fs, fi and fl)
         :param nested: If True, the sub archive will be analysed
+        :param lazy: If True, the entries are only decompressed when first accessed
+        :param workers: If more than 1 (and not lazy), the entries are decompressed by a pool of this many processes
         """
-        self.get_archive_by_name(name).analyse_data(nested)
+        self.get_archive_by_name(name).analyse_data(nested, lazy, workers)
 
     def get_data_by_name(self, name: str):
         self.get_archive_by_name(name).get_fs_data_analysed()
@@ -345,6 +995,29 @@ class FsManager:
             list_return.extend(archive.get_all_data_by_name(name))
         return list_return
 
+    def get_data_by_path(self, path: str) -> list[(str, Generator[bytes, None, None])]:
+        """
+        Give the element with this exact fl path, in any archive
+        :param path: The fl path of the element
+        :return: The list of element found. Each element of the list is a tuple of (fl string, fs data)
+        """
+        list_return = []
+        for archive in self._archive_list:
+            list_return.extend(archive.get_data_by_path(path))
+        return list_return
+
+    def find_data(self, pattern: str = "*", folder: str | None = None) -> list[(str, Generator[bytes, None, None])]:
+        """
+        Give all element whose name matches a glob pattern, optionally in a folder, like "*.msd" in "mapdata\\bc"
+        :param pattern: Glob pattern on the name of the element (the last element of the path in the fl file)
+        :param folder: Folders (separated by "\\") the element must be in, at any depth
+        :return: The list of all element found. Each element of the list is a tuple of (fl string, fs data)
+        """
+        list_return = []
+        for archive in self._archive_list:
+            list_return.extend(archive.find_data(pattern, folder))
+        return list_return
+
 
 if __name__ == "__main__":
     # First an example for reading one file in the fs
@@ -1,8 +1,40 @@
+"""
+LZSS codec shared by everything reading FF8 compressed data: the fs archives (FF8GameData/fs/fsmanager.py), the
+.ff8 save files (Hyne) and the battle stages (Alexander).
+
+The format is Okumura's LZSS: a flag byte (LSB-first) gates 8 tokens; bit=1 -> literal byte; bit=0 -> 2-byte
+back-reference to a position of a 4096-byte ring buffer (12-bit position, length 3..18). The variants only differ by
+the value the ring buffer is filled with before the first byte and by the ring position of the first byte, so both are
+parameters of decode and encode (FF8 uses 0x00 and 0xFEE everywhere).
+"""
 import time
+from enum import Enum, auto
+
+RING_FILL = 0x00
+RING_START = 4096 - 18  # N - F
+
+
+class LzsLevel(Enum):
+    """
+    Compression level of the encoder. Every level gives a stream any decoder of the format reads the same way.
+    TREE is the original Okumura binary tree encoder, the others look for matches in hash chains of 3-byte prefixes.
+    """
+    FAST = auto()  # Short chains, greedy: much faster, a bit bigger
+    LAZY = auto()  # Longer chains, a match is delayed when the next position has a longer one
+    TREE = auto()  # Binary tree, greedy longest match
+    MAX = auto()  # Whole window searched, optimal choice between literals and references (smallest output)
+
+
+# Level -> (max number of chain links followed, longest match whose inner positions are chained, lazy matching,
+# optimal parsing)
+_HASH_CHAIN_SETTINGS = {
+    LzsLevel.FAST: (4, 3, False, False),
+    LzsLevel.LAZY: (32, 18, True, False),
+    LzsLevel.MAX: (None, 18, False, True),
+}
 
 
 class Lzs:
-    """/!\\ Only decode have been tested"""
     N = 4096
     F = 18
     THRESHOLD = 2
@@ -46,6 +78,8 @@ class Lzs:
                 cmp = self.buffer[r + i] - self.buffer[p + i]
                 if cmp != 0:
                     break
+            else:
+                i = Lzs.F
             if i > self.MatchLen:
                 self.MatchPos = p
                 self.MatchLen = i
@@ -87,7 +121,19 @@ class Lzs:
             self.Lson[self.Dad[p]] = q
         self.Dad[p] = Lzs.NIL
 
-    def encode(self, input_bytes: bytearray) -> bytearray:
+    def encode(self, input_bytes: bytes, ring_fill: int = RING_FILL, ring_start: int = RING_START,
+               level: LzsLevel = LzsLevel.TREE) -> bytearray:
+        """
+        Okumura binary tree encoder: each position is inserted in a tree of the window to find the longest match.
+        The other levels go through the hash chain encoder instead.
+        :param input_bytes: The data to compress
+        :param ring_fill: Value the decoder ring buffer is filled with before the first byte
+        :param ring_start: Ring buffer position of the first decoded byte
+        :param level: The compression level
+        :return: The LZS compressed data
+        """
+        if level != LzsLevel.TREE:
+            return encode_hash_chain(input_bytes, ring_fill, ring_start, level)
         output_bytes = bytearray()
         self.init_tree()
         code_buf = bytearray(17)
@@ -95,19 +141,17 @@ class Lzs:
         code_buf_ptr = mask = 1
         s = 0
         r = Lzs.N - Lzs.F
+        # The tree works with the first byte at N - F, the references are shifted to the decoder ring_start
+        position_shift = ring_start - r
         len_input = len(input_bytes)
         input_pos = 0
 
         for i in range(s, r):
-            self.buffer[i] = 0
+            self.buffer[i] = ring_fill
 
-        len_bytes = 0
-        for len_bytes in range(Lzs.F):
-            if input_pos < len_input:
-                self.buffer[r + len_bytes] = input_bytes[input_pos]
-                input_pos += 1
-            else:
-                break
+        len_bytes = min(Lzs.F, len_input)
+        self.buffer[r:r + len_bytes] = input_bytes[:len_bytes]
+        input_pos = len_bytes
         if len_bytes == 0:
             return bytearray()
 
@@ -124,9 +168,10 @@ class Lzs:
                 code_buf[code_buf_ptr] = self.buffer[r]
                 code_buf_ptr += 1
             else:
-                code_buf[code_buf_ptr] = self.MatchPos & 0xFF
+                match_pos = (self.MatchPos + position_shift) & (Lzs.N - 1)
+                code_buf[code_buf_ptr] = match_pos & 0xFF
                 code_buf_ptr += 1
-                code_buf[code_buf_ptr] = ((self.MatchPos >> 4) & 0xF0) | (self.MatchLen - (Lzs.THRESHOLD + 1))
+                code_buf[code_buf_ptr] = ((match_pos >> 4) & 0xF0) | (self.MatchLen - (Lzs.THRESHOLD + 1))
                 code_buf_ptr += 1
 
             if (mask := mask << 1) == 0x100:
@@ -136,20 +181,19 @@ class Lzs:
                 mask = 1
 
             last_match_length = self.MatchLen
-            for i in range(last_match_length):
+            for _ in range(last_match_length):
+                self.delete_node(s)
                 if input_pos < len_input:
-                    self.delete_node(s)
                     self.buffer[s] = input_bytes[input_pos]
-                    input_pos += 1
                     if s < Lzs.F - 1:
-                        self.buffer[s + Lzs.N] = input_bytes[input_pos - 1]
-                    s = (s + 1) & (Lzs.N - 1)
-                    r = (r + 1) & (Lzs.N - 1)
+                        self.buffer[s + Lzs.N] = input_bytes[input_pos]
+                    input_pos += 1
+                else:  # End of input, the look-ahead shrinks
+                    len_bytes -= 1
+                s = (s + 1) & (Lzs.N - 1)
+                r = (r + 1) & (Lzs.N - 1)
+                if len_bytes > 0:
                     self.insert_node(r)
-                else:
-                    break
-
-            len_bytes -= last_match_length
 
         if code_buf_ptr > 1:
             output_bytes.extend(code_buf[:code_buf_ptr])
@@ -208,6 +252,317 @@ class Lzs:
             # Right-shift the flags for the next round
             flags >>= 1
 
+    def decode_bytes(self, input_bytes: bytes, expected_size: int | None = None) -> bytearray:
+        """
+        Decode the whole input in one call, instead of yielding one byte at a time like decode.
+        :param input_bytes: The LZS compressed data
+        :param expected_size: The uncompressed size if known, only used to preallocate the output
+        :return: The decoded data
+        """
+        return decode(input_bytes, expected_size)
+
+
+def decode(input_bytes: bytes, expected_size: int | None = None, truncate: bool = False, ring_fill: int = RING_FILL,
+           ring_start: int = RING_START) -> bytearray:
+    """
+    Decode a whole LZS stream in one call.
+    The output is written in a buffer preallocated to expected_size, and a back-reference is copied as one slice of the
+    already decoded output instead of going through a ring buffer.
+    :param input_bytes: The LZS compressed data
+    :param expected_size: The uncompressed size if known, used to preallocate the output
+    :param truncate: If True, decoding stops once expected_size bytes are decoded and nothing past it is kept
+    :param ring_fill: Value of the ring buffer bytes referenced before the start of the output
+    :param ring_start: Ring buffer position of the first decoded byte
+    :return: The decoded data
+    """
+    output = bytearray(expected_size or 0)
+    output_size = len(output)
+    output_pos = 0
+    input_pos = 0
+    input_len = len(input_bytes)
+    ring_mask = Lzs.N - 1
+    fill_byte = bytes([ring_fill])
+
+    while input_pos < input_len:
+        if truncate and output_pos >= expected_size:
+            break
+        flags = input_bytes[input_pos]
+        input_pos += 1
+        if flags == 0xFF and input_pos + 8 <= input_len:  # 8 literals in a row
+            output[output_pos:output_pos + 8] = input_bytes[input_pos:input_pos + 8]
+            output_pos += 8
+            input_pos += 8
+            output_size = max(output_size, output_pos)
+            continue
+        for _ in range(8):
+            if flags & 1:  # Literal byte case
+                if input_pos >= input_len:
+                    break
+                if output_pos < output_size:
+                    output[output_pos] = input_bytes[input_pos]
+                else:
+                    output.append(input_bytes[input_pos])
+                    output_size += 1
+                output_pos += 1
+                input_pos += 1
+            else:  # Compressed sequence case
+                if input_pos + 1 >= input_len:
+                    input_pos = input_len
+                    break
+                i = input_bytes[input_pos]
+                j = input_bytes[input_pos + 1]
+                input_pos += 2
+                ring_pos = i | ((j & 0xF0) << 4)
+                length = (j & 0x0F) + Lzs.THRESHOLD + 1
+                # Distance between the current ring position and the referenced one, 0 meaning a full ring behind
+                distance = ((ring_start + output_pos - ring_pos) & ring_mask) or Lzs.N
+                copy_start = output_pos - distance
+                if copy_start >= 0 and distance >= length:
+                    output[output_pos:output_pos + length] = output[copy_start:copy_start + length]
+                elif copy_start >= 0:  # Overlapping copy: the last distance bytes repeat
+                    pattern = output[copy_start:output_pos]
+                    output[output_pos:output_pos + length] = (pattern * (length // distance + 1))[:length]
+                else:  # Reaching before the output start, in the ring buffer initial fill
+                    for k in range(length):
+                        source_pos = copy_start + k
+                        output[output_pos + k:output_pos + k + 1] = output[source_pos:source_pos + 1] if source_pos >= 0 else fill_byte
+                output_pos += length
+                output_size = max(output_size, output_pos)
+            flags >>= 1
+    if truncate and expected_size is not None:
+        output_pos = min(output_pos, expected_size)
+    del output[output_pos:]
+    return output
+
+
+def encode(input_bytes: bytes, ring_fill: int = RING_FILL, ring_start: int = RING_START,
+           level: LzsLevel = LzsLevel.LAZY) -> bytearray:
+    """
+    Compress data for any decoder of the format, see Lzs.encode
+    The default LAZY level is both faster and smaller than the binary tree, FAST is for big repacks.
+    :param input_bytes: The data to compress
+    :param ring_fill: Value the decoder ring buffer is filled with before the first byte
+    :param ring_start: Ring buffer position of the first decoded byte
+    :param level: The compression level
+    :return: The LZS compressed data
+    """
+    return Lzs().encode(input_bytes, ring_fill, ring_start, level)
+
+
+def encode_hash_chain(input_bytes: bytes, ring_fill: int = RING_FILL, ring_start: int = RING_START,
+                      level: LzsLevel = LzsLevel.LAZY) -> bytearray:
+    """
+    Hash chain encoder: every position is chained to the previous one starting with the same 3 bytes, so finding a
+    match only walks the positions that can give one, most recent (closest) first.
+    The data is preceded by F bytes of ring_fill, as the decoder ring buffer is, so a run of ring_fill at the start can
+    already be a reference.
+    :param input_bytes: The data to compress
+    :param ring_fill: Value the decoder ring buffer is filled with before the first byte
+    :param ring_start: Ring buffer position of the first decoded byte
+    :param level: The compression level, FAST, LAZY or MAX
+    :return: The LZS compressed data
+    """
+    max_chain, max_insert, lazy, optimal = _HASH_CHAIN_SETTINGS[level]
+    if not input_bytes:
+        return bytearray()
+    min_match = Lzs.THRESHOLD + 1
+    max_match = Lzs.F
+    max_distance = Lzs.N - 1  # A distance of N would read the ring position being written
+    prefix_len = Lzs.F
+    data = bytes([ring_fill]) * prefix_len + bytes(input_bytes)
+    data_len = len(data)
+    head = {}
+    previous = [-1] * data_len
+
+    def insert(pos):
+        key = data[pos:pos + min_match]
+        previous[pos] = head.get(key, -1)
+        head[key] = pos
+
+    def find_match(pos):
+        """Longest match for pos among the positions already chained, as (length, source position)"""
+        limit = min(max_match, data_len - pos)
+        best_len = Lzs.THRESHOLD
+        best_pos = -1
+        if limit < min_match:
+            return best_len, best_pos
+        target = data[pos:pos + limit]
+        candidate = head.get(data[pos:pos + min_match], -1)
+        min_pos = max(pos - max_distance, 0)
+        chain_left = max_chain
+        while candidate >= min_pos:
+            if data[candidate + best_len] == data[pos + best_len]:
+                if data[candidate:candidate + limit] == target:
+                    return limit, candidate
+                length = min_match
+                while data[candidate + length] == data[pos + length]:
+                    length += 1
+                if length > best_len:
+                    best_len = length
+                    best_pos = candidate
+            if chain_left is not None:
+                chain_left -= 1
+                if chain_left == 0:
+                    break
+            candidate = previous[candidate]
+        return best_len, best_pos
+
+    for pos in range(prefix_len - min_match + 1, prefix_len):
+        insert(pos)
+    if not lazy and not optimal:
+        return _encode_greedy(data, prefix_len, ring_start, head, previous, max_chain, max_insert)
+    # Tokens as (length, source position), a literal being (1, -1)
+    tokens = []
+    if optimal:
+        matches = []
+        for pos in range(prefix_len, data_len):
+            matches.append(find_match(pos))
+            insert(pos)
+        # Cost in bits from each position to the end: a literal costs 1 + 8, a reference 1 + 16
+        nb_pos = data_len - prefix_len
+        cost = [0] * (nb_pos + 1)
+        choice = [1] * nb_pos
+        for i in range(nb_pos - 1, -1, -1):
+            best_cost = cost[i + 1] + 9
+            best_length = 1
+            for length in range(min_match, matches[i][0] + 1):
+                if cost[i + length] + 17 < best_cost:
+                    best_cost = cost[i + length] + 17
+                    best_length = length
+            cost[i] = best_cost
+            choice[i] = best_length
+        i = 0
+        while i < nb_pos:
+            length = choice[i]
+            tokens.append((length, matches[i][1]) if length > 1 else (1, -1))
+            i += length
+    else:
+        pos = prefix_len
+        match_len, match_pos = find_match(pos)
+        while pos < data_len:
+            insert(pos)
+            if match_len >= min_match and pos + 1 < data_len:
+                next_len, next_pos = find_match(pos + 1)
+                if next_len > match_len:  # Better to write this byte as a literal and take the next match
+                    tokens.append((1, -1))
+                    pos += 1
+                    match_len, match_pos = next_len, next_pos
+                    continue
+            if match_len >= min_match:
+                tokens.append((match_len, match_pos))
+                if match_len <= max_insert:
+                    for inside_pos in range(pos + 1, pos + match_len):
+                        insert(inside_pos)
+                pos += match_len
+            else:
+                tokens.append((1, -1))
+                pos += 1
+            if pos < data_len:
+                match_len, match_pos = find_match(pos)
+
+    output_bytes = bytearray()
+    pos = prefix_len
+    for token_index in range(0, len(tokens), 8):
+        flag_pos = len(output_bytes)
+        output_bytes.append(0)
+        flags = 0
+        for bit, (length, source_pos) in enumerate(tokens[token_index:token_index + 8]):
+            if length == 1:
+                flags |= 1 << bit
+                output_bytes.append(data[pos])
+            else:
+                ring_pos = (ring_start + source_pos - prefix_len) & (Lzs.N - 1)
+                output_bytes.append(ring_pos & 0xFF)
+                output_bytes.append(((ring_pos >> 4) & 0xF0) | (length - min_match))
+            pos += length
+        output_bytes[flag_pos] = flags
+    return output_bytes
+
+
+def _encode_greedy(data: bytes, prefix_len: int, ring_start: int, head: dict, previous: list, max_chain: int,
+                   max_insert: int) -> bytearray:
+    """
+    Greedy pass of encode_hash_chain, taking the longest match found at each position.
+    Everything is inlined in one loop: it is the fast level, where the call overhead would be most of the time.
+    """
+    min_match = Lzs.THRESHOLD + 1
+    data_len = len(data)
+    get_head = head.get
+    output_bytes = bytearray(1)
+    flag_pos = 0
+    flags = 0
+    flag_bit = 1
+    pos = prefix_len
+    max_distance = Lzs.N - 1
+    while pos < data_len:
+        limit = data_len - pos
+        if limit > Lzs.F:
+            limit = Lzs.F
+        best_len = Lzs.THRESHOLD
+        best_pos = -1
+        key = data[pos:pos + min_match]
+        candidate = get_head(key, -1)
+        previous[pos] = candidate
+        head[key] = pos
+        if limit >= min_match:
+            target = data[pos:pos + limit]
+            min_pos = pos - max_distance if pos > max_distance else 0
+            chain_left = max_chain
+            while candidate >= min_pos:
+                if data[candidate + best_len] == data[pos + best_len]:
+                    if data[candidate:candidate + limit] == target:
+                        best_len = limit
+                        best_pos = candidate
+                        break
+                    length = min_match
+                    while data[candidate + length] == data[pos + length]:
+                        length += 1
+                    if length > best_len:
+                        best_len = length
+                        best_pos = candidate
+                chain_left -= 1
+                if chain_left == 0:
+                    break
+                candidate = previous[candidate]
+        if flag_bit == 0x100:
+            output_bytes[flag_pos] = flags
+            flag_pos = len(output_bytes)
+            output_bytes.append(0)
+            flags = 0
+            flag_bit = 1
+        if best_len >= min_match:
+            ring_pos = (ring_start + best_pos - prefix_len) & (Lzs.N - 1)
+            output_bytes.append(ring_pos & 0xFF)
+            output_bytes.append(((ring_pos >> 4) & 0xF0) | (best_len - min_match))
+            if best_len <= max_insert:
+                for inside_pos in range(pos + 1, pos + best_len):
+                    key = data[inside_pos:inside_pos + min_match]
+                    previous[inside_pos] = get_head(key, -1)
+                    head[key] = inside_pos
+            pos += best_len
+        else:
+            flags |= flag_bit
+            output_bytes.append(data[pos])
+            pos += 1
+        flag_bit <<= 1
+    output_bytes[flag_pos] = flags
+    return output_bytes
+
+
+def encode_literal(input_bytes: bytes) -> bytearray:
+    """
+    Emit every token as a literal (flag byte = 0xFF): valid for any decoder, but 1/8 bigger than the input
+    :param input_bytes: The data to store
+    :return: The LZS data
+    """
+    output_bytes = bytearray()
+    for i in range(0, len(input_bytes), 8):
+        chunk = input_bytes[i:i + 8]
+        output_bytes.append(0xFF if len(chunk) == 8 else (1 << len(chunk)) - 1)
+        output_bytes.extend(chunk)
+    return output_bytes
+
+
 def test_result():
 
     original_hex = bytes(
@@ -1,7 +1,11 @@
+import functools
 import json
 import math
 import os
+import pickle
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Literal, Tuple, Optional
@@ -55,40 +59,147 @@ class SectionType(Enum):
     SIZE_AND_OFFSET_AND_TEXT = 11
 
 
+def _resource_loader(attribute_name):
+    """
+    Decorator of the GameData.load_* functions, each one loading a *_data_json resource.
+    A call without argument does nothing once the resource is loaded, the ones with an argument (like another AI
+    file) always load it.
+    """
+    def decorator(load_function):
+        @functools.wraps(load_function)
+        def load(self, *args, **kwargs):
+            if not args and not kwargs and attribute_name in self.__dict__:
+                return
+            load_function(self, *args, **kwargs)
+            self._touched_resource_list.append(attribute_name)
+
+        return load
+
+    return decorator
+
+
 class GameData:
+    # Characters ending a run of plain text in translate_str_to_hex
+    SPECIAL_CHAR_PATTERN = re.compile(r'[\\\n{]')
+    # Control bytes ending a run of printable bytes (0x20-0xFF) in translate_hex_to_str
+    CONTROL_BYTE_PATTERN = re.compile(rb'[\x00-\x1f]')
+    # Resource attribute -> function loading it
+    RESOURCE_LOAD_DICT = {"ai_data_json": "load_ai_data", "gforce_data_json": "load_gforce_data",
+                          "stat_data_json": "load_stat_data", "status_data_json": "load_status_data",
+                          "devour_data_json": "load_devour_data",
+                          "camera_category_data_json": "load_camera_category_data",
+                          "devour_category_data_json": "load_devour_category_data",
+                          "field_data_json": "load_field_data", "enemy_abilities_data_json": "load_enemy_abilities_data",
+                          "magic_data_json": "load_magic_data", "attack_animation_data_json": "load_attack_animation_data",
+                          "monster_data_json": "load_monster_data", "sysfnt_data_json": "load_sysfnt_data",
+                          "item_data_json": "load_item_data", "mitem_data_json": "load_mitem_data",
+                          "draw_data_json": "load_draw_data", "exe_data_json": "load_exe_data",
+                          "anim_sequence_data_json": "load_anim_sequence_data", "mngrp_data_json": "load_mngrp_data",
+                          "kernel_data_json": "load_kernel_data", "card_data_json": "load_card_data"}
+    # Image type -> (card sheet in Resources/image, size of a tile)
+    CARD_SHEET_DICT = {"card_type": ("text_0.png", 128), "img": ("cards_00.png", 64),
+                       "img_remaster": ("cards_00_remaster.png", 256), "img_xylomod": ("cards_00_xylomod.png", 256)}
+    CARD_TILE_CACHE_SIZE = 256
+    # Format of the resource bundles (see read_json_resource)
+    RESOURCE_BUNDLE_VERSION = 2
+    # To change with any _convert_* function: the bundles built with the former ones are then stale
+    RESOURCE_CONVERTER_VERSION = 1
+
     def __init__(self, game_data_submodule_path="FF8GameData", ai_file: str = "ai_vanilla.json"):
         self.resource_folder_json = os.path.join(game_data_submodule_path, "Resources", "json")
         self.resource_folder_image = os.path.join(game_data_submodule_path, "Resources", "image")
         self.resource_folder = os.path.join(game_data_submodule_path, "Resources")
-        self.devour_data_json = {}
-        self.camera_category_data_json = {}
-        self.devour_category_data_json = {}
-        self.magic_data_json = {}
-        self.enemy_abilities_data_json = {}
-        self.gforce_data_json = {}
-        self.item_data_json = {}
-        self.mitem_data_json = {}
-        self.draw_data_json = {}
-        self.attack_animation_data_json = {}
-        self.field_data_json = {}
-        self.stat_data_json = {}
-        self.monster_data_json = {}
-        self.status_data_json = {}
-        self.field_data_json = {}
-        self.sysfnt_data_json = {}
-        self.kernel_data_json = {}
-        self.mngrp_data_json = {}
-        self.exe_data_json = {}
-        self.ai_data_json = {}
-        self.anim_sequence_data_json = {}
         self.ai_json_file_name = ai_file
+        # The *_data_json resources are loaded on first access (see __getattr__), their names kept in load order
+        self._touched_resource_list = []
         # Japanese support: 4-table font (Deling sysfnt_jp.txt). Table 0 = single-byte glyphs (0x20-0xFF);
         # tables 1/2/3 reached via 2-byte lead bytes 0x19/0x1a/0x1b. Set jp_encoding=True to author/read JP text.
         self.jp_encoding = False
         self.jp_tables = []
+        # Reverse tables for translate_str_to_hex, built when the tables are loaded
+        self.translate_str_to_hex_dict = {}
+        self.jp_str_to_hex_dict = {}
+        self.sysfnt_tag_to_hex_dict = {}
+        # Text of each printable byte for translate_hex_to_str (normal and JP), built when the tables are loaded
+        self.hex_to_str_char_list = []
+        self.jp_hex_to_str_char_list = []
+        self.__decode_control_list = GameData.__init_decode_control_list()
+        # Card sheets decoded on first use, and the last tiles cropped from them (see get_card_image)
+        self.__card_sheet_dict = {}
+        self.__card_tile_cache = OrderedDict()
         self.__init_hex_to_str_table()
 
+    def __getattr__(self, name):
+        # Only called for an attribute not set yet: a *_data_json resource is loaded on its first access
+        load_name = GameData.RESOURCE_LOAD_DICT.get(name)
+        if load_name is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        getattr(self, load_name)()
+        return self.__dict__[name]
+
+    @staticmethod
+    def get_json_resource_list() -> list[tuple]:
+        """
+        :return: The json read through read_json_resource, with their post-processing, for the bundle build
+        (FF8GameData/resourcebundle.py)
+        """
+        json_resource_list = [(json_name, None) for json_name in (
+            "ai_vanilla.json", "ai_cronos.json", "gforce.json", "stat.json", "status.json", "devour.json",
+            "camera_category.json", "devour_category.json", "field.json", "enemy_abilities.json", "magic.json",
+            "attack_animation.json", "monster.json", "sysfnt_data.json", "item.json", "mitem.json", "draw.json",
+            "card.json", "kernel_section_fields.json")]
+        json_resource_list.extend([("exe.json", GameData._convert_exe_data),
+                                   ("anim_sequence_info.json", GameData._convert_anim_sequence_data),
+                                   ("mngrp_bin_data.json", GameData._convert_mngrp_data),
+                                   ("kernel_bin_data.json", GameData._convert_kernel_data)])
+        return json_resource_list
 
+    @staticmethod
+    def get_resource_bundle_path(json_path: str) -> str:
+        """
+        :param json_path: The path of a json in Resources/json
+        :return: The path of its bundle in Resources/bundle
+        """
+        json_folder, json_name = os.path.split(os.path.abspath(json_path))
+        return os.path.join(os.path.dirname(json_folder), "bundle", os.path.splitext(json_name)[0] + ".pickle")
+
+    @staticmethod
+    def get_resource_bundle_key(json_path: str, post_process=None) -> tuple:
+        """
+        What a bundle is valid for: its format, the converters, and the json file it was built from (its size and
+        modification time, so nothing is read to check it)
+        """
+        json_stat = os.stat(json_path)
+        post_process_name = post_process.__qualname__ if post_process else ""
+        return (GameData.RESOURCE_BUNDLE_VERSION, GameData.RESOURCE_CONVERTER_VERSION, post_process_name,
+                json_stat.st_size, json_stat.st_mtime_ns)
+
+    @staticmethod
+    def read_json_resource(json_path: str, post_process=None):
+        """
+        Parse a json resource, or load it from its bundle when one was built from this very json
+        (python -m FF8GameData.resourcebundle). Nothing is written here.
+        :param post_process: Function converting in place the parsed json (hex str to int...)
+        """
+        bundle_path = GameData.get_resource_bundle_path(json_path)
+        if os.path.isfile(bundle_path):
+            try:
+                with open(bundle_path, "rb") as bundle_file:
+                    if pickle.load(bundle_file) == GameData.get_resource_bundle_key(json_path, post_process):
+                        return pickle.load(bundle_file)
+            except Exception as e:  # A bundle from another python version, truncated...
+                print(f"Ignoring resource bundle {bundle_path}: {e}")
+        with open(json_path, encoding="utf8") as f:
+            data = json.load(f)
+        if post_process:
+            post_process(data)
+        return data
+
+    def get_touched_resource_list(self) -> list[str]:
+        """
+        :return: The *_data_json resources loaded so far (on first access or by a load_* call), in load order
+        """
+        return list(self._touched_resource_list)
 
     def __init_hex_to_str_table(self):
         self.load_sysfnt_data()
@@ -102,7 +213,23 @@ class GameData:
                 self.translate_hex_to_str_table[i] = self.translate_hex_to_str_table[i].replace(';;;', ',')
                 if self.translate_hex_to_str_table[i].count('"') == 2:
                     self.translate_hex_to_str_table[i] = self.translate_hex_to_str_table[i].replace('"', '')
+        # Reverse of the table, the first code of a character being the one used (as list.index did)
+        self.translate_str_to_hex_dict = {}
+        for i, character in enumerate(self.translate_hex_to_str_table):
+            self.translate_str_to_hex_dict.setdefault(character, i)
         self.__init_jp_tables()
+        self.__init_hex_to_str_char_list()
+
+    def __init_hex_to_str_char_list(self):
+        """Text of each byte not being a control one, the empty ones being written as {xXX}"""
+        self.hex_to_str_char_list = []
+        self.jp_hex_to_str_char_list = []
+        for hex_val, character in enumerate(self.translate_hex_to_str_table):
+            jp_character = self.caract_jp(hex_val, 0) if hex_val >= 0x20 else None
+            if jp_character is None:
+                jp_character = character
+            self.hex_to_str_char_list.append(character or "{{x{:02x}}}".format(hex_val))
+            self.jp_hex_to_str_char_list.append(jp_character or "{{x{:02x}}}".format(hex_val))
 
     def __init_jp_tables(self):
         # Loads the Japanese 4-table font map (Resources/sysfnt_jp.txt). The file holds 4 blocks
@@ -124,6 +251,14 @@ class GameData:
                     entry = entry.replace('"', '')
                 table.append(entry)
             self.jp_tables.append(table)
+        # Reverse of the JP tables, the first table having the character being the one used
+        self.jp_str_to_hex_dict = {}
+        for table_idx, table in enumerate(self.jp_tables):
+            for idx, character in enumerate(table):
+                if table_idx == 0:
+                    self.jp_str_to_hex_dict.setdefault(character, [0x20 + idx])
+                else:
+                    self.jp_str_to_hex_dict.setdefault(character, [0x18 + table_idx, 0x20 + idx])
 
     def caract_jp(self, ord_val, table=0):
         # Returns the glyph for a byte >= 0x20 in the given JP font table (0..3), or None if out of range.
@@ -136,13 +271,10 @@ class GameData:
     def encode_jp_char(self, char):
         # Reverse of caract_jp: find a character in the JP tables. Table 0 => single byte [0x20+idx];
         # tables 1/2/3 => 2-byte lead sequence [0x18+table, 0x20+idx]. Returns None if not found.
-        for table_idx, table in enumerate(self.jp_tables):
-            if char in table:
-                idx = table.index(char)
-                if table_idx == 0:
-                    return [0x20 + idx]
-                return [0x18 + table_idx, 0x20 + idx]
-        return None
+        jp_encoded = self.jp_str_to_hex_dict.get(char)
+        if jp_encoded is None:
+            return None
+        return list(jp_encoded)
 
     @staticmethod
     def find_delimiter_from_csv_file(csv_file):
@@ -159,248 +291,259 @@ class GameData:
             delimiter = ","
         return delimiter
 
+    @_resource_loader("ai_data_json")
     def load_ai_data(self, ai_json_name=None):
         if ai_json_name:
             self.ai_json_file_name = ai_json_name
-        file_path = os.path.join(self.resource_folder_json, self.ai_json_file_name)
-        with open(file_path, encoding="utf8") as f:
-            self.ai_data_json = json.load(f)
+        self.ai_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, self.ai_json_file_name))
 
+    @_resource_loader("gforce_data_json")
     def load_gforce_data(self):
-        file_path = os.path.join(self.resource_folder_json, "gforce.json")
-        with open(file_path, encoding="utf8") as f:
-            self.gforce_data_json = json.load(f)
+        self.gforce_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "gforce.json"))
 
+    @_resource_loader("stat_data_json")
     def load_stat_data(self):
-        file_path = os.path.join(self.resource_folder_json, "stat.json")
-        with open(file_path, encoding="utf8") as f:
-            self.stat_data_json = json.load(f)
+        self.stat_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "stat.json"))
 
+    @_resource_loader("status_data_json")
     def load_status_data(self):
-        file_path = os.path.join(self.resource_folder_json, "status.json")
-        with open(file_path, encoding="utf8") as f:
-            self.status_data_json = json.load(f)
+        self.status_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "status.json"))
 
+    @_resource_loader("devour_data_json")
     def load_devour_data(self):
-        file_path = os.path.join(self.resource_folder_json, "devour.json")
-        with open(file_path, encoding="utf8") as f:
-            self.devour_data_json = json.load(f)
+        self.devour_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "devour.json"))
 
+    @_resource_loader("camera_category_data_json")
     def load_camera_category_data(self):
-        file_path = os.path.join(self.resource_folder_json, "camera_category.json")
-        with open(file_path, encoding="utf8") as f:
-            self.camera_category_data_json = json.load(f)
+        self.camera_category_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "camera_category.json"))
 
+    @_resource_loader("devour_category_data_json")
     def load_devour_category_data(self):
-        file_path = os.path.join(self.resource_folder_json, "devour_category.json")
-        with open(file_path, encoding="utf8") as f:
-            self.devour_category_data_json = json.load(f)
+        self.devour_category_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "devour_category.json"))
 
+    @_resource_loader("field_data_json")
     def load_field_data(self):
-        file_path = os.path.join(self.resource_folder_json, "field.json")
-        with open(file_path, encoding="utf8") as f:
-            self.field_data_json = json.load(f)
+        self.field_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "field.json"))
 
+    @_resource_loader("enemy_abilities_data_json")
     def load_enemy_abilities_data(self):
-        file_path = os.path.join(self.resource_folder_json, "enemy_abilities.json")
-        with open(file_path, encoding="utf8") as f:
-            self.enemy_abilities_data_json = json.load(f)
+        self.enemy_abilities_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "enemy_abilities.json"))
 
+    @_resource_loader("magic_data_json")
     def load_magic_data(self):
-        file_path = os.path.join(self.resource_folder_json, "magic.json")
-        with open(file_path, encoding="utf8") as f:
-            self.magic_data_json = json.load(f)
+        self.magic_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "magic.json"))
 
+    @_resource_loader("attack_animation_data_json")
     def load_attack_animation_data(self):
-        file_path = os.path.join(self.resource_folder_json, "attack_animation.json")
-        with open(file_path, encoding="utf8") as f:
-            self.attack_animation_data_json = json.load(f)
+        self.attack_animation_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "attack_animation.json"))
 
+    @_resource_loader("monster_data_json")
     def load_monster_data(self):
-        file_path = os.path.join(self.resource_folder_json, "monster.json")
-        with open(file_path, encoding="utf8") as f:
-            self.monster_data_json = json.load(f)
+        self.monster_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "monster.json"))
 
+    @_resource_loader("sysfnt_data_json")
     def load_sysfnt_data(self):
-        file_path = os.path.join(self.resource_folder_json, "sysfnt_data.json")
-        with open(file_path, encoding="utf8") as f:
-            self.sysfnt_data_json = json.load(f)
+        self.sysfnt_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "sysfnt_data.json"))
+        self.__init_sysfnt_tag_table()
+
+    def __init_sysfnt_tag_table(self):
+        """
+        Reverse of the sysfnt names, giving the bytes of a {tag}.
+        When a name is in several lists, the first list (in the order below) wins, then the first index in the list.
+        """
+        tag_dict = {}
+        for index_list, name in enumerate(self.sysfnt_data_json.get('Characters', [])):  # {name}
+            if index_list < 11:
+                tag_dict.setdefault(name, [0x03, 0x30 + index_list])
+            elif index_list == 11:
+                tag_dict.setdefault(name, [0x03, 0x40])
+            elif index_list == 12:
+                tag_dict.setdefault(name, [0x03, 0x50])
+            elif index_list == 13:
+                tag_dict.setdefault(name, [0x03, 0x60])
+            else:
+                tag_dict.setdefault(name, [])
+        for key, first_byte, first_value in (('Icons', 0x05, 0x20), ('Colors', 0x06, 0x20), ('GuardianForce', 0x0c, 0x60),
+                                             ('Locations', 0x0e, 0x20)):
+            for index_list, name in enumerate(self.sysfnt_data_json.get(key, [])):
+                tag_dict.setdefault(name, [first_byte, first_value + index_list])
+        # {SpecialValue} 0x0a, keys are "0x0aXX".
+        # Note: the raw form {x0aXX} still encodes via the generic 'x' branch (backward compatible).
+        for code_str, name in self.sysfnt_data_json.get('SpecialValues', {}).items():
+            tag_dict.setdefault(name, [0x0a, int(code_str[-2:], 16)])
+        self.sysfnt_tag_to_hex_dict = tag_dict
 
+    @_resource_loader("item_data_json")
     def load_item_data(self):
-        file_path = os.path.join(self.resource_folder_json, "item.json")
-        with open(file_path, encoding="utf8") as f:
-            self.item_data_json = json.load(f)
+        self.item_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "item.json"))
 
+    @_resource_loader("mitem_data_json")
     def load_mitem_data(self):
-        file_path = os.path.join(self.resource_folder_json, "mitem.json")
-        with open(file_path, encoding="utf8") as f:
-            self.mitem_data_json = json.load(f)
+        self.mitem_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "mitem.json"))
 
+    @_resource_loader("draw_data_json")
     def load_draw_data(self):
-        file_path = os.path.join(self.resource_folder_json, "draw.json")
-        with open(file_path, encoding="utf8") as f:
-            self.draw_data_json = json.load(f)
+        self.draw_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "draw.json"))
 
+    @_resource_loader("exe_data_json")
     def load_exe_data(self):
-        file_path = os.path.join(self.resource_folder_json, "exe.json")
-        with open(file_path, encoding="utf8") as f:
-            self.exe_data_json = json.load(f)
-        for key in self.exe_data_json["lang"]:
-            if self.exe_data_json["lang"][key]:
-                self.exe_data_json["lang"][key] = int(
-                    self.exe_data_json["lang"][key], 16)
-        for key in self.exe_data_json["card_data_offset"]:
-            self.exe_data_json["card_data_offset"][key] = int(self.exe_data_json["card_data_offset"][key], 16)
-        for key in self.exe_data_json["scan_data_offset"]:
-            self.exe_data_json["scan_data_offset"][key] = int(self.exe_data_json["scan_data_offset"][key], 16)
-        for key in self.exe_data_json["draw_text_offset"]:
-            self.exe_data_json["draw_text_offset"][key] = int(self.exe_data_json["draw_text_offset"][key], 16)
-        for key in self.exe_data_json["draw_data_offset"]:
-            self.exe_data_json["draw_data_offset"][key] = int(self.exe_data_json["draw_data_offset"][key], 16)
+        self.exe_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "exe.json"), GameData._convert_exe_data)
 
+    @staticmethod
+    def _convert_exe_data(exe_data_json):
+        """Hex offsets of exe.json to int"""
+        for key in exe_data_json["lang"]:
+            if exe_data_json["lang"][key]:
+                exe_data_json["lang"][key] = int(
+                    exe_data_json["lang"][key], 16)
+        for key in exe_data_json["card_data_offset"]:
+            exe_data_json["card_data_offset"][key] = int(exe_data_json["card_data_offset"][key], 16)
+        for key in exe_data_json["scan_data_offset"]:
+            exe_data_json["scan_data_offset"][key] = int(exe_data_json["scan_data_offset"][key], 16)
+        for key in exe_data_json["draw_text_offset"]:
+            exe_data_json["draw_text_offset"][key] = int(exe_data_json["draw_text_offset"][key], 16)
+        for key in exe_data_json["draw_data_offset"]:
+            exe_data_json["draw_data_offset"][key] = int(exe_data_json["draw_data_offset"][key], 16)
+
+    @_resource_loader("anim_sequence_data_json")
     def load_anim_sequence_data(self):
-        file_path = os.path.join(self.resource_folder_json, "anim_sequence_info.json")
-        with open(file_path, encoding="utf8") as f:
-            self.anim_sequence_data_json = json.load(f)
-        for i, el in enumerate(self.anim_sequence_data_json["op_code_info"]):
+        self.anim_sequence_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "anim_sequence_info.json"), GameData._convert_anim_sequence_data)
+
+    @staticmethod
+    def _convert_anim_sequence_data(anim_sequence_data_json):
+        """Hex op codes and param ids of anim_sequence_info.json to int"""
+        for i, el in enumerate(anim_sequence_data_json["op_code_info"]):
             if el["op_code"]:
-                self.anim_sequence_data_json["op_code_info"][i]["op_code"] = int(self.anim_sequence_data_json["op_code_info"][i]["op_code"], 16)
-        for i, el in enumerate(self.anim_sequence_data_json["special_change_current_value_params"]):
+                anim_sequence_data_json["op_code_info"][i]["op_code"] = int(anim_sequence_data_json["op_code_info"][i]["op_code"], 16)
+        for i, el in enumerate(anim_sequence_data_json["special_change_current_value_params"]):
             if el["param_id"]:
-                self.anim_sequence_data_json["special_change_current_value_params"][i]["param_id"] = int(
-                    self.anim_sequence_data_json["special_change_current_value_params"][i]["param_id"], 16)
-        for i, el in enumerate(self.anim_sequence_data_json["e5_special_params"]):
+                anim_sequence_data_json["special_change_current_value_params"][i]["param_id"] = int(
+                    anim_sequence_data_json["special_change_current_value_params"][i]["param_id"], 16)
+        for i, el in enumerate(anim_sequence_data_json["e5_special_params"]):
             if el["param_id"]:
-                self.anim_sequence_data_json["e5_special_params"][i]["param_id"] = int(self.anim_sequence_data_json["e5_special_params"][i]["param_id"], 16)
-        for i, el in enumerate(self.anim_sequence_data_json["effect_id"]):
+                anim_sequence_data_json["e5_special_params"][i]["param_id"] = int(anim_sequence_data_json["e5_special_params"][i]["param_id"], 16)
+        for i, el in enumerate(anim_sequence_data_json["effect_id"]):
             if el["param_id"]:
-                self.anim_sequence_data_json["effect_id"][i]["param_id"] = int(self.anim_sequence_data_json["effect_id"][i]["param_id"], 16)
-        for i, el in enumerate(self.anim_sequence_data_json["fade_effect_id"]):
+                anim_sequence_data_json["effect_id"][i]["param_id"] = int(anim_sequence_data_json["effect_id"][i]["param_id"], 16)
+        for i, el in enumerate(anim_sequence_data_json["fade_effect_id"]):
             if el["param_id"]:
-                self.anim_sequence_data_json["fade_effect_id"][i]["param_id"] = int(self.anim_sequence_data_json["fade_effect_id"][i]["param_id"], 16)
-        for i, el in enumerate(self.anim_sequence_data_json["sound_channel_flag"]):
+                anim_sequence_data_json["fade_effect_id"][i]["param_id"] = int(anim_sequence_data_json["fade_effect_id"][i]["param_id"], 16)
+        for i, el in enumerate(anim_sequence_data_json["sound_channel_flag"]):
             if el["param_id"]:
-                self.anim_sequence_data_json["sound_channel_flag"][i]["param_id"] = int(self.anim_sequence_data_json["sound_channel_flag"][i]["param_id"], 16)
-        for i, el in enumerate(self.anim_sequence_data_json["sound_id_from_category"]):
+                anim_sequence_data_json["sound_channel_flag"][i]["param_id"] = int(anim_sequence_data_json["sound_channel_flag"][i]["param_id"], 16)
+        for i, el in enumerate(anim_sequence_data_json["sound_id_from_category"]):
             if el["param_id"]:
-                self.anim_sequence_data_json["sound_id_from_category"][i]["param_id"] = int(self.anim_sequence_data_json["sound_id_from_category"][i]["param_id"], 16)
+                anim_sequence_data_json["sound_id_from_category"][i]["param_id"] = int(anim_sequence_data_json["sound_id_from_category"][i]["param_id"], 16)
 
+    @_resource_loader("mngrp_data_json")
     def load_mngrp_data(self):
-        file_path = os.path.join(self.resource_folder_json, "mngrp_bin_data.json")
-        with open(file_path, encoding="utf8") as f:
-            self.mngrp_data_json = json.load(f)
-        for i in range(len(self.mngrp_data_json["sections"])):
-            if self.mngrp_data_json["sections"][i]["section_offset"]:
-                self.mngrp_data_json["sections"][i]["section_offset"] = int(
-                    self.mngrp_data_json["sections"][i]["section_offset"], 16)
-            if self.mngrp_data_json["sections"][i]["size"]:
-                self.mngrp_data_json["sections"][i]["size"] = int(
-                    self.mngrp_data_json["sections"][i]["size"], 16)
-            data_type_str = self.mngrp_data_json["sections"][i]["data_type"]
+        self.mngrp_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "mngrp_bin_data.json"), GameData._convert_mngrp_data)
+
+    @staticmethod
+    def _convert_mngrp_data(mngrp_data_json):
+        """Hex offsets and sizes of mngrp_bin_data.json to int, data types to SectionType"""
+        for i in range(len(mngrp_data_json["sections"])):
+            if mngrp_data_json["sections"][i]["section_offset"]:
+                mngrp_data_json["sections"][i]["section_offset"] = int(
+                    mngrp_data_json["sections"][i]["section_offset"], 16)
+            if mngrp_data_json["sections"][i]["size"]:
+                mngrp_data_json["sections"][i]["size"] = int(
+                    mngrp_data_json["sections"][i]["size"], 16)
+            data_type_str = mngrp_data_json["sections"][i]["data_type"]
             if data_type_str == "tkmnmes":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.TKMNMES
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.TKMNMES
             elif data_type_str == "mngrp_string":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_STRING
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_STRING
             elif data_type_str == "data":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.DATA
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.DATA
             elif data_type_str == "text":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.FF8_TEXT
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.FF8_TEXT
             elif data_type_str == "mngrp_complex_string":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_TEXTBOX
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_TEXTBOX
             elif data_type_str == "mngrp_map_complex_string":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_MAP_COMPLEX_STRING
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_MAP_COMPLEX_STRING
             elif data_type_str == "m00bin":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_M00BIN
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_M00BIN
             elif data_type_str == "m00msg":
-                self.mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_M00MSG
+                mngrp_data_json["sections"][i]["data_type"] = SectionType.MNGRP_M00MSG
 
+    @_resource_loader("kernel_data_json")
     def load_kernel_data(self):
-        file_path = os.path.join(self.resource_folder_json, "kernel_bin_data.json")
-        with open(file_path, encoding="utf8") as f:
-            self.kernel_data_json = json.load(f)
-
-        for i in range(len(self.kernel_data_json["sections"])):
-            if self.kernel_data_json["sections"][i]["section_offset"]:
-                self.kernel_data_json["sections"][i]["section_offset"] = int(
-                    self.kernel_data_json["sections"][i]["section_offset"], 16)
-            if self.kernel_data_json["sections"][i]["section_offset_text_linked"]:
-                self.kernel_data_json["sections"][i]["section_offset_text_linked"] = int(
-                    self.kernel_data_json["sections"][i]["section_offset_text_linked"], 16)
-            if self.kernel_data_json["sections"][i]["section_offset_data_linked"]:
-                self.kernel_data_json["sections"][i]["section_offset_data_linked"] = int(
-                    self.kernel_data_json["sections"][i]["section_offset_data_linked"], 16)
-            data_type_str = self.kernel_data_json["sections"][i]["type"]
+        self.kernel_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "kernel_bin_data.json"), GameData._convert_kernel_data)
+
+    @staticmethod
+    def _convert_kernel_data(kernel_data_json):
+        """Hex offsets of kernel_bin_data.json to int, types to SectionType"""
+        for i in range(len(kernel_data_json["sections"])):
+            if kernel_data_json["sections"][i]["section_offset"]:
+                kernel_data_json["sections"][i]["section_offset"] = int(
+                    kernel_data_json["sections"][i]["section_offset"], 16)
+            if kernel_data_json["sections"][i]["section_offset_text_linked"]:
+                kernel_data_json["sections"][i]["section_offset_text_linked"] = int(
+                    kernel_data_json["sections"][i]["section_offset_text_linked"], 16)
+            if kernel_data_json["sections"][i]["section_offset_data_linked"]:
+                kernel_data_json["sections"][i]["section_offset_data_linked"] = int(
+                    kernel_data_json["sections"][i]["section_offset_data_linked"], 16)
+            data_type_str = kernel_data_json["sections"][i]["type"]
             if data_type_str == "data":
-                self.kernel_data_json["sections"][i]["type"] = SectionType.DATA
+                kernel_data_json["sections"][i]["type"] = SectionType.DATA
             elif data_type_str == "text":
-                self.kernel_data_json["sections"][i]["type"] = SectionType.FF8_TEXT
+                kernel_data_json["sections"][i]["type"] = SectionType.FF8_TEXT
 
+    @_resource_loader("card_data_json")
     def load_card_data(self):
-        file_path = os.path.join(self.resource_folder_json, "card.json")
-        with open(file_path, encoding="utf8") as f:
-            self.card_data_json = json.load(f)
-        self.__load_cards()
+        self.card_data_json = GameData.read_json_resource(os.path.join(self.resource_folder_json, "card.json"))
 
-    def __load_cards(self):
+    def get_card_image(self, card_info: dict, image_type: str = "img") -> Image.Image:
+        """
+        Give the image of a card, its sheet being decoded on first use
+        :param card_info: The card, from card_data_json["card_info"]
+        :param image_type: "img" (64x64 original), "img_remaster" or "img_xylomod" (256x256)
+        :return: The tile of the card. Shared by all callers (cached), to copy before modifying it.
+        """
+        sheet_name, tile_size = self.CARD_SHEET_DICT[image_type]
+        return self.__get_card_tile(sheet_name, tile_size, card_info["img_x"], card_info["img_y"])
+
+    def get_card_type_image(self, card_type: dict) -> Image.Image:
+        """
+        :param card_type: The elemental type, from card_data_json["card_type"]
+        :return: The 128x128 icon of the type, shared by all callers (cached)
+        """
+        sheet_name, tile_size = self.CARD_SHEET_DICT["card_type"]
+        return self.__get_card_tile(sheet_name, tile_size, card_type["img_x"], card_type["img_y"])
+
+    def __get_card_tile(self, sheet_name, tile_size, img_x, img_y):
         # Thank you Maki !
-        img = Image.open(os.path.join(self.resource_folder_image, "text_0.png"))
-        TILES_WIDTH_EL = 128
-        TILES_HEIGHT_EL = 128
-        for i, list_el in enumerate(self.card_data_json["card_type"]):
-            # Calculate the bounding box of the tile
-            left = list_el["img_x"] * TILES_WIDTH_EL
-            upper = list_el["img_y"] * TILES_HEIGHT_EL
-            right = left + TILES_WIDTH_EL
-            lower = upper + TILES_HEIGHT_EL
-            # Extract the tile using cropping
-            tile = img.crop((left, upper, right, lower))
-            self.card_data_json["card_type"][i]["img"] = tile
-
-        img = Image.open(os.path.join(self.resource_folder_image, "cards_00.png"))
-        img_remaster = Image.open(os.path.join(self.resource_folder_image, "cards_00_remaster.png"))
-        img_xylomod = Image.open(os.path.join(self.resource_folder_image, "cards_00_xylomod.png"))
-
-        TILES_WIDTH = 64
-        TILES_HEIGHT = 64
-        for i, list_el in enumerate(self.card_data_json["card_info"]):
-            # Calculate the bounding box of the tile
-            left = list_el["img_x"] * TILES_WIDTH
-            upper = list_el["img_y"] * TILES_HEIGHT
-            right = left + TILES_WIDTH
-            lower = upper + TILES_HEIGHT
-            # Extract the tile using cropping
-            tile = img.crop((left, upper, right, lower))
-            self.card_data_json["card_info"][i]["img"] = tile
-
-        TILES_WIDTH = 256
-        TILES_HEIGHT = 256
-        for i, list_el in enumerate(self.card_data_json["card_info"]):
-            # Calculate the bounding box of the tile
-            left = list_el["img_x"] * TILES_WIDTH
-            upper = list_el["img_y"] * TILES_HEIGHT
-            right = left + TILES_WIDTH
-            lower = upper + TILES_HEIGHT
-            # Extract the tile using cropping
-            tile_remaster = img_remaster.crop((left, upper, right, lower))
-            self.card_data_json["card_info"][i]["img_remaster"] = tile_remaster
-
-        TILES_WIDTH = 256
-        TILES_HEIGHT = 256
-        for i, list_el in enumerate(self.card_data_json["card_info"]):
-            # Calculate the bounding box of the tile
-            left = list_el["img_x"] * TILES_WIDTH
-            upper = list_el["img_y"] * TILES_HEIGHT
-            right = left + TILES_WIDTH
-            lower = upper + TILES_HEIGHT
-            # Extract the tile using cropping
-            tile_xylomod = img_xylomod.crop((left, upper, right, lower))
-            self.card_data_json["card_info"][i]["img_xylomod"] = tile_xylomod
+        key = (sheet_name, img_x, img_y)
+        tile = self.__card_tile_cache.get(key)
+        if tile is not None:
+            self.__card_tile_cache.move_to_end(key)
+            return tile
+        sheet = self.__card_sheet_dict.get(sheet_name)
+        if sheet is None:
+            sheet = Image.open(os.path.join(self.resource_folder_image, sheet_name))
+            sheet.load()
+            self.__card_sheet_dict[sheet_name] = sheet
+        left = img_x * tile_size
+        upper = img_y * tile_size
+        tile = sheet.crop((left, upper, left + tile_size, upper + tile_size))
+        self.__card_tile_cache[key] = tile
+        if len(self.__card_tile_cache) > self.CARD_TILE_CACHE_SIZE:
+            self.__card_tile_cache.popitem(last=False)
+        return tile
 
     def translate_str_to_hex(self, string):
         c = 0
         str_size = len(string)
         encode_list = []
         while c < str_size:
+            # Plain text up to the next special character, encoded in one step
+            special_char = self.SPECIAL_CHAR_PATTERN.search(string, c)
+            run_end = special_char.start() if special_char else str_size
+            if run_end > c:
+                self.__encode_plain_text(string[c:run_end], encode_list)
+                c = run_end
+                continue
             char = string[c]
             if char == '\\':
                 encode_list.append(0x02)
@@ -415,39 +558,12 @@ class GameData:
                     c += 1
                 continue
             elif char == '{':
-                rest = string[c + 1:]
-                index_next_bracket = rest.find('}')
+                index_next_bracket = string.find('}', c + 1)
                 if index_next_bracket != -1:
-                    substring = rest[:index_next_bracket]
-                    if substring in self.sysfnt_data_json['Characters']:  # {name}
-                        index_list = self.sysfnt_data_json['Characters'].index(substring)
-                        if index_list < 11:
-                            encode_list.extend([0x03, 0x30 + index_list])
-                        elif index_list == 11:
-                            encode_list.extend([0x03, 0x40])
-                        elif index_list == 12:
-                            encode_list.extend([0x03, 0x50])
-                        elif index_list == 13:
-                            encode_list.extend([0x03, 0x60])
-                    elif substring in self.sysfnt_data_json['Icons']:  # {Icons}
-                        index_list = self.sysfnt_data_json['Icons'].index(substring)
-                        encode_list.extend([0x05, 0x20 + index_list])
-                    elif substring in self.sysfnt_data_json['Colors']:  # {Color}
-                        index_list = self.sysfnt_data_json['Colors'].index(substring)
-                        encode_list.extend([0x06, 0x20 + index_list])
-                    elif substring in self.sysfnt_data_json['GuardianForce']:  # {GuardianForce}
-                        index_list = self.sysfnt_data_json['GuardianForce'].index(substring)
-                        encode_list.extend([0x0c, 0x60 + index_list])
-                    elif substring in self.sysfnt_data_json['Locations']:  # {Location}
-                        index_list = self.sysfnt_data_json['Locations'].index(substring)
-                        encode_list.extend([0x0e, 0x20 + index_list])
-                    elif substring in self.sysfnt_data_json.get('SpecialValues', {}).values():  # {SpecialValue} 0x0a
-                        # Reverse-lookup the code from the name; keys are "0x0aXX".
-                        # Note: the raw form {x0aXX} still encodes via the generic 'x' branch below (backward compatible).
-                        for code_str, name in self.sysfnt_data_json['SpecialValues'].items():
-                            if name == substring:
-                                encode_list.extend([0x0a, int(code_str[-2:], 16)])
-                                break
+                    substring = string[c + 1:index_next_bracket]
+                    tag_encoded = self.sysfnt_tag_to_hex_dict.get(substring)
+                    if tag_encoded is not None:  # {name}, {Icons}, {Color}, {GuardianForce}, {Location}, {SpecialValue}
+                        encode_list.extend(tag_encoded)
                     elif 'Cursor_location_id:0x' in substring:
                         len_curs = len('Cursor_location_id:0x')
                         if len(substring) == len_curs + 4:
@@ -466,185 +582,363 @@ class GameData:
                         encode_list.extend([0x09, int(substring[-1]) + 0x20])
                     elif 'Jp' in substring:  # {Jp000}
                         encode_list.extend([0x1c, int(substring[-1]) + 0x20])
-                    elif '{' + substring + '}' in self.translate_hex_to_str_table:  # {} at end of sysfnt
-                        encode_list.append(self.translate_hex_to_str_table.index('{' + substring + '}'))
+                    elif '{' + substring + '}' in self.translate_str_to_hex_dict:  # {} at end of sysfnt
+                        encode_list.append(self.translate_str_to_hex_dict['{' + substring + '}'])
                     elif 'x' in substring and len(substring) == 5:  # {xffff}
                         encode_list.extend([int(substring[1:3], 16), int(substring[3:5], 16)])
                     elif 'x' in substring and len(substring) == 3:  # {xff}
                         encode_list.append(int(substring[1:3], 16))
                     c += len(substring) + 2  # +2 for the {}
                     continue
-            if self.jp_encoding:
-                jp_encoded = self.encode_jp_char(char)
-                if jp_encoded is not None:
-                    encode_list.extend(jp_encoded)
-                    c += 1
-                    continue
-            encode_list.append(self.translate_hex_to_str_table.index(char))
+            self.__encode_plain_text(char, encode_list)
             c += 1
         return encode_list
 
+    def __encode_plain_text(self, text, encode_list):
+        """Encode text without any special character, a character unknown to the tables raising a ValueError"""
+        str_to_hex_dict = self.translate_str_to_hex_dict
+        try:
+            if self.jp_encoding and self.jp_str_to_hex_dict:
+                for char in text:
+                    jp_encoded = self.jp_str_to_hex_dict.get(char)
+                    if jp_encoded is not None:
+                        encode_list.extend(jp_encoded)
+                    else:
+                        encode_list.append(str_to_hex_dict[char])
+            else:
+                encode_list.extend([str_to_hex_dict[char] for char in text])
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]!r} is not in list") from None
+
     def translate_hex_to_str(self, hex_list, zero_as_slash_n=False, first_hex_literal=False, cursor_location_size=2):
-        build_str = ""
-        i = 0
+        """
+        Decode FF8 text bytes to a string
+        The printable bytes (0x20-0xFF) are decoded by runs through a 256 entries table, and each control byte
+        (0x00-0x1F) is decoded by its own function, reading the bytes following it.
+        :param hex_list: The bytes, as bytes, bytearray or list of int
+        :param zero_as_slash_n: If True, 0x00 is written as a line break, else it is ignored
+        :param first_hex_literal: If True, the first byte is written as {xXX} whatever its value
+        :param cursor_location_size: The size of the {Cursor_location_id} code (2 or 3 bytes)
+        :return: The string
+        """
+        str_list = []
         hex_size = len(hex_list)
+        i = 0
+        if first_hex_literal and hex_size > 0:
+            str_list.append("{{x{:02x}}}".format(hex_list[0]))
+            i = 1
+        try:
+            hex_bytes = hex_list if isinstance(hex_list, (bytes, bytearray)) else bytes(hex_list)
+        except (ValueError, TypeError):  # Not only bytes, kept for the index errors of the table
+            hex_bytes = None
+        char_list = self.jp_hex_to_str_char_list if self.jp_encoding else self.hex_to_str_char_list
+        decode_control_list = self.__decode_control_list
         while i < hex_size:
             hex_val = hex_list[i]
-            if i == 0 and first_hex_literal:
-                build_str += "{{x{:02x}}}".format(hex_val)
-            elif hex_val == 0x00 and zero_as_slash_n:
-                build_str += "\n"
-            elif hex_val == 0x00:
-                pass
-            elif hex_val in [0x01, 0x02]:
-                build_str += self.translate_hex_to_str_table[hex_val]
-            elif hex_val == 0x03:  # {Name}
+            if hex_val < 0x20:
+                text, i = decode_control_list[hex_val](self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size)
+                str_list.append(text)
                 i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x30 and hex_val <= 0x3a:
-                        build_str += '{' + self.sysfnt_data_json['Characters'][hex_val - 0x30] + '}'
-                    elif hex_val == 0x40:
-                        build_str += '{' + self.sysfnt_data_json['Characters'][11] + '}'
-                    elif hex_val == 0x50:
-                        build_str += '{' + self.sysfnt_data_json['Characters'][12] + '}'
-                    elif hex_val == 0x60:
-                        build_str += '{' + self.sysfnt_data_json['Characters'][13] + '}'
-                    else:
-                        build_str += "{{x03{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x03}"
-            elif hex_val == 0x04:  # {Var0}, {Var00} et {Varb0}
+            elif hex_bytes is not None:
+                control_byte = self.CONTROL_BYTE_PATTERN.search(hex_bytes, i)
+                run_end = control_byte.start() if control_byte else hex_size
+                str_list.append(''.join([char_list[hex_val] for hex_val in hex_bytes[i:run_end]]))
+                i = run_end
+            else:
+                str_list.append(char_list[hex_val])
                 i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x20 and i <= 0x27:
-                        build_str += "{{Var{:02x}}}".format(hex_val - 0x20)
-                    elif hex_val >= 0x30 and i <= 0x37:
-                        build_str += "{{Var0{:02x}}}".format(hex_val - 0x30)
-                    elif hex_val >= 0x40 and i <= 0x47:
-                        build_str += "{{Varb{:02x}}}".format(hex_val - 0x40)
-                    else:
-                        build_str += "{{x04{:02x}}}".format(hex_val)
+        return ''.join(str_list)
 
-                else:
-                    build_str += "{x04}"
-            elif hex_val == 0x05:  # {Icons}
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x20 and hex_val <= 0x5d:
-                        build_str += '{' + self.sysfnt_data_json['Icons'][hex_val - 0x20] + '}'
-                    else:
-                        build_str += "{{x05{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x05}"
-            elif hex_val == 0x06:  # {Color}
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x20 and hex_val <= 0x2f:
-                        build_str += '{' + self.sysfnt_data_json['Colors'][hex_val - 0x20] + '}'
-                    else:
-                        build_str += "{{x06{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x06}"
-            elif hex_val == 0x09:  # {Wait000}
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x20:
-                        build_str += "{{Wait{:03}}}".format(hex_val - 0x20)
-                    else:
-                        build_str += "{{x09{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x06}"
-            elif hex_val == 0x0a:  # {SpecialValue} - context-specific value insert (see FF8Char wiki)
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    special_values = self.sysfnt_data_json.get('SpecialValues', {})
-                    key = "0x0a{:02x}".format(hex_val)
-                    if key in special_values:
-                        build_str += '{' + special_values[key] + '}'
-                    else:
-                        build_str += "{{x0a{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x0a}"
-            elif hex_val == 0x0b:  # {cursor_location}
-                i += 1
-                if i < hex_size:
-                    if cursor_location_size == 2:
-                        hex_val = hex_list[i]
-                        build_str += "{{Cursor_location_id:0x{:02x}}}".format(hex_val)
-                    if cursor_location_size == 3:
-                        hex_val1 = hex_list[i]
-                        i += 1
-                        hex_val2 = hex_list[i]
-                        build_str += "{{Cursor_location_id:0x{:02x}{:02x}}}".format(hex_val1, hex_val2)
-                else:
-                    build_str += "{x0b}"
-            elif hex_val == 0x0c:  # {GuardianForce}
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x60 and hex_val <= 0x6f:
-                        build_str += '{' + self.sysfnt_data_json['GuardianForce'][hex_val - 0x60] + '}'
-                    else:
-                        build_str += "{{x0c{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x0c}"
-            elif hex_val == 0x0e:  # {Location}
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if 0x20 <= hex_val < 0x20 + len(self.sysfnt_data_json['Locations']):
-                        build_str += '{' + self.sysfnt_data_json['Locations'][hex_val - 0x20] + '}'
-                    else:
-                        build_str += "{{x0e{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x0e}"
-            elif hex_val >= 0x19 and hex_val <= 0x1b:  # jp19, jp1a, jp1b: 2-byte, lead byte selects JP font table 1/2/3
-                i += 1
-                if i < hex_size:
-                    old_hex_val = hex_val
-                    hex_val = hex_list[i]
-                    character = None
-                    if self.jp_encoding and hex_val >= 0x20:
-                        character = self.caract_jp(hex_val, old_hex_val - 0x18)
-                    if not character:
-                        character = "{{x{:02x}{:02x}}}".format(old_hex_val, hex_val)
-                    build_str += character
-                else:
-                    build_str += "{{x{:02x}}}".format(hex_val)
-            elif hex_val == 0x1c:  # addJp
-                i += 1
-                if i < hex_size:
-                    hex_val = hex_list[i]
-                    if hex_val >= 0x20:
-                        build_str += "{{Jp{:03}}}".format(hex_val - 0x20)
-                    else:
-                        build_str += "{{x1c{:02x}}}".format(hex_val)
-                else:
-                    build_str += "{x1c}"
-            elif hex_val >= 0x03 and hex_val <= 0x1f:
-                i += 1
-                if i < hex_size:
-                    build_str += "{{x{:02x}{:02x}}}".format(hex_val, hex_list[i])
-                else:
-                    build_str += "{{x{:02x}}}".format(hex_val)
+    def encode_text_list(self, text_list: list[str], deduplicate=False) -> tuple[bytearray, list[int]]:
+        """
+        Encode a list of texts in one buffer, each text ending with a 0x00 (except the empty ones)
+        :param text_list: The texts
+        :param deduplicate: If True, the identical texts are written once, sharing the same offset
+        :return: The buffer and the offset of each text in it
+        """
+        data_hex_list = []
+        for text in text_list:
+            data_hex = bytearray(self.translate_str_to_hex(text))
+            if text:
+                data_hex.append(0x00)
+            data_hex_list.append(data_hex)
+        return GameData.pack_text_list(data_hex_list, deduplicate)
+
+    @staticmethod
+    def pack_text_list(data_hex_list: list, deduplicate=False) -> tuple[bytearray, list[int]]:
+        """
+        Concatenate encoded texts in one buffer
+        :param data_hex_list: The bytes of each text
+        :param deduplicate: If True, the identical texts are written once, sharing the same offset. An empty text or a
+        text identical to the previous one is still written, as two following texts with the same offset are read
+        back as an empty text then the text.
+        :return: The buffer and the offset of each text in it
+        """
+        packed_data = bytearray()
+        offset_list = []
+        offset_by_data = {}
+        for data_hex in data_hex_list:
+            data_hex = bytes(data_hex)
+            if (deduplicate and data_hex and data_hex in offset_by_data
+                    and not (offset_list and offset_by_data[data_hex] == offset_list[-1])):
+                offset_list.append(offset_by_data[data_hex])
+                continue
+            offset_by_data[data_hex] = len(packed_data)
+            offset_list.append(len(packed_data))
+            packed_data.extend(data_hex)
+        return packed_data, offset_list
+
+    @staticmethod
+    def split_text_list(data_hex, offset_list: list[int]) -> list:
+        """
+        Cut the bytes of each text of a buffer
+        A text goes from its offset to the closest offset after it (the offsets can be shared or unordered). The one
+        with the greatest offset goes to the first 0x00 after its first byte when it is the last of the list, its end
+        being unknown, else to the end of the buffer. A text with the same offset as the next one is empty, as is a
+        text with an offset out of the buffer (0xFFFF for an unused text).
+        :param data_hex: The buffer, as bytes or bytearray
+        :param offset_list: The offset of each text in the buffer
+        :return: The bytes of each text, the texts sharing an offset sharing the same bytes
+        """
+        data_size = len(data_hex)
+        sorted_offset_list = sorted(set(offset for offset in offset_list if offset < data_size))
+        end_offset_by_offset = dict(zip(sorted_offset_list, sorted_offset_list[1:]))
+        if sorted_offset_list:
+            end_offset = -1
+            if offset_list[-1] == sorted_offset_list[-1]:
+                end_offset = data_hex.find(b'\x00', sorted_offset_list[-1] + 1)
+            end_offset_by_offset[sorted_offset_list[-1]] = end_offset if end_offset != -1 else data_size
+        text_hex_by_offset = {}
+        text_hex_list = []
+        for i, offset in enumerate(offset_list):
+            if offset not in end_offset_by_offset or (i < len(offset_list) - 1 and offset_list[i + 1] == offset):
+                text_hex_list.append(data_hex[0:0])
+                continue
+            if offset not in text_hex_by_offset:
+                text_hex_by_offset[offset] = data_hex[offset:end_offset_by_offset[offset]]
+            text_hex_list.append(text_hex_by_offset[offset])
+        return text_hex_list
+
+    def decode_text_list(self, data_hex, offset_list: list[int], cursor_location_size=2, first_hex_literal=False) -> list[str]:
+        """
+        Decode the texts of a buffer, the reverse of encode_text_list
+        The texts are cut by split_text_list, as read by ListFF8Text.init_text, each text being decoded once.
+        :param data_hex: The buffer
+        :param offset_list: The offset of each text in the buffer
+        :param cursor_location_size: The size of the {Cursor_location_id} code (2 or 3 bytes)
+        :param first_hex_literal: If True, the first byte of each text is written as {xXX}
+        :return: The text of each offset
+        """
+        text_by_offset = {}
+        text_list = []
+        for offset, text_hex in zip(offset_list, GameData.split_text_list(data_hex, offset_list)):
+            if not text_hex:
+                text_list.append("")
+                continue
+            if offset not in text_by_offset:
+                text_hex = self.remove_text_zero(text_hex, cursor_location_size=cursor_location_size,
+                                                 first_hex_literal=first_hex_literal)
+                text_by_offset[offset] = self.translate_hex_to_str(text_hex, cursor_location_size=cursor_location_size,
+                                                                   first_hex_literal=first_hex_literal)
+            text_list.append(text_by_offset[offset])
+        return text_list
+
+    def remove_text_zero(self, hex_list, cursor_location_size=2, first_hex_literal=False) -> bytearray:
+        """
+        Remove the 0x00 of FF8 text bytes, as decoding them then encoding the text does, without going through the
+        text. The 0x00 being the argument of a control byte (like {x0400}) are kept.
+        :param hex_list: The bytes, as bytes, bytearray or list of int
+        :param cursor_location_size: The size of the {Cursor_location_id} code (2 or 3 bytes)
+        :param first_hex_literal: If True, the first byte is kept whatever its value
+        :return: The bytes without their 0x00
+        """
+        hex_bytes = bytes(hex_list)
+        if not first_hex_literal:  # Most texts only have their ending 0x00, not being the argument of a control byte
+            text_bytes = hex_bytes.rstrip(b'\x00')
+            if (0x00 not in text_bytes and (not text_bytes or text_bytes[-1] >= 0x20 or text_bytes[-1] in (0x01, 0x02))
+                    and not (cursor_location_size == 3 and len(text_bytes) >= 2 and text_bytes[-2] == 0x0b)):
+                return bytearray(text_bytes)
+        hex_size = len(hex_bytes)
+        stripped = bytearray()
+        i = 0
+        if first_hex_literal and hex_size > 0:
+            stripped.append(hex_bytes[0])
+            i = 1
+        while i < hex_size:
+            control_byte = self.CONTROL_BYTE_PATTERN.search(hex_bytes, i)
+            if not control_byte:
+                stripped.extend(hex_bytes[i:])
+                break
+            control_index = control_byte.start()
+            stripped.extend(hex_bytes[i:control_index])
+            hex_val = hex_bytes[control_index]
+            if hex_val in (0x00, 0x01, 0x02):  # No argument
+                arg_size = 0
+            elif hex_val == 0x0b and cursor_location_size == 3:
+                arg_size = 2
             else:
-                character = None
-                if self.jp_encoding:  # printable byte 0x20-0xFF => JP font table 0
-                    character = self.caract_jp(hex_val, 0)
-                if character is None:
-                    character = self.translate_hex_to_str_table[hex_val]
-                if not character:
-                    character = "{{x{:02x}}}".format(hex_val)
-                build_str += character
-            i += 1
-
-        return build_str
+                arg_size = 1
+            if hex_val != 0x00:
+                stripped.extend(hex_bytes[control_index:control_index + 1 + arg_size])
+            i = control_index + 1 + arg_size
+        return stripped
+
+    @staticmethod
+    def __init_decode_control_list():
+        """
+        Function decoding each control byte (0x00-0x1F), giving the text and the index of the last byte read
+        The functions are not bound, so that a GameDataView decodes with its own jp_encoding.
+        """
+        decode_control_list = [GameData.__decode_unknown_control] * 0x20
+        decode_control_list[0x00] = GameData.__decode_end
+        decode_control_list[0x01] = GameData.__decode_line_break
+        decode_control_list[0x02] = GameData.__decode_line_break
+        decode_control_list[0x03] = GameData.__decode_character
+        decode_control_list[0x04] = GameData.__decode_var
+        decode_control_list[0x05] = GameData.__decode_icon
+        decode_control_list[0x06] = GameData.__decode_color
+        decode_control_list[0x09] = GameData.__decode_wait
+        decode_control_list[0x0a] = GameData.__decode_special_value
+        decode_control_list[0x0b] = GameData.__decode_cursor_location
+        decode_control_list[0x0c] = GameData.__decode_guardian_force
+        decode_control_list[0x0e] = GameData.__decode_location
+        decode_control_list[0x19] = GameData.__decode_jp_table
+        decode_control_list[0x1a] = GameData.__decode_jp_table
+        decode_control_list[0x1b] = GameData.__decode_jp_table
+        decode_control_list[0x1c] = GameData.__decode_add_jp
+        return decode_control_list
+
+    def __decode_end(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):
+        return ("\n" if zero_as_slash_n else ""), i
+
+    def __decode_line_break(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):
+        return self.translate_hex_to_str_table[hex_list[i]], i
+
+    def __decode_character(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {Name}
+        i += 1
+        if i >= hex_size:
+            return "{x03}", i
+        hex_val = hex_list[i]
+        if 0x30 <= hex_val <= 0x3a:
+            return '{' + self.sysfnt_data_json['Characters'][hex_val - 0x30] + '}', i
+        elif hex_val == 0x40:
+            return '{' + self.sysfnt_data_json['Characters'][11] + '}', i
+        elif hex_val == 0x50:
+            return '{' + self.sysfnt_data_json['Characters'][12] + '}', i
+        elif hex_val == 0x60:
+            return '{' + self.sysfnt_data_json['Characters'][13] + '}', i
+        return "{{x03{:02x}}}".format(hex_val), i
+
+    def __decode_var(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {Var0}, {Var00} et {Varb0}
+        i += 1
+        if i >= hex_size:
+            return "{x04}", i
+        hex_val = hex_list[i]
+        # The upper bound is checked on the position and not the value, kept as is to not change the decoded text
+        if hex_val >= 0x20 and i <= 0x27:
+            return "{{Var{:02x}}}".format(hex_val - 0x20), i
+        elif hex_val >= 0x30 and i <= 0x37:
+            return "{{Var0{:02x}}}".format(hex_val - 0x30), i
+        elif hex_val >= 0x40 and i <= 0x47:
+            return "{{Varb{:02x}}}".format(hex_val - 0x40), i
+        return "{{x04{:02x}}}".format(hex_val), i
+
+    def __decode_icon(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {Icons}
+        i += 1
+        if i >= hex_size:
+            return "{x05}", i
+        hex_val = hex_list[i]
+        if 0x20 <= hex_val <= 0x5d:
+            return '{' + self.sysfnt_data_json['Icons'][hex_val - 0x20] + '}', i
+        return "{{x05{:02x}}}".format(hex_val), i
+
+    def __decode_color(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {Color}
+        i += 1
+        if i >= hex_size:
+            return "{x06}", i
+        hex_val = hex_list[i]
+        if 0x20 <= hex_val <= 0x2f:
+            return '{' + self.sysfnt_data_json['Colors'][hex_val - 0x20] + '}', i
+        return "{{x06{:02x}}}".format(hex_val), i
+
+    def __decode_wait(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {Wait000}
+        i += 1
+        if i >= hex_size:
+            return "{x06}", i
+        hex_val = hex_list[i]
+        if hex_val >= 0x20:
+            return "{{Wait{:03}}}".format(hex_val - 0x20), i
+        return "{{x09{:02x}}}".format(hex_val), i
+
+    def __decode_special_value(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):
+        # {SpecialValue} - context-specific value insert (see FF8Char wiki)
+        i += 1
+        if i >= hex_size:
+            return "{x0a}", i
+        hex_val = hex_list[i]
+        special_values = self.sysfnt_data_json.get('SpecialValues', {})
+        key = "0x0a{:02x}".format(hex_val)
+        if key in special_values:
+            return '{' + special_values[key] + '}', i
+        return "{{x0a{:02x}}}".format(hex_val), i
+
+    def __decode_cursor_location(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):
+        i += 1
+        if i >= hex_size:
+            return "{x0b}", i
+        if cursor_location_size == 2:
+            return "{{Cursor_location_id:0x{:02x}}}".format(hex_list[i]), i
+        if cursor_location_size == 3:
+            return "{{Cursor_location_id:0x{:02x}{:02x}}}".format(hex_list[i], hex_list[i + 1]), i + 1
+        return "", i
+
+    def __decode_guardian_force(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {GuardianForce}
+        i += 1
+        if i >= hex_size:
+            return "{x0c}", i
+        hex_val = hex_list[i]
+        if 0x60 <= hex_val <= 0x6f:
+            return '{' + self.sysfnt_data_json['GuardianForce'][hex_val - 0x60] + '}', i
+        return "{{x0c{:02x}}}".format(hex_val), i
+
+    def __decode_location(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # {Location}
+        i += 1
+        if i >= hex_size:
+            return "{x0e}", i
+        hex_val = hex_list[i]
+        if 0x20 <= hex_val < 0x20 + len(self.sysfnt_data_json['Locations']):
+            return '{' + self.sysfnt_data_json['Locations'][hex_val - 0x20] + '}', i
+        return "{{x0e{:02x}}}".format(hex_val), i
+
+    def __decode_jp_table(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):
+        # jp19, jp1a, jp1b: 2-byte, lead byte selects JP font table 1/2/3
+        lead_hex_val = hex_list[i]
+        i += 1
+        if i >= hex_size:
+            return "{{x{:02x}}}".format(lead_hex_val), i
+        hex_val = hex_list[i]
+        character = None
+        if self.jp_encoding and hex_val >= 0x20:
+            character = self.caract_jp(hex_val, lead_hex_val - 0x18)
+        if not character:
+            character = "{{x{:02x}{:02x}}}".format(lead_hex_val, hex_val)
+        return character, i
+
+    def __decode_add_jp(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):  # addJp
+        i += 1
+        if i >= hex_size:
+            return "{x1c}", i
+        hex_val = hex_list[i]
+        if hex_val >= 0x20:
+            return "{{Jp{:03}}}".format(hex_val - 0x20), i
+        return "{{x1c{:02x}}}".format(hex_val), i
+
+    def __decode_unknown_control(self, hex_list, i, hex_size, zero_as_slash_n, cursor_location_size):
+        hex_val = hex_list[i]
+        i += 1
+        if i >= hex_size:
+            return "{{x{:02x}}}".format(hex_val), i
+        return "{{x{:02x}{:02x}}}".format(hex_val, hex_list[i]), i
 
     def load_all(self):
         self.load_monster_data()
@@ -670,6 +964,92 @@ class GameData:
         self.load_draw_data()
 
 
+class GameDataView(GameData):
+    """
+    Cheap view on a GameData shared by every tool (see get_shared_game_data).
+    Reading an attribute gives the one of the shared GameData, unless the view has its own: setting an attribute
+    (like jp_encoding) only changes the view, never the shared data.
+    The resources (on first access, or with a load_* call without argument) are loaded in the shared GameData, once
+    whatever the number of views. The load_* calls with an argument (like another AI file) load in the view only.
+    The content of the shared resources (the *_data_json dicts...) must be read only.
+    A shared attribute is looked up once per view, then kept on it: the codec reads its tables in its loops.
+    """
+
+    def __init__(self, shared_game_data: GameData, shared_lock: threading.RLock):
+        # GameData.__init__ is not called, everything not set on the view comes from the shared GameData
+        self._shared_game_data = shared_game_data
+        self._shared_lock = shared_lock
+        self.jp_encoding = False
+        # The resources loaded in this view only (load_* with an argument)
+        self._touched_resource_list = []
+
+    def __getattr__(self, name):
+        # Only called for an attribute the view doesn't have
+        if name.startswith('_shared'):
+            raise AttributeError(name)
+        if name not in self._shared_game_data.__dict__:
+            load_name = GameData.RESOURCE_LOAD_DICT.get(name)
+            if load_name is not None:
+                self._load_shared(load_name)
+        value = getattr(self._shared_game_data, name)
+        # The shared attributes are never set again once there, the next reads don't come here
+        self.__dict__[name] = value
+        return value
+
+    def get_shared_game_data(self) -> GameData:
+        return self._shared_game_data
+
+    def get_touched_resource_list(self) -> list[str]:
+        """
+        :return: The resources loaded in the shared GameData (by any view), then the ones loaded in this view only
+        """
+        return self._shared_game_data.get_touched_resource_list() + self._touched_resource_list
+
+    def _load_shared(self, load_name):
+        resource_name = _RESOURCE_NAME_DICT.get(load_name)
+        if resource_name in self._shared_game_data.__dict__:
+            return
+        with self._shared_lock:  # The load_* do nothing once the resource is loaded
+            getattr(self._shared_game_data, load_name)()
+
+
+_RESOURCE_NAME_DICT = {load_name: resource_name for resource_name, load_name in GameData.RESOURCE_LOAD_DICT.items()}
+
+
+def _make_shared_load(load_name):
+    def load(self, *args, **kwargs):
+        if args or kwargs:  # Specific to this view
+            return getattr(GameData, load_name)(self, *args, **kwargs)
+        return self._load_shared(load_name)
+
+    load.__name__ = load_name
+    load.__doc__ = getattr(GameData, load_name).__doc__
+    return load
+
+
+for _load_name in [name for name in vars(GameData) if name.startswith("load_")]:
+    setattr(GameDataView, _load_name, _make_shared_load(_load_name))
+
+_shared_game_data_dict = {}
+_shared_game_data_lock = threading.RLock()
+
+
+def get_shared_game_data(game_data_submodule_path="FF8GameData", ai_file: str = "ai_vanilla.json") -> GameDataView:
+    """
+    Give a view on the GameData shared by the whole process for this folder and AI file.
+    The tables (sysfnt...) are read once per process, and each resource once whatever the number of tools loading it.
+    :param game_data_submodule_path: The FF8GameData folder
+    :param ai_file: The AI json file
+    :return: A new view, its own attributes (like jp_encoding) being independent of the other views
+    """
+    key = (os.path.abspath(game_data_submodule_path), ai_file)
+    with _shared_game_data_lock:
+        if key not in _shared_game_data_dict:
+            _shared_game_data_dict[key] = (GameData(game_data_submodule_path, ai_file), threading.RLock())
+        shared_game_data, shared_lock = _shared_game_data_dict[key]
+    return GameDataView(shared_game_data, shared_lock)
+
+
 if __name__ == "__main__":
     # To be able to read a file and write back in a file
     file_to_load = "FF8_EN.exe"  # Fill with the file you want. use os.path.join if it is in folder
@@ -153,9 +153,9 @@ class TestGameData(unittest.TestCase):
 
     def test_card_img(self):
         for el in self.game_data.card_data_json["card_type"]:
-            self.assertNotEqual(el['img'], None)
+            self.assertNotEqual(self.game_data.get_card_type_image(el), None)
         for el in self.game_data.card_data_json["card_info"]:
-            self.assertNotEqual(el['img'], None)
+            self.assertNotEqual(self.game_data.get_card_image(el), None)
 
 
 if __name__ == '__main__':
@@ -20,8 +20,10 @@ Layout summary:
 import math
 from typing import List, Optional
 
+import numpy as np
 from PIL import Image
 
+from FF8GameData.dat import bonematrix
 from FF8GameData.monsterdata import (
     BoneSection, Bone, GeometrySection, ObjectData, VerticesData, Vertex,
     GeometryTriangle, GeometryQuad, UV, AnimationSection, Animation,
@@ -441,33 +443,32 @@ def _pre_root_matrix() -> Matrix4x4:
     return Matrix4x4.MultiplyRowMajor(facing, Matrix4x4.MultiplyRowMajor(view, pre))
 
 
+def compute_frame_list_matrices(frame_list: List[AnimationFrame], bones: List[Bone]):
+    """Build world-space bone matrices for frames, all of them at once (bonematrix).
+
+    Per bone: world = parent * RotX(rx) * RotY(ry) * RotZ(rz), starting at the end of its parent;
+    the roots hang under the pre-root matrix.
+    """
+    if not frame_list or not bones:
+        return
+    nb_bones = len(bones)
+    rotation_raw = np.array([frame.get_rotation_raw_array()[:nb_bones] for frame in frame_list])
+    pre_root = np.array(_pre_root_matrix().to_list()).reshape(4, 4)[:3, :3]
+    _, world = bonematrix.compute_field_bone_matrices(rotation_raw, [bone.parent_id for bone in bones],
+                                                      [bone.get_size() for bone in bones], pre_root)
+    for frame, frame_world in zip(frame_list, world):
+        frame.set_bone_matrix_array(frame_world)
+
+
 def compute_frame_matrices(frame: AnimationFrame, bones: List[Bone]):
     """Build world-space bone matrices for one frame."""
-    for bone_id, bone in enumerate(bones):
-        rots = frame.rotation_vector_data[bone_id]
-        x_rot = Matrix4x4.CreateRotationX(rots[0].get_rotate_deg())
-        y_rot = Matrix4x4.CreateRotationY(rots[1].get_rotate_deg())
-        z_rot = Matrix4x4.CreateRotationZ(rots[2].get_rotate_deg())
-        local = Matrix4x4.MultiplyRowMajor(x_rot, Matrix4x4.MultiplyRowMajor(y_rot, z_rot))
-        parent_id = bone.parent_id
-        if parent_id != 0xFFFF:
-            parent_mat = frame.bone_matrices[parent_id]
-            parent_size = bones[parent_id].get_size()
-        else:
-            parent_mat = _pre_root_matrix()
-            parent_size = 0.0
-        world = Matrix4x4.MultiplyRowMajor(parent_mat, local)
-        world.M41 = parent_mat.M13 * parent_size + parent_mat.M41
-        world.M42 = parent_mat.M23 * parent_size + parent_mat.M42
-        world.M43 = parent_mat.M33 * parent_size + parent_mat.M43
-        frame.bone_matrices[bone_id] = world
+    compute_frame_list_matrices([frame], bones)
 
 
 def compute_animation_matrices(animation_section: AnimationSection, bone_section: BoneSection):
     """Build world-space bone matrices for every frame (what the viewer consumes)."""
     for animation in animation_section.animations:
-        for frame in animation.frames:
-            compute_frame_matrices(frame, bone_section.bones)
+        compute_frame_list_matrices(animation.frames, bone_section.bones)
 
 
 class MchFile:
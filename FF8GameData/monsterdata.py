@@ -6,7 +6,9 @@ from enum import Enum
 from typing import List, Optional, Tuple
 from urllib.parse import to_bytes
 
-from FF8GameData.dat import interpolation, rotation3d
+import numpy as np
+
+from FF8GameData.dat import bonematrix, interpolation, rotation3d
 
 
 class EntityType(Enum):
@@ -927,6 +929,18 @@ class Matrix4x4:
         self.M43 = 0.0
         self.M44 = 1.0
 
+    @staticmethod
+    def from_list(value_list) -> 'Matrix4x4':
+        """Matrix of the 16 values M11, M12... M44"""
+        mat = Matrix4x4.__new__(Matrix4x4)
+        (mat.M11, mat.M12, mat.M13, mat.M14, mat.M21, mat.M22, mat.M23, mat.M24,
+         mat.M31, mat.M32, mat.M33, mat.M34, mat.M41, mat.M42, mat.M43, mat.M44) = value_list
+        return mat
+
+    def to_list(self) -> List[float]:
+        return [self.M11, self.M12, self.M13, self.M14, self.M21, self.M22, self.M23, self.M24,
+                self.M31, self.M32, self.M33, self.M34, self.M41, self.M42, self.M43, self.M44]
+
     @staticmethod
     def CreateRotationX(angle_deg):
         """Matches MakiExtended.GetRotationMatrixX"""
@@ -1169,40 +1183,434 @@ class PositionType:
     def __repr__(self):
         return f"PositionType({self.__str__()})"
 
+class AnimationFrameStore:
+    """
+    Bone data of all the frames of an animation, one array per value indexed [frame, bone, ...], instead of one
+    RotationType / RotationVectorDataSupp / Matrix4x4 object per value and per frame. An AnimationFrame is a view of
+    one frame of it.
+    """
+
+    def __init__(self, nb_frame: int, nb_bones: int):
+        self.rotation = np.zeros((nb_frame, nb_bones, 3), dtype=np.int32)
+        self.rotation_available = np.zeros((nb_frame, nb_bones, 3), dtype=bool)
+        self.rotation_type = np.zeros((nb_frame, nb_bones, 3), dtype=np.uint8)
+        # RotationVectorDataSupp flags and payloads
+        self.scale_flag = np.zeros((nb_frame, nb_bones, 3), dtype=bool)
+        self.scale_payload = np.zeros((nb_frame, nb_bones, 3), dtype=np.int32)
+        # Derived render data (see AnimationFrame), allocated for the first frame that needs it
+        self.bone_matrix: Optional[np.ndarray] = None  # (frame, bone, 4, 4) float32
+        self.bone_chain_matrix: Optional[np.ndarray] = None  # (frame, bone, 4, 4) float32
+        self.bone_acc_scale: Optional[np.ndarray] = None  # (frame, bone, 3) float32
+        self.has_matrix = np.zeros(nb_frame, dtype=bool)
+
+    def get_nb_frame(self) -> int:
+        return self.rotation.shape[0]
+
+    def get_nb_bones(self) -> int:
+        return self.rotation.shape[1]
+
+    def _allocate_matrix(self):
+        if self.bone_matrix is None:
+            shape = (self.get_nb_frame(), self.get_nb_bones())
+            self.bone_matrix = np.zeros(shape + (4, 4), dtype=np.float32)
+            self.bone_chain_matrix = np.zeros(shape + (4, 4), dtype=np.float32)
+            self.bone_acc_scale = np.ones(shape + (3,), dtype=np.float32)
+
+    def reset_matrix(self, frame_index: int):
+        """Identity matrices and neutral scales for a frame"""
+        self._allocate_matrix()
+        self.bone_matrix[frame_index] = np.eye(4, dtype=np.float32)
+        self.bone_chain_matrix[frame_index] = np.eye(4, dtype=np.float32)
+        self.bone_acc_scale[frame_index] = 1.0
+        self.has_matrix[frame_index] = True
+
+    def free_matrix(self, frame_index: int = None):
+        """Drop the matrices of a frame (of all of them if None), the arrays once no frame has any"""
+        if frame_index is None:
+            self.has_matrix[:] = False
+        else:
+            self.has_matrix[frame_index] = False
+        if not self.has_matrix.any():
+            self.bone_matrix = None
+            self.bone_chain_matrix = None
+            self.bone_acc_scale = None
+
+    def set_all_bones_matrix(self, bones: List[Bone], mode_bit_list: List[int], frame_index_list: List[int] = None):
+        """
+        AnimationFrame.set_all_bones_matrix on several frames at once (bonematrix.compute_battle_bone_matrices)
+        :param mode_bit_list: Mode bit of each frame, the bones are only scaled in the frames where it is 1
+        :param frame_index_list: The frames to compute, all of them if None
+        """
+        if frame_index_list is None:
+            frame_index_list = np.arange(self.get_nb_frame())
+        frame_index_list = np.asarray(frame_index_list, dtype=np.int64)
+        nb_bones = self.get_nb_bones()
+        self._allocate_matrix()
+        self.has_matrix[frame_index_list] = True
+        if not nb_bones or not len(frame_index_list):
+            return
+        bone_list = bones[:nb_bones]
+        scale_raw = np.where(self.scale_flag[frame_index_list], self.scale_payload[frame_index_list] + 1024, 1024)
+        bone_scale = np.where(np.asarray(mode_bit_list)[:, None, None] == 1,
+                              scale_raw / RotationVectorDataSupp.SCALE_NEUTRAL_RAW, 1.0)
+        _, chain, acc_scale, world = bonematrix.compute_battle_bone_matrices(
+            self.rotation[frame_index_list], [bone.parent_id for bone in bone_list],
+            [bone.get_size() for bone in bones], bone_scale)
+        self.bone_chain_matrix[frame_index_list] = chain
+        self.bone_acc_scale[frame_index_list] = acc_scale
+        self.bone_matrix[frame_index_list] = world
+
+    def copy_frame(self, frame_index: int, nb_bones: int = None) -> 'AnimationFrameStore':
+        """A store of its own for one frame, with nb_bones bones (the new ones not rotated, neutral, identity)"""
+        if nb_bones is None:
+            nb_bones = self.get_nb_bones()
+        return AnimationFrameStore.gather([(self, frame_index)], nb_bones)
+
+    @staticmethod
+    def gather(frame_source_list: List[Tuple['AnimationFrameStore', int]], nb_bones: int) -> 'AnimationFrameStore':
+        """
+        One store holding copies of frames of any stores, in order
+        :param frame_source_list: (store, frame index) of each frame
+        :param nb_bones: Number of bones of the new store, the new ones not rotated, neutral, identity
+        """
+        store = AnimationFrameStore(len(frame_source_list), nb_bones)
+        index_by_source = {}
+        for new_index, (source, frame_index) in enumerate(frame_source_list):
+            source_index = index_by_source.setdefault(id(source), (source, [], []))
+            source_index[1].append(new_index)
+            source_index[2].append(frame_index)
+        for source, new_index_list, frame_index_list in index_by_source.values():
+            # One copy per array and per source store, not per frame
+            new_index_array = np.array(new_index_list, dtype=np.int64)
+            frame_index_array = np.array(frame_index_list, dtype=np.int64)
+            nb_copied = min(nb_bones, source.get_nb_bones())
+            for name in ('rotation', 'rotation_available', 'rotation_type', 'scale_flag', 'scale_payload'):
+                getattr(store, name)[new_index_array, :nb_copied] = getattr(source, name)[frame_index_array, :nb_copied]
+            has_matrix = source.has_matrix[frame_index_array]
+            if not has_matrix.any():
+                continue
+            new_index_array = new_index_array[has_matrix]
+            frame_index_array = frame_index_array[has_matrix]
+            store._allocate_matrix()
+            store.bone_matrix[new_index_array] = np.eye(4, dtype=np.float32)
+            store.bone_chain_matrix[new_index_array] = np.eye(4, dtype=np.float32)
+            store.has_matrix[new_index_array] = True
+            for name in ('bone_matrix', 'bone_chain_matrix', 'bone_acc_scale'):
+                getattr(store, name)[new_index_array, :nb_copied] = getattr(source, name)[frame_index_array, :nb_copied]
+        return store
+
+
+class _StoredRotation(RotationType):
+    """RotationType of one axis of one bone of an AnimationFrameStore frame"""
+
+    def __init__(self, store: AnimationFrameStore, frame_index: int, bone_index: int, axis: int):
+        self._store = store
+        self._index = (frame_index, bone_index, axis)
+
+    @property
+    def is_rotation_type_available(self) -> bool:
+        return bool(self._store.rotation_available[self._index])
+
+    @is_rotation_type_available.setter
+    def is_rotation_type_available(self, value: bool):
+        self._store.rotation_available[self._index] = value
+
+    @property
+    def rotation_type_bits(self) -> int:
+        return int(self._store.rotation_type[self._index])
+
+    @rotation_type_bits.setter
+    def rotation_type_bits(self, value: int):
+        self._store.rotation_type[self._index] = value
+
+    @property
+    def _vector_axis(self) -> int:
+        return int(self._store.rotation[self._index])
+
+    @_vector_axis.setter
+    def _vector_axis(self, value: int):
+        self._store.rotation[self._index] = value
+
+    @property
+    def _vector_axis_deg(self) -> float:
+        return self._vector_axis * 360.0 / 4096.0
+
+    @_vector_axis_deg.setter
+    def _vector_axis_deg(self, value: float):
+        pass  # Derived from _vector_axis
+
+    def __deepcopy__(self, memo):
+        return RotationType(self.is_rotation_type_available, self.rotation_type_bits, self._vector_axis)
+
+
+class _StoredScale(RotationVectorDataSupp):
+    """RotationVectorDataSupp of one bone of an AnimationFrameStore frame"""
+
+    def __init__(self, store: AnimationFrameStore, frame_index: int, bone_index: int):
+        self._store = store
+        self._index = (frame_index, bone_index)
+
+    def _get_payload(self, axis: int) -> int:
+        return int(self._store.scale_payload[self._index + (axis,)])
+
+    def _set_payload(self, axis: int, value: int):
+        self._store.scale_payload[self._index + (axis,)] = value
+
+    def _get_flag(self, axis: int) -> bool:
+        return bool(self._store.scale_flag[self._index + (axis,)])
+
+    def _set_flag(self, axis: int, value: bool):
+        self._store.scale_flag[self._index + (axis,)] = value
+
+    unk1 = property(lambda self: self._get_payload(0), lambda self, value: self._set_payload(0, value))
+    unk2 = property(lambda self: self._get_payload(1), lambda self, value: self._set_payload(1, value))
+    unk3 = property(lambda self: self._get_payload(2), lambda self, value: self._set_payload(2, value))
+    unk_flag1 = property(lambda self: self._get_flag(0), lambda self, value: self._set_flag(0, value))
+    unk_flag2 = property(lambda self: self._get_flag(1), lambda self, value: self._set_flag(1, value))
+    unk_flag3 = property(lambda self: self._get_flag(2), lambda self, value: self._set_flag(2, value))
+
+    def __deepcopy__(self, memo):
+        supp = RotationVectorDataSupp()
+        supp.unk1, supp.unk2, supp.unk3 = self.unk1, self.unk2, self.unk3
+        supp.unk_flag1, supp.unk_flag2, supp.unk_flag3 = self.unk_flag1, self.unk_flag2, self.unk_flag3
+        return supp
+
+
+class _FrameBoneList:
+    """Per-bone list of an AnimationFrame (rotation_vector_data, bone_matrices...), read from and written to its
+    AnimationFrameStore. Items are built on access: changing one writes it back only for the rotations and scales,
+    which are views."""
+
+    def __init__(self, frame: 'AnimationFrame'):
+        self._frame = frame
+
+    def __len__(self):
+        return self._frame._store.get_nb_bones()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(bone_index) for bone_index in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Bone index {index} out of range")
+        return self._get(index)
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Bone index {index} out of range")
+        self._set(index, value)
+
+    def __iter__(self):
+        for bone_index in range(len(self)):
+            yield self._get(bone_index)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def set_all(self, value_list):
+        """Write a whole list, resizing the frame to its number of bones"""
+        value_list = list(value_list)
+        if len(value_list) != len(self):
+            value_list = copy.deepcopy(value_list)  # Read before the views move to the new store
+            self._frame.set_nb_bones(len(value_list))
+        for bone_index, value in enumerate(value_list):
+            self._set(bone_index, value)
+
+    def _get(self, bone_index: int):
+        raise NotImplementedError
+
+    def _set(self, bone_index: int, value):
+        raise NotImplementedError
+
+
+class _FrameRotationList(_FrameBoneList):
+    def _get(self, bone_index: int) -> List[RotationType]:
+        frame = self._frame
+        return [_StoredRotation(frame._store, frame._frame_index, bone_index, axis) for axis in range(3)]
+
+    def _set(self, bone_index: int, rotation_list: List[RotationType]):
+        store = self._frame._store
+        index = (self._frame._frame_index, bone_index)
+        value_list = [(rotation.is_rotation_type_available, rotation.rotation_type_bits, rotation.get_rotate_raw())
+                      for rotation in rotation_list]  # Read them all first, they can be views of this very bone
+        for axis, (available, type_bits, raw) in enumerate(value_list):
+            store.rotation_available[index + (axis,)] = available
+            store.rotation_type[index + (axis,)] = type_bits
+            store.rotation[index + (axis,)] = raw
+
+
+class _FrameScaleList(_FrameBoneList):
+    def _get(self, bone_index: int) -> RotationVectorDataSupp:
+        return _StoredScale(self._frame._store, self._frame._frame_index, bone_index)
+
+    def _set(self, bone_index: int, supp: RotationVectorDataSupp):
+        store = self._frame._store
+        index = (self._frame._frame_index, bone_index)
+        store.scale_flag[index] = (supp.unk_flag1, supp.unk_flag2, supp.unk_flag3)
+        store.scale_payload[index] = (supp.unk1, supp.unk2, supp.unk3)
+
+
+class _FrameMatrixList(_FrameBoneList):
+    """Copies of the matrices of a frame: a matrix is changed by setting it back"""
+
+    def __init__(self, frame: 'AnimationFrame', array_name: str):
+        super().__init__(frame)
+        self._array_name = array_name
+
+    def _get_array(self) -> np.ndarray:
+        return getattr(self._frame._store, self._array_name)[self._frame._frame_index]
+
+    def __iter__(self):
+        for value_list in self._get_array().reshape(-1, 16).tolist():
+            yield Matrix4x4.from_list(value_list)
+
+    def _get(self, bone_index: int) -> Matrix4x4:
+        return Matrix4x4.from_list(self._get_array()[bone_index].ravel().tolist())
+
+    def _set(self, bone_index: int, matrix: Matrix4x4):
+        self._get_array()[bone_index] = np.array(matrix.to_list(), dtype=np.float32).reshape(4, 4)
+
+
+class _FrameAccScaleList(_FrameBoneList):
+    def _get(self, bone_index: int) -> Tuple[float, float, float]:
+        return tuple(self._frame._store.bone_acc_scale[self._frame._frame_index, bone_index].tolist())
+
+    def _set(self, bone_index: int, acc_scale: Tuple[float, float, float]):
+        self._frame._store.bone_acc_scale[self._frame._frame_index, bone_index] = acc_scale
+
+
 class AnimationFrame:
-    def __init__(self, nb_bones: int):
+    def __init__(self, nb_bones: int, store: AnimationFrameStore = None, frame_index: int = 0):
+        """
+        :param store: The store of the animation this frame is a view of. If None, the frame has a store of its own.
+        """
         self.position: List[PositionType] = []
-        self.rotation_vector_data: List[List[RotationType]] =  [[] for _ in range(nb_bones)]
-        #self.bone_rot_raw: List[Vector3D] = [Vector3D() for _ in range(nb_bones)]
-        #self.bone_rot_deg: List[Tuple[float, float, float]] = [(0.0, 0.0, 0.0) for _ in range(nb_bones)]
-        # bone_matrices / bone_chain_matrices / bone_acc_scale are DERIVED render data
-        # (recomputable from the rotations via set_all_bones_matrix). They are ~60% of a
-        # monster's animation RAM, so a parsed file that isn't being shown in 3D drops them
-        # (AnimationSection.free_bone_matrices) and rebuilds on demand. _reset_matrix_lists
-        # re-allocates them; free_matrices() drops them to None.
-        self._reset_matrix_lists(nb_bones)
-        self.rotation_vector_data_supp: List[RotationVectorDataSupp] = [RotationVectorDataSupp() for _ in range(nb_bones)]
+        # Rotations, scales and matrices of every bone live in _store (one array per value for all the frames of the
+        # animation), the lists below are views of this frame of it.
+        if store is None:
+            store = AnimationFrameStore(1, nb_bones)
+            frame_index = 0
+            # bone_matrices / bone_chain_matrices / bone_acc_scale are DERIVED render data
+            # (recomputable from the rotations via set_all_bones_matrix). They are ~60% of a
+            # monster's animation RAM, so a parsed file that isn't being shown in 3D drops them
+            # (AnimationSection.free_bone_matrices) and rebuilds on demand. _reset_matrix_lists
+            # re-allocates them; free_matrices() drops them to None.
+            store.reset_matrix(0)
+        self._store: AnimationFrameStore = store
+        self._frame_index: int = frame_index
         self.mode_bit:int = 0
 
+    @property
+    def rotation_vector_data(self) -> List[List[RotationType]]:
+        return _FrameRotationList(self)
+
+    @rotation_vector_data.setter
+    def rotation_vector_data(self, rotation_vector_data: List[List[RotationType]]):
+        _FrameRotationList(self).set_all(rotation_vector_data)
+
+    @property
+    def rotation_vector_data_supp(self) -> List[RotationVectorDataSupp]:
+        return _FrameScaleList(self)
+
+    @rotation_vector_data_supp.setter
+    def rotation_vector_data_supp(self, rotation_vector_data_supp: List[RotationVectorDataSupp]):
+        _FrameScaleList(self).set_all(rotation_vector_data_supp)
+
+    @property
+    def bone_matrices(self) -> Optional[List[Matrix4x4]]:
+        """Scaled bone matrices, used for skinning"""
+        if not self._store.has_matrix[self._frame_index]:
+            return None
+        return _FrameMatrixList(self, 'bone_matrix')
+
+    @bone_matrices.setter
+    def bone_matrices(self, bone_matrices: Optional[List[Matrix4x4]]):
+        self._set_matrix_list(bone_matrices, lambda: _FrameMatrixList(self, 'bone_matrix'))
+
+    @property
+    def bone_chain_matrices(self) -> Optional[List[Matrix4x4]]:
+        """Unscaled rotation chain (parent * local), kept separate so a parent's
+        non-uniform scale doesn't contaminate the children's rotations —
+        mirrors the engine, which chains rotations and applies the
+        accumulated scale only on the stored per-bone matrix."""
+        if not self._store.has_matrix[self._frame_index]:
+            return None
+        return _FrameMatrixList(self, 'bone_chain_matrix')
+
+    @bone_chain_matrices.setter
+    def bone_chain_matrices(self, bone_chain_matrices: Optional[List[Matrix4x4]]):
+        self._set_matrix_list(bone_chain_matrices, lambda: _FrameMatrixList(self, 'bone_chain_matrix'))
+
+    @property
+    def bone_acc_scale(self) -> Optional[List[Tuple[float, float, float]]]:
+        """Accumulated per-axis scale down the hierarchy (1.0 = neutral)"""
+        if not self._store.has_matrix[self._frame_index]:
+            return None
+        return _FrameAccScaleList(self)
+
+    @bone_acc_scale.setter
+    def bone_acc_scale(self, bone_acc_scale: Optional[List[Tuple[float, float, float]]]):
+        self._set_matrix_list(bone_acc_scale, lambda: _FrameAccScaleList(self))
+
+    def _set_matrix_list(self, value_list, get_bone_list):
+        if value_list is None:
+            self.free_matrices()
+            return
+        value_list = list(value_list)
+        if not self._store.has_matrix[self._frame_index]:
+            self._store.reset_matrix(self._frame_index)
+        get_bone_list().set_all(value_list)
+
+    def set_nb_bones(self, nb_bones: int):
+        """Add bones (not rotated, neutral scale, identity matrices) or remove the last ones. The frame gets a store
+        of its own, the other frames of its animation keep their bones."""
+        self._store = self._store.copy_frame(self._frame_index, nb_bones)
+        self._frame_index = 0
+
+    def __deepcopy__(self, memo):
+        new_frame = AnimationFrame.__new__(AnimationFrame)
+        memo[id(self)] = new_frame
+        for name, value in self.__dict__.items():
+            if name not in ('_store', '_frame_index'):
+                setattr(new_frame, name, copy.deepcopy(value, memo))
+        new_frame._store = self._store.copy_frame(self._frame_index)
+        new_frame._frame_index = 0
+        return new_frame
+
     def _reset_matrix_lists(self, nb_bones: int):
-        self.bone_matrices: List[Matrix4x4] = [Matrix4x4() for _ in range(nb_bones)]  # identity (scaled, used for skinning)
-        # Unscaled rotation chain (parent * local), kept separate so a parent's
-        # non-uniform scale doesn't contaminate the children's rotations —
-        # mirrors the engine, which chains rotations and applies the
-        # accumulated scale only on the stored per-bone matrix.
-        self.bone_chain_matrices: List[Matrix4x4] = [Matrix4x4() for _ in range(nb_bones)]
-        # Accumulated per-axis scale down the hierarchy (1.0 = neutral)
-        self.bone_acc_scale: List[Tuple[float, float, float]] = [(1.0, 1.0, 1.0) for _ in range(nb_bones)]
+        if nb_bones != self._store.get_nb_bones():
+            self.set_nb_bones(nb_bones)
+        self._store.reset_matrix(self._frame_index)
 
     def free_matrices(self):
         """Drop this frame's derived render matrices (recomputable from the rotations)."""
-        self.bone_matrices = None
-        self.bone_chain_matrices = None
-        self.bone_acc_scale = None
+        self._store.free_matrix(self._frame_index)
+
+    def get_rotation_raw_array(self) -> np.ndarray:
+        """Raw rotation of every bone of this frame, (bone, axis)"""
+        return self._store.rotation[self._frame_index].copy()
+
+    def set_bone_matrix_array(self, bone_matrix: np.ndarray):
+        """Set the first bone_matrices from a (bone, 4, 4) array laid out as Matrix4x4 (see bonematrix)"""
+        if not self._store.has_matrix[self._frame_index]:
+            self._store.reset_matrix(self._frame_index)
+        self._store.bone_matrix[self._frame_index, :len(bone_matrix)] = bone_matrix
 
     def get_bone_scale_factors(self, bone_id: int) -> Tuple[float, float, float]:
         """Per-bone scale of this frame (1.0 neutral). Only meaningful when mode_bit is 1."""
-        if self.mode_bit == 1 and bone_id < len(self.rotation_vector_data_supp):
+        if self.mode_bit == 1 and bone_id < self._store.get_nb_bones():
             return self.rotation_vector_data_supp[bone_id].get_scale_factors()
         return (1.0, 1.0, 1.0)
 
@@ -1279,10 +1687,18 @@ class AnimationFrame:
         self.rotation_vector_data[bone_id][1].rotate_raw(raw.y)
         self.rotation_vector_data[bone_id][2].rotate_raw(raw.z)
 
-    def set_bone_matrix(self, parent_id:int, parent_bone_size: float, bone_id:int):
-        xRot = Matrix4x4.CreateRotationX(-self.rotation_vector_data[bone_id][0].get_rotate_deg())
-        yRot = Matrix4x4.CreateRotationY(-self.rotation_vector_data[bone_id][1].get_rotate_deg())
-        zRot = Matrix4x4.CreateRotationZ(-self.rotation_vector_data[bone_id][2].get_rotate_deg())
+    @staticmethod
+    def _compute_bone_matrix(rotate_deg: List[float], bone_scale: Tuple[float, float, float],
+                             parent_bone_size: float = None, parent_chain: Matrix4x4 = None,
+                             parent_acc: Tuple[float, float, float] = None, parent_mat: Matrix4x4 = None):
+        """
+        Matrices of a bone from its rotation and scale and those of its parent
+        :param parent_chain: None for a root bone
+        :return: The bone chain matrix, accumulated scale and (skinning) matrix
+        """
+        xRot = Matrix4x4.CreateRotationX(-rotate_deg[0])
+        yRot = Matrix4x4.CreateRotationY(-rotate_deg[1])
+        zRot = Matrix4x4.CreateRotationZ(-rotate_deg[2])
 
         # Combine in the same order as C#: Y*X then Z*(Y*X)
         local = Matrix4x4.MultiplyColumnMajor(yRot, xRot)
@@ -1290,13 +1706,10 @@ class AnimationFrame:
 
         # Per-bone squash-and-stretch scale (mode-bit frames only), hierarchical:
         # accumulated scale = parent accumulated scale * this bone's scale
-        bone_scale = self.get_bone_scale_factors(bone_id)
-
-        if parent_id != 0xFFFF:
+        if parent_chain is not None:
             # Rotation chain stays unscaled (like the engine's chained matrices)
-            chain = Matrix4x4.MultiplyRowMajor(self.bone_chain_matrices[parent_id], local)
+            chain = Matrix4x4.MultiplyRowMajor(parent_chain, local)
 
-            parent_acc = self.bone_acc_scale[parent_id]
             acc = (parent_acc[0] * bone_scale[0],
                    parent_acc[1] * bone_scale[1],
                    parent_acc[2] * bone_scale[2])
@@ -1304,7 +1717,6 @@ class AnimationFrame:
             # Translation: parent_pos + parent SCALED matrix * (0,0,parent_length)
             # (using the scaled parent shortens/stretches the limb with the parent's scale,
             #  exactly like the engine)
-            parent_mat = self.bone_matrices[parent_id]
             trans_x = parent_mat.M13 * parent_bone_size + parent_mat.M41
             trans_y = parent_mat.M23 * parent_bone_size + parent_mat.M42
             trans_z = parent_mat.M33 * parent_bone_size + parent_mat.M43
@@ -1313,9 +1725,6 @@ class AnimationFrame:
             acc = bone_scale
             trans_x = trans_y = trans_z = 0.0
 
-        self.bone_chain_matrices[bone_id] = chain
-        self.bone_acc_scale[bone_id] = acc
-
         # Stored (skinning) matrix = chain with each local axis column scaled
         world = Matrix4x4()
         world.M11, world.M21, world.M31 = chain.M11 * acc[0], chain.M21 * acc[0], chain.M31 * acc[0]
@@ -1324,16 +1733,26 @@ class AnimationFrame:
         world.M41 = trans_x
         world.M42 = trans_y
         world.M43 = trans_z
-        self.bone_matrices[bone_id] = world
+        return chain, acc, world
+
+    def set_bone_matrix(self, parent_id:int, parent_bone_size: float, bone_id:int):
+        rotate_deg = [rotation.get_rotate_deg() for rotation in self.rotation_vector_data[bone_id]]
+        bone_chain_matrices = self.bone_chain_matrices
+        bone_matrices = self.bone_matrices
+        bone_acc_scale = self.bone_acc_scale
+        if parent_id != 0xFFFF:
+            chain, acc, world = self._compute_bone_matrix(rotate_deg, self.get_bone_scale_factors(bone_id),
+                                                          parent_bone_size, bone_chain_matrices[parent_id],
+                                                          bone_acc_scale[parent_id], bone_matrices[parent_id])
+        else:
+            chain, acc, world = self._compute_bone_matrix(rotate_deg, self.get_bone_scale_factors(bone_id))
+        bone_chain_matrices[bone_id] = chain
+        bone_acc_scale[bone_id] = acc
+        bone_matrices[bone_id] = world
 
     def set_all_bones_matrix(self, bones:List[Bone]):
-        for bone_index in range(len(self.bone_matrices)):
-            parent_id = bones[bone_index].parent_id
-            if parent_id != 0xFFFF:
-                bone_parent_size = bones[parent_id].get_size()
-            else:
-                bone_parent_size = None
-            self.set_bone_matrix(parent_id, bone_parent_size, bone_index)
+        """set_bone_matrix on every bone, all of them in a few array operations (AnimationFrameStore)"""
+        self._store.set_all_bones_matrix(bones, [self.mode_bit], [self._frame_index])
 
     def analyze_pos(self, br: BitReader, prev_frame: 'AnimationFrame', bone_section:BoneSection):
         self.position = []
@@ -1385,9 +1804,6 @@ class AnimationFrame:
             ]
 
             if self.mode_bit == 1:
-                if bone_index >= len(self.rotation_vector_data_supp):
-                    self.rotation_vector_data_supp.extend([RotationVectorDataSupp() for _ in range(bone_index - len(self.rotation_vector_data_supp) + 1)])
-
                 self.rotation_vector_data_supp[bone_index].unk_flag1 = br.read_bit()
                 if self.rotation_vector_data_supp[bone_index].unk_flag1:
                     self.rotation_vector_data_supp[bone_index].unk1 = br.read_bits(16)
@@ -1400,15 +1816,249 @@ class AnimationFrame:
                 if self.rotation_vector_data_supp[bone_index].unk_flag3:
                     self.rotation_vector_data_supp[bone_index].unk3 = br.read_bits(16)
 
+class PackedAnimation:
+    """
+    One animation decoded in a single pass over its bitstream, into NumPy arrays instead of one AnimationFrame /
+    RotationType / PositionType object per value. Holds exactly what the objects hold (see AnimationFrame.analyze_pos
+    and rotate_all_bones): to_frames() builds the object view from it, to_binary() gives back the bytes the objects
+    would write.
+    Arrays are indexed [frame, axis] for the root position and [frame, bone, axis] for the bones.
+    """
+    # Bits read at once: the biggest value read is a 2-bit type + 16-bit position, and a bit position can start
+    # up to 7 bits into its first byte
+    WORD_SIZE = 4
+
+    def __init__(self, nb_frame: int, nb_bones: int):
+        self.position_type = np.zeros((nb_frame, 3), dtype=np.uint8)
+        self.position_delta = np.zeros((nb_frame, 3), dtype=np.int32)
+        self.mode_bit = np.zeros(nb_frame, dtype=bool)
+        self.rotation_available = np.zeros((nb_frame, nb_bones, 3), dtype=bool)
+        self.rotation_type = np.zeros((nb_frame, nb_bones, 3), dtype=np.uint8)
+        self.rotation_delta = np.zeros((nb_frame, nb_bones, 3), dtype=np.int32)
+        # Scale channels, only read on mode bit frames (RotationVectorDataSupp)
+        self.scale_flag = np.zeros((nb_frame, nb_bones, 3), dtype=bool)
+        self.scale_payload = np.zeros((nb_frame, nb_bones, 3), dtype=np.int32)
+        # Frame count byte + bitstream, the unread bits of the last byte zeroed as the BitWriter does
+        self.raw_data = bytearray()
+
+    def get_nb_frame(self) -> int:
+        return self.mode_bit.shape[0]
+
+    def get_nb_bones(self) -> int:
+        return self.rotation_delta.shape[1]
+
+    def get_position(self) -> np.ndarray:
+        """Raw root position of each frame, as accumulated by AnimationFrame.analyze_pos"""
+        return np.cumsum(self.position_delta, axis=0, dtype=np.int64)
+
+    def get_rotation(self) -> np.ndarray:
+        """Raw rotation of each bone of each frame, as accumulated by AnimationFrame.rotate_all_bones"""
+        return np.cumsum(self.rotation_delta, axis=0, dtype=np.int64)
+
+    @staticmethod
+    def get_word_list(data: bytes) -> List[int]:
+        """For each byte of data, the little-endian 32-bit word starting on it (zero after the end of the data, as
+        BitReader reads it). Computed once for a whole section and shared by all its animations."""
+        byte_array = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+        byte_array = np.concatenate((byte_array, np.zeros(PackedAnimation.WORD_SIZE - 1, dtype=np.uint32)))
+        nb_byte = len(data)
+        word_array = np.zeros(nb_byte, dtype=np.uint32)
+        for i in range(PackedAnimation.WORD_SIZE):
+            word_array |= byte_array[i:i + nb_byte] << (8 * i)
+        return word_array.tolist()
+
+    @classmethod
+    def decode(cls, data: bytes, start_byte: int, nb_bones: int, word_list: List[int] = None):
+        """
+        Decode the animation starting at start_byte (its frame count byte)
+        :param word_list: get_word_list(data), to be given when decoding several animations of the same data
+        :return: The PackedAnimation and the byte right after its bitstream
+        """
+        if word_list is None:
+            word_list = cls.get_word_list(data)
+        nb_frame = data[start_byte]
+        # Only the field sizes are needed to walk the bitstream: the loop keeps the bits of each field (starting at
+        # bit 0 of the word) and the values are extracted from them all at once after
+        position_size = [2 + nb_bit for nb_bit in BitReader.POSITION_READ_HELPER]  # By 2-bit type
+        rotation_size = [1 if not flag_and_type & 1 else 3 + BitReader.ROTATION_READ_HELPER[flag_and_type >> 1]
+                         for flag_and_type in range(8)]  # By flag bit + 2-bit type
+        position_word_list = []
+        rotation_word_list = []
+        mode_bit_list = []
+        scale_word_list = []  # Only the mode bit frames have scale channels
+        position_append = position_word_list.append
+        rotation_append = rotation_word_list.append
+        scale_append = scale_word_list.append
+        bit_pos = (start_byte + 1) * 8
+        for frame_index in range(nb_frame):
+            for axis in range(3):
+                word = word_list[bit_pos >> 3] >> (bit_pos & 7)
+                position_append(word)
+                bit_pos += position_size[word & 3]
+            mode_bit = (word_list[bit_pos >> 3] >> (bit_pos & 7)) & 1
+            mode_bit_list.append(mode_bit)
+            bit_pos += 1
+            for bone_index in range(nb_bones):
+                for axis in range(3):
+                    word = word_list[bit_pos >> 3] >> (bit_pos & 7)
+                    rotation_append(word)
+                    bit_pos += rotation_size[word & 7]
+                if mode_bit:
+                    for axis in range(3):
+                        word = word_list[bit_pos >> 3] >> (bit_pos & 7)
+                        scale_append(word)
+                        bit_pos += 17 if word & 1 else 1
+
+        packed = cls(nb_frame, nb_bones)
+        if nb_frame:
+            position_word = np.array(position_word_list, dtype=np.int64).reshape(nb_frame, 3)
+            packed.position_type[:] = position_word & 3
+            packed.position_delta[:] = cls._extract_signed(position_word >> 2,
+                                                           np.array(BitReader.POSITION_READ_HELPER)[position_word & 3])
+            packed.mode_bit[:] = mode_bit_list
+        if nb_frame and nb_bones:
+            rotation_word = np.array(rotation_word_list, dtype=np.int64).reshape(nb_frame, nb_bones, 3)
+            packed.rotation_available[:] = rotation_word & 1
+            packed.rotation_type[:] = np.where(packed.rotation_available, (rotation_word >> 1) & 3, 0)
+            rotation_value = cls._extract_signed(rotation_word >> 3,
+                                                 np.array(BitReader.ROTATION_READ_HELPER)[packed.rotation_type])
+            packed.rotation_delta[:] = np.where(packed.rotation_available, rotation_value, 0)
+            if scale_word_list:
+                scale_word = np.array(scale_word_list, dtype=np.int64).reshape(-1, nb_bones, 3)
+                scale_flag = (scale_word & 1).astype(bool)
+                packed.scale_flag[packed.mode_bit] = scale_flag
+                packed.scale_payload[packed.mode_bit] = np.where(scale_flag, cls._extract_signed(scale_word >> 1, 16), 0)
+
+        # The bit-stream rarely ends on a byte boundary: the leftover high bits of the final byte are never read by
+        # the game and are zero-filled on save (see AnimationSection.analyze)
+        end_byte = (bit_pos + 7) >> 3
+        packed.raw_data = bytearray(data[start_byte:end_byte])
+        if bit_pos & 7 and end_byte <= len(data):
+            packed.raw_data[-1] &= (1 << (bit_pos & 7)) - 1
+        packed.raw_data.extend(bytes(end_byte - start_byte - len(packed.raw_data)))  # Stream read past the data
+        return packed, end_byte
+
+    @staticmethod
+    def _extract_signed(value: np.ndarray, nb_bit) -> np.ndarray:
+        """The nb_bit low bits of value, sign-extended as BitReader.read_bits does"""
+        value = value & ((1 << nb_bit) - 1)
+        return np.where(value >> (nb_bit - 1), value - (1 << nb_bit), value)
+
+    def to_frames(self, bones: List[Bone] = None) -> List['AnimationFrame']:
+        """
+        Build the AnimationFrame objects of this animation, the same add_frame would read from the bitstream
+        :param bones: If given, also compute the bone matrices of each frame
+        """
+        nb_frame = self.get_nb_frame()
+        nb_bones = self.get_nb_bones()
+        store = AnimationFrameStore(nb_frame, nb_bones)
+        store.rotation[:] = self.get_rotation()
+        store.rotation_available[:] = self.rotation_available
+        store.rotation_type[:] = self.rotation_type
+        store.scale_flag[:] = self.scale_flag
+        store.scale_payload[:] = self.scale_payload
+        position_type_list = self.position_type.tolist()
+        position_list = self.get_position().tolist()
+        mode_bit_list = self.mode_bit.tolist()
+        frame_list = []
+        for frame_index in range(nb_frame):
+            frame = AnimationFrame(nb_bones, store, frame_index)
+            frame.position = [PositionType(position_type_list[frame_index][axis], position_list[frame_index][axis],
+                                           axis=axis) for axis in range(3)]
+            frame.mode_bit = mode_bit_list[frame_index]
+            frame_list.append(frame)
+        if bones is not None:
+            store.set_all_bones_matrix(bones, mode_bit_list)
+        return frame_list
+
+    def to_binary(self) -> bytearray:
+        """Same bytes as Animation.to_binary on the frames built by to_frames (without the tail)"""
+        return bytearray(self.raw_data)
+
+
 class Animation:
     def __init__(self):
-        self.frames: List[AnimationFrame] = []
+        self._frames: Optional[List[AnimationFrame]] = []
+        # Set by AnimationSection.analyze: the animation as read, its frames only built on the first access to
+        # self.frames. Once built, the frames are the animation (edits live there) and packed is dropped.
+        self.packed: Optional[PackedAnimation] = None
+        # Bones the frames built from packed compute their matrices with (None: matrices not built)
+        self._packed_bones: Optional[List[Bone]] = None
         # Original bytes between the end of the bit-stream and the next
         # animation offset (or the section end for the last animation).
         self.original_tail: bytes = b""
 
+    @property
+    def frames(self) -> List[AnimationFrame]:
+        if self._frames is None:
+            self._frames = self.packed.to_frames(self._packed_bones)
+            self.packed = None
+            self._packed_bones = None
+        return self._frames
+
+    @frames.setter
+    def frames(self, frames: List[AnimationFrame]):
+        self._frames = frames
+        self.packed = None
+        self._packed_bones = None
+        if frames:
+            self.share_store()
+
+    def __deepcopy__(self, memo):
+        new_animation = Animation.__new__(Animation)
+        memo[id(self)] = new_animation
+        for name, value in self.__dict__.items():
+            setattr(new_animation, name, copy.deepcopy(value, memo))
+        if new_animation.is_expanded():
+            new_animation.share_store()  # Each copied frame has a store of its own
+        return new_animation
+
+    def set_packed(self, packed: PackedAnimation, bones: List[Bone] = None):
+        """Use the animation as read, its frames (with their matrices if bones is given) built when first accessed"""
+        self._frames = None
+        self.packed = packed
+        self._packed_bones = bones
+
+    def is_expanded(self) -> bool:
+        """Whether the AnimationFrame objects are built"""
+        return self._frames is not None
+
+    def set_nb_bones(self, nb_bones: int):
+        """Add bones (not rotated, neutral scale, identity matrices) to every frame or remove the last ones. The frames
+        move to one store of the new size, instead of one store each with AnimationFrame.set_nb_bones."""
+        frame_list = self.frames
+        if not frame_list:
+            return
+        store = frame_list[0]._store
+        if (store.get_nb_bones() == nb_bones and store.get_nb_frame() == len(frame_list)
+                and all(frame._store is store and frame._frame_index == frame_index
+                        for frame_index, frame in enumerate(frame_list))):
+            return
+        store = AnimationFrameStore.gather([(frame._store, frame._frame_index) for frame in frame_list], nb_bones)
+        for frame_index, frame in enumerate(frame_list):
+            frame._store = store
+            frame._frame_index = frame_index
+
+    def share_store(self):
+        """Move the frames to one store, after frames were added with a store of their own (a copied or a new frame
+        has one), so that set_all_bones_matrix computes them in one go again. Frames of different sizes are left
+        alone."""
+        nb_bones_set = {frame._store.get_nb_bones() for frame in self.frames}
+        if len(nb_bones_set) == 1:
+            self.set_nb_bones(nb_bones_set.pop())
+
+    def set_all_bones_matrix(self, bones: List[Bone]):
+        """set_all_bones_matrix on every frame, the frames sharing a store (all of them, unless edited) in one go"""
+        frame_by_store = {}
+        for frame in self.frames:
+            store_frame = frame_by_store.setdefault(id(frame._store), (frame._store, [], []))
+            store_frame[1].append(frame.mode_bit)
+            store_frame[2].append(frame._frame_index)
+        for store, mode_bit_list, frame_index_list in frame_by_store.values():
+            store.set_all_bones_matrix(bones, mode_bit_list, frame_index_list)
+
     def __str__(self):
-        return f"Animation(nb_frames:{len(self.frames)}, {self.frames})"
+        return f"Animation(nb_frames:{self.get_nb_frame()}, {self.frames})"
 
     def __repr__(self):
         return self.__str__()
@@ -1439,6 +2089,8 @@ class Animation:
         self.frames.append(frame)
 
     def get_nb_frame(self):
+        if not self.is_expanded():
+            return self.packed.get_nb_frame()
         return len(self.frames)
 
     def create_interpolated_frames(self, bones: List[Bone], factor: int = 4, smooth_loop: bool = False,
@@ -1579,7 +2231,9 @@ class Animation:
         nb_bones = len(bones)
         new_frame = AnimationFrame(nb_bones)
         new_frame.mode_bit = frame_a.mode_bit
-        new_frame.rotation_vector_data_supp = copy.deepcopy(frame_a.rotation_vector_data_supp)
+        # Bone per bone: a frame_a of another size must not resize the new frame
+        for bone_index, supp in enumerate(frame_a.rotation_vector_data_supp[:nb_bones]):
+            new_frame.rotation_vector_data_supp[bone_index] = supp
 
         # Skeleton position: raw units, straight through the chosen curve
         for axis in range(3):
@@ -1607,8 +2261,6 @@ class Animation:
         if frame_a.mode_bit == 1 or frame_b.mode_bit == 1:
             new_frame.mode_bit = 1
             for bone_index in range(nb_bones):
-                if bone_index >= len(new_frame.rotation_vector_data_supp):
-                    new_frame.rotation_vector_data_supp.append(RotationVectorDataSupp())
                 supp = new_frame.rotation_vector_data_supp[bone_index]
                 for axis in range(3):
                     raw_value = interpolation.interpolate_value(
@@ -1658,6 +2310,10 @@ class Animation:
         return len(bit_sizes) - 1
 
     def to_binary(self) -> bytearray:
+        if not self.is_expanded():
+            data = self.packed.to_binary()
+            data.extend(self.original_tail)
+            return data
         data = bytearray()
         data.extend(len(self.frames).to_bytes(1, byteorder='little'))
 
@@ -1692,6 +2348,9 @@ class AnimationSection:
         parsed file that isn't being shown shouldn't carry them. Save/round-trip is unaffected:
         it re-encodes each frame from its rotations, never the matrices."""
         for anim in self.animations:
+            if not anim.is_expanded():
+                anim._packed_bones = None  # Frames built later without their matrices
+                continue
             for frame in anim.frames:
                 frame.free_matrices()
         self.matrices_built = False
@@ -1699,10 +2358,14 @@ class AnimationSection:
     def build_bone_matrices(self, bones):
         """(Re)compute every frame's derived render matrices from its rotations."""
         for anim in self.animations:
+            if not anim.is_expanded():
+                anim._packed_bones = bones  # Built with the frames, on first access
+                continue
+            anim.set_nb_bones(len(bones))
             for frame in anim.frames:
                 if getattr(frame, 'bone_matrices', None) is None:
                     frame._reset_matrix_lists(len(bones))
-                frame.set_all_bones_matrix(bones)
+            anim.set_all_bones_matrix(bones)
         self.matrices_built = True
 
     def free_animations(self):
@@ -1715,37 +2378,31 @@ class AnimationSection:
         self.matrices_built = False
 
     def analyze(self, data: bytes, bone_section: BoneSection):
+        """Read every animation in one pass over its bitstream (PackedAnimation). The AnimationFrame objects of an
+        animation are only built, with their bone matrices, on the first access to its frames."""
         # Read animation section header
         self.nb_animations = int.from_bytes(data[0:4], byteorder='little')
         for i in range(self.nb_animations):
             off = int.from_bytes(data[4 + i * 4: 8 + i * 4], byteorder='little')
             self.offsets.append(off)
+        word_list = PackedAnimation.get_word_list(data)
         for anim_idx in range(self.nb_animations):
             anim_start = self.offsets[anim_idx]
             anim: Animation = Animation()
-            anim.frames = []
-
-            # BitReader starts at byte AFTER the frame count byte
-            br = BitReader(data, start_byte=anim_start + 1)
-
-            for frame_index in range(data[anim_start]):
-                anim.add_frame(br, bone_section)
+            packed, anim_end = PackedAnimation.decode(data, anim_start, len(bone_section.bones), word_list)
+            anim.set_packed(packed, bone_section.bones)
 
             # The bit-stream rarely ends on a byte boundary: the leftover high
             # bits of the final byte are never read by the game
             # (Battle_ReadAnimation reads exactly the frames' bits) and are
             # zero-filled on save instead of preserving Square's original
             # garbage there.
-            if br._bit_pos > 0:
-                anim_end = br._byte_pos + 1
-            else:
-                anim_end = br._byte_pos
             next_start = self.offsets[anim_idx + 1] if anim_idx + 1 < self.nb_animations else len(data)
             if anim_end < next_start:
                 anim.original_tail = bytes(data[anim_end:next_start])
 
             self.animations.append(anim)
-
+        self.matrices_built = True
 
     def __str__(self):
         return f"AnimationSection(nb:{self.nb_animations}, {self.animations})"
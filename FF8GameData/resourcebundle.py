@@ -0,0 +1,59 @@
+"""
+Build of the json resource bundles (FF8GameData/Resources/bundle).
+Parsing a json then converting its hex strings to int and its type strings to SectionType is done on each run, while
+the json almost never change. The result of this work is saved here as a pickle, next to what it is valid for (see
+GameData.get_resource_bundle_key), and GameData.read_json_resource loads it instead of the json. A stale bundle (json
+modified, converters changed, other bundle version) is ignored and the json is parsed as before.
+Loading never writes a bundle, they are only built by: python -m FF8GameData.resourcebundle [FF8GameData folder]
+"""
+import json
+import os
+import pickle
+import sys
+import tempfile
+
+from FF8GameData.gamedata import GameData
+
+
+def _write_bundle(bundle_path: str, key: tuple, data):
+    """Written aside then renamed, so a reader never sees a partial bundle"""
+    os.makedirs(os.path.dirname(bundle_path), exist_ok=True)
+    file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(bundle_path), suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as bundle_file:
+            pickle.dump(key, bundle_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, bundle_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, bundle_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def build_resource_bundle(game_data_submodule_path: str = "FF8GameData") -> list[str]:
+    """
+    Build the bundle of every json of GameData.get_json_resource_list
+    :param game_data_submodule_path: The FF8GameData folder
+    :return: The path of the bundles built
+    """
+    json_folder = os.path.join(game_data_submodule_path, "Resources", "json")
+    bundle_path_list = []
+    for json_name, post_process in GameData.get_json_resource_list():
+        json_path = os.path.join(json_folder, json_name)
+        if not os.path.isfile(json_path):
+            print(f"No {json_path}, no bundle for it")
+            continue
+        # The key is taken before reading, a json modified meanwhile gives a stale bundle and not a wrong one
+        key = GameData.get_resource_bundle_key(json_path, post_process)
+        with open(json_path, encoding="utf8") as json_file:
+            data = json.load(json_file)
+        if post_process:
+            post_process(data)
+        bundle_path = GameData.get_resource_bundle_path(json_path)
+        _write_bundle(bundle_path, key, data)
+        bundle_path_list.append(bundle_path)
+    return bundle_path_list
+
+
+if __name__ == "__main__":
+    for path in build_resource_bundle(sys.argv[1] if len(sys.argv) > 1 else "FF8GameData"):
+        print(f"Built {path}")
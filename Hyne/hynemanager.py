@@ -31,6 +31,7 @@ import shutil
 import struct
 import time
 
+from FF8GameData.fs import lzs
 from FF8GameData.gamedata import GameData
 from Quezacotl.quezacotlmanager import (
     GfEntry, CharacterEntry, ConfigEntry, MiscEntry, ItemEntry,
@@ -60,46 +61,8 @@ def lzss_decompress(payload: bytes) -> bytes:
     """Archive_LZSSDecompress@0x40f852: flag byte (LSB-first) gates 8 tokens; bit=1 -> literal
     byte; bit=0 -> 2-byte back-reference (12-bit offset, base 0xFEE, length = 3..18). Ring
     positions before the real output start read as 0x00 (not the 0x20 many other PSX LZSS
-    variants use)."""
-    out = bytearray()
-    i = 0
-    n = len(payload)
-    flag_bits = 0
-    flags = 0
-    while True:
-        if flag_bits == 0:
-            flag_bits = 8
-            if i >= n:
-                break
-            flags = payload[i]
-            i += 1
-        bit = flags & 1
-        flags >>= 1
-        flag_bits -= 1
-        if bit:
-            if i >= n:
-                break
-            out.append(payload[i])
-            i += 1
-        else:
-            if i + 1 >= n:
-                break
-            ref_lo = payload[i]
-            ref_hi = payload[i + 1]
-            i += 2
-            raw12 = ((ref_hi & 0xF0) << 4) | ref_lo
-            length = (ref_hi & 0xF) + 3
-            cur_len = len(out)
-            delta = (cur_len - raw12 + 0xFEE) & 0xFFF
-            win_pos = cur_len - delta
-            copy_end = cur_len + length
-            while win_pos < 0 and len(out) < copy_end:
-                out.append(0)
-                win_pos += 1
-            while len(out) < copy_end:
-                out.append(out[win_pos])
-                win_pos += 1
-    return bytes(out)
+    variants use). Same codec as the fs archives, see FF8GameData/fs/lzs.py."""
+    return bytes(lzs.decode(payload, ring_fill=0x00, ring_start=0xFEE))
 
 
 def lzss_compress_all_literal(data: bytes) -> bytes:
@@ -107,20 +70,7 @@ def lzss_compress_all_literal(data: bytes) -> bytes:
     but DO NOT USE for anything that gets written back to disk: it inflates an 8192-byte image to
     ~9216 bytes, which BREAKS a real save (see lzss_compress below). Kept only because a couple of
     early tests exercise the all-literal token-framing path in isolation."""
-    out = bytearray()
-    for i in range(0, len(data), 8):
-        chunk = data[i:i + 8]
-        out.append(0xFF if len(chunk) == 8 else (1 << len(chunk)) - 1)
-        out.extend(chunk)
-    return bytes(out)
-
-
-# Max representable back-reference distance: the format's offset field is 12 bits (0..4095) with
-# mod-4096 ring-buffer arithmetic, so a distance of exactly 4096 would alias to 0 and corrupt the
-# reference - the window must stop at 4095, not 4096.
-_LZSS_WINDOW = 4095
-_LZSS_MIN_MATCH = 3
-_LZSS_MAX_MATCH = 18
+    return bytes(lzs.encode_literal(data))
 
 
 def lzss_compress(data: bytes) -> bytes:
@@ -135,62 +85,13 @@ def lzss_compress(data: bytes) -> bytes:
     save slot "unused block" and deletes it (root-caused after breaking a real save file - see
     the [[ff8-save-file-format]] memory entry).
 
-    A greedy longest-match encoder is more than sufficient: real save data is mostly zeroed/
-    repeated bytes (unused item slots, unrecruited-character blocks, ...), so even this naive
-    matcher lands within a couple bytes of the game's own compressor's output size, comfortably
-    under the 8192-byte ceiling.
+    The shared longest-match encoder of FF8GameData/fs/lzs.py is more than sufficient: real save
+    data is mostly zeroed/repeated bytes (unused item slots, unrecruited-character blocks, ...),
+    so it lands within a couple bytes of the game's own compressor's output size, comfortably
+    under the 8192-byte ceiling. Its window never reaches a distance of 4096, which the format's
+    mod-4096 ring arithmetic would alias to 0.
     """
-    n = len(data)
-    out = bytearray()
-    flag_byte_pos = None
-    flag_bits_used = 0
-    flag_value = 0
-
-    def start_group():
-        nonlocal flag_byte_pos, flag_bits_used, flag_value
-        out.append(0)  # placeholder, patched in below
-        flag_byte_pos = len(out) - 1
-        flag_bits_used = 0
-        flag_value = 0
-
-    def push_bit(bit, payload_bytes):
-        nonlocal flag_bits_used, flag_value
-        if flag_bits_used == 8 or flag_byte_pos is None:
-            start_group()
-        if bit:
-            flag_value |= (1 << flag_bits_used)
-        out.extend(payload_bytes)
-        flag_bits_used += 1
-        out[flag_byte_pos] = flag_value
-
-    i = 0
-    while i < n:
-        best_len = 0
-        best_dist = 0
-        window_start = max(0, i - _LZSS_WINDOW)
-        max_len = min(_LZSS_MAX_MATCH, n - i)
-        if max_len >= _LZSS_MIN_MATCH:
-            for j in range(window_start, i):
-                length = 0
-                while length < max_len and data[j + length] == data[i + length]:
-                    length += 1
-                if length > best_len:
-                    best_len = length
-                    best_dist = i - j
-                    if best_len == max_len:
-                        break
-        if best_len >= _LZSS_MIN_MATCH:
-            # Inverse of the decompressor's win_pos = cur_len - ((cur_len - raw12 + 0xFEE) &
-            # 0xFFF): raw12 = (i - dist + 0xFEE) & 0xFFF.
-            raw12 = (i - best_dist + 0xFEE) & 0xFFF
-            ref_lo = raw12 & 0xFF
-            ref_hi = ((raw12 >> 4) & 0xF0) | ((best_len - 3) & 0xF)
-            push_bit(0, bytes([ref_lo, ref_hi]))
-            i += best_len
-        else:
-            push_bit(1, bytes([data[i]]))
-            i += 1
-    return bytes(out)
+    return bytes(lzs.encode(data, ring_fill=0x00, ring_start=0xFEE))
 
 
 import hashlib
@@ -19,7 +19,7 @@ RESERVED_TOOLTIP = ("Read-only: this byte has no meaning in the game (confirmed
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from SolomonRing.kernellookups import LookupRegistry
 from Quezacotl.quezacotlmanager import (
     CHARACTER_NAMES, ACTIVE_ABILITY_RANGE, PASSIVE_ABILITY_RANGE,
@@ -81,7 +81,7 @@ class HyneWidget(QWidget):
             file_registry = FileRegistry()
         self.file_registry = file_registry
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.manager = HyneManager(self.game_data)
         self.icon_path = icon_path
 
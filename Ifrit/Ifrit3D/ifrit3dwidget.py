@@ -1,4 +1,3 @@
-import gc
 import pathlib
 
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QSettings
@@ -14,45 +13,6 @@ from FF8GameData.dat import interpolation
 from SmallWidget.interpolationselector import InterpolationSelector
 
 
-class _PlaybackTimer(QTimer):
-    """A QTimer that suspends Python's cyclic garbage collector while it is running.
-
-    Animation playback allocates a little per frame. Automatic GC pauses scale with the TOTAL
-    live-object count across EVERY loaded file, not just the active one - so opening many files
-    makes gen1/gen2 collections stutter the 3D player even though the active file's per-frame work
-    is unchanged (measured: worst-frame time 3 ms at 2 files -> 33 ms at 16 files, mean flat). This
-    is the "flawless with two files, unbearable with many" lag. Pausing GC for the duration of
-    playback removes those pauses entirely; a single collect() when playback stops reclaims the
-    playback garbage. Ref-counted on each timer's real active state so nested/among-viewers
-    start/stop (and harmless double start()s) balance correctly, and it only re-enables GC if it
-    was the one that disabled it (never fights external gc.disable())."""
-    _running = 0
-    _we_disabled = False
-
-    def start(self, *args):
-        if not self.isActive():
-            _PlaybackTimer._running += 1
-            _PlaybackTimer._sync()
-        super().start(*args)
-
-    def stop(self):
-        if self.isActive():
-            _PlaybackTimer._running -= 1
-        super().stop()
-        _PlaybackTimer._sync()
-
-    @classmethod
-    def _sync(cls):
-        if cls._running > 0:
-            if gc.isenabled():
-                gc.disable()
-                cls._we_disabled = True
-        elif cls._we_disabled:
-            cls._we_disabled = False
-            gc.enable()
-            gc.collect()
-
-
 class _HoverMenuButton(QToolButton):
     """A tool button that drops its menu on hover (not just click) - used to hang a small
     options submenu off the Skeleton toggle so extra skeleton options stay out of the toolbar
@@ -161,10 +121,10 @@ class Ifrit3DWidget(QWidget):
         self._rot_drag_start_deg = None
         self._rot_drag_start_raw = None
 
-        # Setup animation timer. _PlaybackTimer pauses Python's GC while playing so gen1/gen2
-        # collection pauses (which scale with the total objects of ALL loaded files) don't stutter
-        # the 3D player - this is the many-files-open playback lag.
-        self.timer = _PlaybackTimer()
+        # Setup animation timer. The bone data of the loaded files lives in NumPy arrays
+        # (AnimationFrameStore), not in millions of small objects, so the GC collections during
+        # playback stay short however many files are open.
+        self.timer = QTimer()
         self.timer.timeout.connect(self.next_frame)
 
         if show_controls:
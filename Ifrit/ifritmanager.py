@@ -20,9 +20,8 @@ from FF8GameData.dat.animsplitter import (split_and_convert_animation, get_conve
                                           get_max_frame_for_animation, get_nb_part_needed,
                                           can_split_animation, MAX_ANIMATION_ID, MAX_ANIMATION_FRAME)
 from FF8GameData.tim.timfile import decode_tim, force_opaque
-from FF8GameData.gamedata import GameData
-from FF8GameData.monsterdata import (Matrix4x4, Animation, EntityType, Bone,
-                                     RotationType, RotationVectorDataSupp)
+from FF8GameData.gamedata import get_shared_game_data
+from FF8GameData.monsterdata import Matrix4x4, Animation, EntityType, Bone
 from Ifrit.IfritAI.AICompiler.AICompiler import AICompiler
 from Ifrit.IfritAI.AICompiler.AIDecompiler import AIDecompiler
 from Ifrit.IfritXlsx import xlsxmanager
@@ -113,13 +112,12 @@ class TextureData:
 
 class IfritManager:
     def __init__(self, game_data_folder="FF8GameData", vincent_tim_path=None, game_data=None):
-        # A caller loading several models (e.g. a party) can pass one already-load_all()ed
-        # GameData to share, instead of paying that cost per manager.
+        # A caller loading several models (e.g. a party) can pass its GameData to share.
+        # The resources are loaded on first access.
         if game_data is not None:
             self.game_data = game_data
         else:
-            self.game_data = GameData(game_data_folder)
-            self.game_data.load_all()
+            self.game_data = get_shared_game_data(game_data_folder)
         self.enemy = MonsterAnalyser(self.game_data)
         self.compiler = AICompiler(self.game_data, self.enemy.battle_script_data['battle_text'], self.enemy.info_stat_data)
         self.decompiler = AIDecompiler(self.game_data, self.enemy.battle_script_data['battle_text'], self.enemy.info_stat_data)
@@ -629,11 +627,11 @@ class IfritManager:
         self._ensure_matrices()          # rebuild if this file's matrices were freed
         anim = self.enemy.animation_data.animations[anim_id]
         frame = anim.frames[frame_id]
-        matrices = frame.bone_matrices  # already built!
+        matrices = list(frame.bone_matrices)  # already built!
 
         if next_frame_id is not None:
             next_frame = anim.frames[next_frame_id]
-            next_matrices = next_frame.bone_matrices
+            next_matrices = list(next_frame.bone_matrices)
         else:
             next_matrices = None
 
@@ -1062,13 +1060,7 @@ class IfritManager:
         bone_section.nb_bone = len(bone_section.bones)
 
         for anim in self.enemy.animation_data.animations:
-            for frame in anim.frames:
-                frame.rotation_vector_data.append(
-                    [RotationType(True, 0, 0) for _ in range(3)])
-                frame.rotation_vector_data_supp.append(RotationVectorDataSupp())
-                frame.bone_matrices.append(Matrix4x4())
-                frame.bone_chain_matrices.append(Matrix4x4())
-                frame.bone_acc_scale.append((1.0, 1.0, 1.0))
+            anim.set_nb_bones(new_id + 1)
             anim._recompute_frame_storage_types()
 
         self._recompute_all_animation_matrices()
@@ -1093,12 +1085,7 @@ class IfritManager:
         bone_section.nb_bone = 1
 
         for anim in self.enemy.animation_data.animations:
-            for frame in anim.frames:
-                frame.rotation_vector_data = frame.rotation_vector_data[:1]
-                frame.rotation_vector_data_supp = frame.rotation_vector_data_supp[:1]
-                frame.bone_matrices = frame.bone_matrices[:1]
-                frame.bone_chain_matrices = frame.bone_chain_matrices[:1]
-                frame.bone_acc_scale = frame.bone_acc_scale[:1]
+            anim.set_nb_bones(1)
             anim._recompute_frame_storage_types()
 
         for obj in self.enemy.geometry_data.object_data:
@@ -1260,12 +1247,7 @@ class IfritManager:
         if frame_id >= len(anim.frames):
             return
         frame = anim.frames[frame_id]
-
-        if bone_idx >= len(frame.rotation_vector_data_supp):
-            from FF8GameData.monsterdata import RotationVectorDataSupp
-            frame.rotation_vector_data_supp.extend(
-                RotationVectorDataSupp() for _ in range(bone_idx - len(frame.rotation_vector_data_supp) + 1))
-
+        # Every frame has a scale for each bone of the skeleton (add_bone grows them all)
         supp = frame.rotation_vector_data_supp[bone_idx]
         supp.set_scale_factor(0, scale_x)
         supp.set_scale_factor(1, scale_y)
@@ -1338,6 +1320,7 @@ class IfritManager:
             raise ValueError(f"the animation already has the maximum of {MAX_ANIMATION_FRAME} frames")
         new_frame = copy.deepcopy(anim.frames[frame_id])
         anim.frames.insert(frame_id + 1, new_frame)
+        anim.share_store()
         # Deltas of the inserted frame and the one after it changed: refresh storage types.
         anim._recompute_frame_storage_types()
         return frame_id + 1
@@ -1382,6 +1365,7 @@ class IfritManager:
         to_insert = [copy.deepcopy(f) for f in frames[:room]]
         pos = max(0, min(len(anim.frames), int(at_index) + 1))
         anim.frames[pos:pos] = to_insert
+        anim.share_store()
         # The inserted frames and the one after them are delta-encoded from new predecessors.
         anim._recompute_frame_storage_types()
         return len(to_insert)
@@ -1487,9 +1471,10 @@ class IfritManager:
 
     def _recompute_all_animation_matrices(self):
         """Rebuild bone matrices for every frame of every animation."""
+        self._ensure_matrices()
+        bones = self.enemy.bone_data.bones
         for anim in self.enemy.animation_data.animations:
-            for frame_id in range(anim.get_nb_frame()):
-                self._recompute_frame_matrices(anim, frame_id, None)
+            anim.set_all_bones_matrix(bones)
 
     def _recompute_frame_matrices(self, anim, frame_id, changed_bone_idx=None):
         """
@@ -1504,22 +1489,20 @@ class IfritManager:
         bones = self.enemy.bone_data.bones
         nb_bones = len(bones)
 
-        # Determine which bones need recomputation
-        if changed_bone_idx is not None:
-            # The whole subtree, not just direct children: grandchildren
-            # chain from their parent's matrices too. FF8 skeletons store
-            # children after their parent, so one forward pass collects it.
-            in_subtree = {changed_bone_idx}
-            for i in range(changed_bone_idx + 1, nb_bones):
-                if bones[i].parent_id in in_subtree:
-                    in_subtree.add(i)
-            bones_to_update = sorted(in_subtree)
-        else:
-            # Update all bones
-            bones_to_update = list(range(nb_bones))
+        if changed_bone_idx is None:
+            # Update all bones, in a few array operations
+            frame.set_all_bones_matrix(bones)
+            return
 
-        # Sort by index to ensure parents are processed before children
-        bones_to_update.sort()
+        # The whole subtree, not just direct children: grandchildren
+        # chain from their parent's matrices too. FF8 skeletons store
+        # children after their parent, so one forward pass collects it.
+        in_subtree = {changed_bone_idx}
+        for i in range(changed_bone_idx + 1, nb_bones):
+            if bones[i].parent_id in in_subtree:
+                in_subtree.add(i)
+        # Sorted by index to ensure parents are processed before children
+        bones_to_update = sorted(in_subtree)
 
         for bone_id in bones_to_update:
             parent_id = bones[bone_id].parent_id
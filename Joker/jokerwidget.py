@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QMessageBox
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from Joker.jokermanager import JokerManager
 from Joker.sp2editorwidget import Sp2EditorWidget
 
@@ -28,7 +28,7 @@ class JokerWidget(QWidget):
         if file_registry is None:  # Used alone, it shares its files with nobody
             file_registry = FileRegistry()
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.manager = JokerManager(self.game_data)
 
         self.setWindowTitle("Joker")
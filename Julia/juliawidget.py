@@ -17,7 +17,7 @@ from PyQt6.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QLa
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from Julia.juliamanager import JuliaManager
 
 # Qt's FFmpeg backend dumps the stream layout to the console on every play.
@@ -43,7 +43,7 @@ class JuliaWidget(QWidget):
             file_registry = FileRegistry()
         self.icon_path = icon_path
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_monster_data()
         self.manager = JuliaManager(self.game_data)
 
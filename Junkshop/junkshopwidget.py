@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from Junkshop.junkshopmanager import JunkshopManager, WeaponUpgrade
 
 
@@ -24,7 +24,7 @@ class JunkshopWidget(QWidget):
         if file_registry is None:  # The tool is used alone, it shares its files with nobody
             file_registry = FileRegistry()
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_item_data()
         self.manager = JunkshopManager(self.game_data)
 
@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from FF8GameData.menu.pagerender import PageRenderer, CANVAS_WIDTH, CANVAS_HEIGHT
 from Moomba.moombamanager import MoombaManager, MagPageEntry
 
@@ -30,7 +30,7 @@ class MoombaWidget(QWidget):
         self.file_registry = file_registry
 
         # GameData init already loads the sysfnt character table used for text decoding
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.manager = MoombaManager(self.game_data)
         self.renderer = None  # Built once mngrp.bin is loaded (it carries the art, text and font)
 
@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from Odine.odinemanager import OdineManager
 
 CATEGORIES = [
@@ -30,7 +30,7 @@ class OdineWidget(QWidget):
         if file_registry is None:  # The tool is used alone, it shares its files with nobody
             file_registry = FileRegistry()
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_magic_data()
         self.manager = OdineManager(self.game_data)
 
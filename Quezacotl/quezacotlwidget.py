@@ -16,7 +16,7 @@ RESERVED_TOOLTIP = ("Read-only: this byte has no meaning in the game (confirmed
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from SolomonRing.kernellookups import LookupRegistry
 from Quezacotl.quezacotlmanager import (
     QuezacotlManager, ACTIVE_ABILITY_RANGE, PASSIVE_ABILITY_RANGE,
@@ -49,7 +49,7 @@ class QuezacotlWidget(QWidget):
         if file_registry is None:  # The tool is used alone, it shares its files with nobody
             file_registry = FileRegistry()
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.manager = QuezacotlManager(self.game_data)
         self.icon_path = icon_path
 
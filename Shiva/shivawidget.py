@@ -5,7 +5,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTabWidget, QMessageBox
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from FF8GameData.menu.mngrp.mngrpmanager import MngrpManager
 from Shiva.mngrpsave import keep_unowned_sections_raw
 from Shiva.ShivaRefine.shivarefinewidget import ShivaRefineWidget
@@ -32,7 +32,7 @@ class ShivaWidget(QWidget):
         if file_registry is None:  # The tool is used alone, it shares its files with nobody
             file_registry = FileRegistry()
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_sysfnt_data()  # To read the text of the section holding some
         self.game_data.load_mngrp_data()
         # The m00x sections name their refine entries from those
@@ -31,7 +31,7 @@ class BattleManager:
         ennemy.load_file_data(com_file, self.game_data)
 
         try:
-            ennemy.analyse_loaded_data(self.game_data)
+            ennemy.analyse_loaded_data(self.game_data, lazy=True)  # Only the names and texts are read
             name = ennemy.info_stat_data['monster_name'].get_str()
             self.ennemy_list.append(ennemy)
             self.section_text_list.append(
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import QVBoxLayout, QWidget, QPushButton, QFileDialog, QHBo
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData, FileType
+from FF8GameData.gamedata import get_shared_game_data, FileType
 from .shumifilepane import ShumiFilePane
 from .view.translatorwidget import TranslatorWidget
 
@@ -39,7 +39,7 @@ class ShumiTranslator(QWidget):
             file_registry = FileRegistry()
         self.file_registry = file_registry
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_kernel_data()
         self.game_data.load_mngrp_data()
         self.game_data.load_item_data()
@@ -1,4 +1,3 @@
-import json
 import os
 
 from PyQt6.QtWidgets import (
@@ -7,7 +6,7 @@ from PyQt6.QtWidgets import (
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import GameData, SectionType, get_shared_game_data
 from ShumiTranslator.model.kernel.kernelmanager import KernelManager
 from SolomonRing.kernellookups import LookupRegistry
 from SolomonRing.kernelsectiontab import KernelSectionTab
@@ -61,21 +60,16 @@ class SolomonRingWidget(QWidget):
             file_registry = FileRegistry()
 
         self.game_data_folder = game_data_folder
-        self.game_data = GameData(game_data_folder)
-        self.game_data.load_all()
+        self.game_data = get_shared_game_data(game_data_folder)
 
         self.kernel_manager = KernelManager(self.game_data)
         self.registry = LookupRegistry(self.game_data, game_data_folder)
         self.loaded_filename = None
 
-        with open(os.path.join(game_data_folder, "Resources", "json", "kernel_section_fields.json"),
-                  encoding="utf-8") as f:
-            self._section_configs = json.load(f)
-        with open(os.path.join(game_data_folder, "Resources", "json", "kernel_bin_data.json"),
-                  encoding="utf-8") as f:
-            kernel_json = json.load(f)
-        self._text_link = {s["id"]: s["section_id_text_linked"] for s in kernel_json["sections"]
-                           if s["type"] == "data"}
+        self._section_configs = GameData.read_json_resource(
+            os.path.join(game_data_folder, "Resources", "json", "kernel_section_fields.json"))
+        self._text_link = {s["id"]: s["section_id_text_linked"] for s in self.game_data.kernel_data_json["sections"]
+                           if s["type"] == SectionType.DATA}
 
         self._section_tabs = {}  # section_id -> KernelSectionTab
         self._tab_index_by_section = {}  # section_id -> top-level QTabWidget index
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QLa
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from FF8GameData.monsterdata import EntityType
 from Ifrit.IfritSeq.seqwidget import SeqWidget
 from Ifrit.IfritSeq.seqcommandwidget import build_op_code_model
@@ -43,7 +43,7 @@ class WattsWidget(QWidget):
             file_registry = FileRegistry()
 
         self._game_data_folder = game_data_folder
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         # The sequence editor needs the AnimSeq op-code data (translation, op-code
         # dropdown, code<->bytes); nothing else in r0win.dat needs game data.
         self.game_data.load_anim_sequence_data()
@@ -229,11 +229,10 @@ class WattsWidget(QWidget):
                                 "Some files were not added:\n- " + "\n- ".join(errors))
 
     def _shared_preview_game_data(self):
-        """One fully-loaded GameData reused by every party model, so load_all() (the heavy
-        part of importing a model) runs once instead of once per character."""
+        """One GameData reused by every party model, so each resource (the heavy part of
+        importing a model) is loaded once instead of once per character."""
         if self._preview_game_data is None:
-            self._preview_game_data = GameData(self._game_data_folder)
-            self._preview_game_data.load_all()
+            self._preview_game_data = get_shared_game_data(self._game_data_folder)
         return self._preview_game_data
 
     def _load_character_entry(self, file_name):
@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 
 from Common.filebinding import FileBinding
 from Common.fileregistry import FileRegistry
-from FF8GameData.gamedata import GameData
+from FF8GameData.gamedata import get_shared_game_data
 from FF8GameData.menu.magpage import MagPageEntry, UNUSED_ID
 from Zone.zonemanager import (ZoneManager, TEXTURE_CATEGORIES, DUEL_MOVE_NAMES,
                               ANGELO_MOVE_NAMES, BOOK_TEXT_FIRST_RAW_FILE)
@@ -47,7 +47,7 @@ class ZoneWidget(QWidget):
             file_registry = FileRegistry()
         self.file_registry = file_registry
 
-        self.game_data = GameData(game_data_folder)
+        self.game_data = get_shared_game_data(game_data_folder)
         self.game_data.load_sysfnt_data()  # for the mngrp book-text preview
         self.manager = ZoneManager(self.game_data)
         self.current_entry_index = -1
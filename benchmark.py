@@ -0,0 +1,244 @@
+"""
+Benchmarks of the FF8GameData decoders, each one comparing the former way of doing the work with the current one.
+They are kept here, out of the packages, so the library modules only carry the code they run.
+
+Usage:
+    python benchmark.py [benchmark-name ...] [--dat-folder FOLDER] [--dat-pattern PATTERN] [--nb-run N]
+
+Examples:
+    python benchmark.py
+    python benchmark.py lzs-decode lzs-encode
+    python benchmark.py animation-decode bone-matrices --dat-folder battle --dat-pattern "c0m*.dat"
+"""
+
+import argparse
+import glob
+import os
+import random
+import time
+
+from FF8GameData.dat.monsteranalyser import GarbageFileError, MonsterAnalyser
+from FF8GameData.fs import lzs
+from FF8GameData.fs.lzs import Lzs, LzsLevel
+from FF8GameData.monsterdata import Animation, AnimationSection, BitReader, EntityType
+
+
+def _load_monster_list(dat_folder: str, file_pattern: str) -> list[MonsterAnalyser]:
+    """The monsters of a folder whose sections can be parsed, lazily analysed"""
+    analyser_list = []
+    for dat_path in sorted(glob.glob(os.path.join(dat_folder, file_pattern))):
+        analyser = MonsterAnalyser(game_data=None)
+        analyser.load_file_data(dat_path, game_data=None)
+        if analyser.entity_type != EntityType.MONSTER:
+            continue
+        try:
+            analyser.analyse_loaded_data(game_data=None, lazy=True)
+            analyser.bone_data
+        except GarbageFileError:
+            continue
+        analyser_list.append(analyser)
+    return analyser_list
+
+
+def benchmark_load_file_data(dat_folder: str = "GFtoDat", file_pattern: str = "*.dat", nb_run: int = 5):
+    """
+    Compare the former per-byte loading (f.read(1) then a copy of each section) with load_file_data (one read, each
+    section a view into the file buffer) on every .dat of a folder.
+    :return: The time of the per-byte loading and of load_file_data, in seconds
+    """
+    dat_path_list = sorted(glob.glob(os.path.join(dat_folder, file_pattern)))
+    total_size = sum(os.path.getsize(dat_path) for dat_path in dat_path_list)
+    print(f"{len(dat_path_list)} files, {total_size} bytes, {nb_run} runs")
+
+    analyser = MonsterAnalyser(game_data=None)
+    section_pos_dict = {}
+    for dat_path in dat_path_list:
+        analyser.load_file_data(dat_path, game_data=None)
+        section_pos_dict[dat_path] = analyser.header_data['section_pos'][:analyser.header_data['nb_section']]
+
+    start_time = time.perf_counter()
+    for _ in range(nb_run):
+        for dat_path in dat_path_list:
+            file_raw_data = bytearray()
+            with open(dat_path, "rb") as f:
+                while el := f.read(1):
+                    file_raw_data.extend(el)
+            pos = section_pos_dict[dat_path] + [len(file_raw_data)]
+            section_list = [file_raw_data[pos[i]:pos[i + 1]] for i in range(len(pos) - 1)]
+    per_byte_time = time.perf_counter() - start_time
+    print(f"Per byte: {per_byte_time:.3f} seconds")
+
+    start_time = time.perf_counter()
+    for _ in range(nb_run):
+        for dat_path in dat_path_list:
+            analyser.load_file_data(dat_path, game_data=None)
+            analyser.section_raw_data = analyser._split_sections()
+    load_time = time.perf_counter() - start_time
+    print(f"load_file_data: {load_time:.3f} seconds ({per_byte_time / load_time:.1f}x faster)")
+    return per_byte_time, load_time
+
+
+def benchmark_animation_decode(dat_folder: str = "GFtoDat", file_pattern: str = "*.dat", nb_run: int = 3):
+    """
+    Compare the former animation section parsing (BitReader read_bits calls, one AnimationFrame with its matrices
+    per frame, through Animation.add_frame) with AnimationSection.analyze (one pass per animation into
+    PackedAnimation arrays) on every animation of the monsters of a folder.
+    :return: The time of the former parsing and of analyze, in seconds
+    """
+    animation_list = []  # (section raw data, bone section)
+    for analyser in _load_monster_list(dat_folder, file_pattern):
+        animation_raw_data = bytes(analyser.section_raw_data.get_view(3))
+        if animation_raw_data:
+            animation_list.append((animation_raw_data, analyser.bone_data))
+    print(f"{len(animation_list)} animation sections, {sum(len(data) for data, _ in animation_list)} bytes, "
+          f"{nb_run} runs")
+
+    start_time = time.perf_counter()
+    for _ in range(nb_run):
+        for data, bone_data in animation_list:
+            nb_animation = int.from_bytes(data[0:4], byteorder='little')
+            for anim_idx in range(nb_animation):
+                anim_start = int.from_bytes(data[4 + anim_idx * 4: 8 + anim_idx * 4], byteorder='little')
+                anim = Animation()
+                bit_reader = BitReader(data, start_byte=anim_start + 1)
+                for frame_index in range(data[anim_start]):
+                    anim.add_frame(bit_reader, bone_data)
+    bit_reader_time = time.perf_counter() - start_time
+    print(f"BitReader: {bit_reader_time:.3f} seconds")
+
+    start_time = time.perf_counter()
+    for _ in range(nb_run):
+        for data, bone_data in animation_list:
+            AnimationSection().analyze(data, bone_data)
+    analyze_time = time.perf_counter() - start_time
+    print(f"AnimationSection.analyze: {analyze_time:.3f} seconds ({bit_reader_time / analyze_time:.1f}x faster)")
+    return bit_reader_time, analyze_time
+
+
+def benchmark_bone_matrices(dat_folder: str = "GFtoDat", file_pattern: str = "*.dat", nb_run: int = 3):
+    """
+    Compare rebuilding the bone matrices of every frame of every animation bone per bone (set_bone_matrix, Matrix4x4
+    objects) with Animation.set_all_bones_matrix (bonematrix, one batched operation per level of the skeleton), on
+    the monsters of a folder.
+    :return: The time of the bone per bone rebuild and of the batched one, in seconds
+    """
+    animation_list = []  # (animation, bones)
+    for analyser in _load_monster_list(dat_folder, file_pattern):
+        bones = analyser.bone_data.bones
+        animation_list.extend((animation, bones) for animation in analyser.animation_data.animations)
+    for animation, bones in animation_list:
+        animation.frames  # Expanded beforehand, only the rebuild is timed
+    print(f"{len(animation_list)} animations, {sum(animation.get_nb_frame() for animation, _ in animation_list)} "
+          f"frames, {nb_run} runs")
+
+    start_time = time.perf_counter()
+    for _ in range(nb_run):
+        for animation, bones in animation_list:
+            for frame in animation.frames:
+                for bone_id, bone in enumerate(bones):
+                    parent_size = bones[bone.parent_id].get_size() if bone.parent_id != 0xFFFF else 0
+                    frame.set_bone_matrix(bone.parent_id, parent_size, bone_id)
+    per_bone_time = time.perf_counter() - start_time
+    print(f"set_bone_matrix per bone: {per_bone_time:.3f} seconds")
+
+    start_time = time.perf_counter()
+    for _ in range(nb_run):
+        for animation, bones in animation_list:
+            animation.set_all_bones_matrix(bones)
+    batched_time = time.perf_counter() - start_time
+    print(f"Animation.set_all_bones_matrix: {batched_time:.3f} seconds ({per_bone_time / batched_time:.1f}x faster)")
+    return per_bone_time, batched_time
+
+
+def benchmark_lzs_decode(uncompressed_size: int = 4 * 1024 * 1024, seed: int = 0):
+    """
+    Compare Lzs.decode (generator) and Lzs.decode_bytes on a generated multi-megabyte stream, mixing literals and
+    back-references (some of them overlapping) like a real file.
+    :return: The time of the generator and of decode_bytes, in seconds
+    """
+    rng = random.Random(seed)
+    input_bytes = bytearray()
+    decoded_size = 0
+    while decoded_size < uncompressed_size:
+        flags = rng.randrange(256)
+        input_bytes.append(flags)
+        for bit in range(8):
+            if flags & (1 << bit):
+                input_bytes.append(rng.randrange(256))
+                decoded_size += 1
+            else:
+                length = rng.randrange(16)
+                ring_pos = rng.randrange(Lzs.N)
+                input_bytes.append(ring_pos & 0xFF)
+                input_bytes.append(((ring_pos >> 4) & 0xF0) | length)
+                decoded_size += length + Lzs.THRESHOLD + 1
+    input_bytes = bytes(input_bytes)
+    print(f"Compressed size: {len(input_bytes)} bytes, uncompressed size: {decoded_size} bytes")
+
+    start_time = time.perf_counter()
+    generator_result = bytes(Lzs().decode(input_bytes))
+    generator_time = time.perf_counter() - start_time
+    print(f"decode (generator): {generator_time:.3f} seconds")
+
+    start_time = time.perf_counter()
+    bulk_result = Lzs().decode_bytes(input_bytes, expected_size=decoded_size)
+    bulk_time = time.perf_counter() - start_time
+    print(f"decode_bytes: {bulk_time:.3f} seconds ({generator_time / bulk_time:.1f}x faster)")
+    print("Same result:", generator_result == bulk_result)
+    return generator_time, bulk_time
+
+
+def benchmark_lzs_encode(input_bytes: bytes | None = None, nb_run: int = 3):
+    """
+    Compare the encoder levels on the same data (by default generated text-like data), checking each output decodes
+    back to the input.
+    :param nb_run: Each level is timed this many times and the best time is kept, a single run being at the mercy
+    of whatever else the machine is doing
+    :return: Level -> (best encode time, output size)
+    """
+    if input_bytes is None:
+        rng = random.Random(0)
+        words = [bytes(rng.choice(b"abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randrange(2, 9))) for _ in range(500)]
+        input_bytes = b" ".join(rng.choice(words) for _ in range(40000))
+    print(f"Uncompressed size: {len(input_bytes)} bytes")
+    results = {}
+    for level in LzsLevel:
+        encode_time = None
+        for _ in range(nb_run):
+            start_time = time.perf_counter()
+            output_bytes = lzs.encode(input_bytes, level=level)
+            run_time = time.perf_counter() - start_time
+            encode_time = run_time if encode_time is None else min(encode_time, run_time)
+        results[level] = (encode_time, len(output_bytes))
+        print(f"{level.name}: {encode_time:.3f} seconds, {len(output_bytes)} bytes, "
+              f"decodes back: {lzs.decode(output_bytes) == input_bytes}")
+    return results
+
+
+def main():
+    # Name -> function called with the parsed arguments
+    benchmark_dict = {
+        "load-file-data": lambda args: benchmark_load_file_data(args.dat_folder, args.dat_pattern, args.nb_run),
+        "animation-decode": lambda args: benchmark_animation_decode(args.dat_folder, args.dat_pattern, args.nb_run),
+        "bone-matrices": lambda args: benchmark_bone_matrices(args.dat_folder, args.dat_pattern, args.nb_run),
+        "lzs-decode": lambda args: benchmark_lzs_decode(),
+        "lzs-encode": lambda args: benchmark_lzs_encode(nb_run=args.nb_run),
+    }
+    parser = argparse.ArgumentParser(description="Benchmarks of the FF8GameData decoders")
+    parser.add_argument("benchmark", nargs="*",
+                        help=f"The benchmarks to run, all of them by default: {', '.join(benchmark_dict)}")
+    parser.add_argument("--dat-folder", default="GFtoDat",
+                        help="Folder of the .dat files (the extracted battle folder for the game's monsters)")
+    parser.add_argument("--dat-pattern", default="*.dat", help='Pattern of the .dat files, "c0m*.dat" for the monsters')
+    parser.add_argument("--nb-run", type=int, default=3, help="Number of runs of each timed loop")
+    args = parser.parse_args()
+    for name in args.benchmark:
+        if name not in benchmark_dict:
+            parser.error(f"Unknown benchmark {name}, expected one of: {', '.join(benchmark_dict)}")
+    for name in args.benchmark or benchmark_dict:
+        print(f"=== {name} ===")
+        benchmark_dict[name](args)
+
+
+if __name__ == "__main__":
+    main()
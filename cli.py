@@ -41,6 +41,7 @@ from Cli.moomba import MoombaCliTool
 from Cli.joker import JokerCliTool
 from Cli.piet import PietCliTool
 from Cli.watts import WattsCliTool
+from Cli.deling import DelingCliTool
 
 
 def _register_all_tools():
@@ -69,6 +70,7 @@ def _register_all_tools():
     registry.register(JokerCliTool)
     registry.register(PietCliTool)
     registry.register(WattsCliTool)
+    registry.register(DelingCliTool)
 
 
 def build_main_parser() -> argparse.ArgumentParser:
@@ -91,6 +93,7 @@ Examples:
   ff8-cli siren set-price --input price.bin --item-id 24 --buy-price 3000
   ff8-cli ifrit export-gltf --input c0m071.dat --output c0m071.glb
   ff8-cli alexander export-glb --input a0stg001.x --output stage.glb
+  ff8-cli deling extract --input field.fs --output field_extracted
   ff8-cli ccgroup list --folder extracted_files/field/mapdata
         """,
     )
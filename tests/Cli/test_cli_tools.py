@@ -514,6 +514,35 @@ def test_zone_export_png_warns_without_the_unlock_sources(capsys, tmp_path):
     assert "no --kernel" in out and "no --mwepon" in out
 
 
+def test_deling_list_and_extract(capsys, tmp_path, monkeypatch):
+    """Runs on a small archive built on the fly, no game file needed."""
+    from Cli.deling import DelingCliTool
+    from FF8GameData.fs.fsmanager import ArchiveWriter
+    writer = ArchiveWriter()
+    writer.add_entry("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\bccent1.msd", b"text" * 10)
+    writer.add_entry("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\chara.one", b"chara", compression_used=False)
+    writer.write_to_folder(str(tmp_path), "field")
+    fs_path = str(tmp_path / "field.fs")
+
+    capsys.readouterr()
+
+    def no_decode(*args, **kwargs):
+        raise AssertionError("list decoded an entry")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("FF8GameData.fs.lzs.Lzs.decode_bytes", no_decode)
+        patch.setattr("FF8GameData.fs.lzs.Lzs.decode", no_decode)
+        assert _run(DelingCliTool, ["list", "--input", fs_path]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "        40 c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\bccent1.msd",
+        "         5 c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\chara.one"]
+    out_dir = tmp_path / "out"
+    assert _run(DelingCliTool, ["extract", "--input", fs_path, "--output", str(out_dir)]) == 0
+    assert (out_dir / "ff8" / "data" / "eng" / "field" / "mapdata" / "bc" / "bccent1" / "bccent1.msd").read_bytes() == b"text" * 10
+    assert _run(DelingCliTool, ["extract", "--input", fs_path, "--output", str(out_dir)]) == 0
+    assert "2 already there" in capsys.readouterr().out
+
+
 def test_all_tools_registered():
     """cli.py must expose every Cli tool module."""
     import cli
@@ -525,4 +554,4 @@ def test_all_tools_registered():
     assert {"shumi-translator", "ifrit-ai", "ifrit", "tonberry-shop", "siren",
             "junkshop", "quezacotl", "kadowaki", "minimog", "shiva", "ccgroup", "cid",
             "julia", "solomon-ring", "alexander", "seed", "piet", "moomba",
-            "zone", "watts"} <= names
\ No newline at end of file
+            "zone", "watts", "deling"} <= names
\ No newline at end of file
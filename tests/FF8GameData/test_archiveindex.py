@@ -0,0 +1,46 @@
+"""Tests for the path index of the archives (FF8GameData/fs/archiveindex.py)."""
+from FF8GameData.fs.archiveindex import ArchiveIndex
+
+PATH_LIST = [
+    "c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\chara.one",
+    "c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\bccent1.msd",
+    "c:\\ff8\\data\\eng\\field\\mapdata\\bg\\bggate1\\bggate1.msd",
+    "c:\\ff8\\data\\eng\\field\\mapdata\\bg\\bggate1\\chara.one",
+    "c:\\ff8\\data\\eng\\field\\bc\\mapdata\\other.msd",
+]
+
+
+def _index():
+    index = ArchiveIndex()
+    for i, path in enumerate(PATH_LIST):
+        index.add(path, None, i)
+    return index
+
+
+def _found_index(entry_list):
+    return [i for _, _, i in entry_list]
+
+
+def test_find_name_and_path():
+    index = _index()
+    assert _found_index(index.find_name("chara.one")) == [0, 3]
+    assert _found_index(index.find_path(PATH_LIST[2])) == [2]
+    assert index.find_name("missing.one") == []
+
+
+def test_find_pattern_in_folder():
+    index = _index()
+    assert _found_index(index.find("*.msd", "mapdata\\bc")) == [1]
+    assert _found_index(index.find("*.msd")) == [1, 2, 4]
+    assert _found_index(index.find("b?gate*", "bg")) == [2]
+    assert _found_index(index.find(folder="bggate1")) == [2, 3]
+    assert _found_index(index.find("chara.one", "bc\\bccent1\\")) == [0]
+
+
+def test_extend_keeps_order():
+    index = _index()
+    nested = ArchiveIndex()
+    nested.add("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bcgate1\\chara.one", "nested", 0)
+    index.extend(nested)
+    assert len(index) == len(PATH_LIST) + 1
+    assert [archive for _, archive, _ in index.find_name("chara.one")] == [None, None, "nested"]
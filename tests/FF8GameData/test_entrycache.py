@@ -0,0 +1,47 @@
+"""Tests for the persistent cache of decoded archive entries (FF8GameData/fs/entrycache.py)."""
+import os
+
+from FF8GameData.fs.entrycache import EntryCache
+
+
+def test_entry_survives_a_new_instance(tmp_path):
+    EntryCache(str(tmp_path)).put(("field.fs", 10, 0, 4), b"decoded")
+    cache = EntryCache(str(tmp_path))
+    assert cache.get(("field.fs", 10, 0, 4)) == b"decoded"
+    assert cache.get(("field.fs", 10, 0, 8)) is None
+    assert cache.get_size() == len(b"decoded")
+
+
+def test_least_recently_used_is_evicted_first(tmp_path):
+    cache = EntryCache(str(tmp_path), max_size=20)
+    cache.put(("a",), bytes(8))
+    cache.put(("b",), bytes(8))
+    assert cache.get(("a",)) is not None  # "b" is now the least recently used
+    cache.put(("c",), bytes(8))
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None and cache.get(("c",)) is not None
+    assert cache.get_size() == 16
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_entry_bigger_than_the_cache_is_not_stored(tmp_path):
+    cache = EntryCache(str(tmp_path), max_size=4)
+    cache.put(("big",), bytes(5))
+    assert cache.get(("big",)) is None
+    assert cache.get_size() == 0
+
+
+def test_archive_key_changes_with_the_file(tmp_path):
+    fs_path = tmp_path / "field.fs"
+    fs_path.write_bytes(b"1234")
+    key = EntryCache.make_archive_key(str(fs_path))
+    fs_path.write_bytes(b"12345")
+    assert EntryCache.make_archive_key(str(fs_path)) != key
+
+
+def test_clear(tmp_path):
+    cache = EntryCache(str(tmp_path))
+    cache.put(("a",), b"data")
+    cache.clear()
+    assert cache.get(("a",)) is None
+    assert os.listdir(tmp_path) == []
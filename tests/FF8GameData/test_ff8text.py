@@ -0,0 +1,109 @@
+"""Tests for FF8Text (FF8GameData/GenericSection/ff8text.py): bytes kept, text decoded on demand."""
+import pathlib
+
+import pytest
+
+from FF8GameData.GenericSection.ff8text import FF8Text
+from FF8GameData.gamedata import GameData
+
+PROJECT_ROOT = pathlib.Path(__file__).parent.parent.parent
+
+
+@pytest.fixture(scope="module")
+def game_data():
+    return GameData(str(PROJECT_ROOT / "FF8GameData"))
+
+
+@pytest.fixture
+def counted_codec(game_data, monkeypatch):
+    call_list = []
+    translate_hex_to_str = game_data.translate_hex_to_str
+    translate_str_to_hex = game_data.translate_str_to_hex
+    monkeypatch.setattr(game_data, "translate_hex_to_str",
+                        lambda *args, **kwargs: call_list.append("decode") or translate_hex_to_str(*args, **kwargs))
+    monkeypatch.setattr(game_data, "translate_str_to_hex",
+                        lambda *args, **kwargs: call_list.append("encode") or translate_str_to_hex(*args, **kwargs))
+    return call_list
+
+
+def _text(game_data, text):
+    return bytearray(GameData.translate_str_to_hex(game_data, text))  # Not counted by counted_codec
+
+
+def test_text_is_decoded_once_on_demand(game_data, counted_codec):
+    data_hex = _text(game_data, "Squall, 100 Gil!") + bytearray(3)
+    ff8_text = FF8Text(game_data, own_offset=0, data_hex=data_hex, id=0)
+    assert counted_codec == []
+    assert ff8_text.get_data_hex() == data_hex[:-2]  # A single ending 0x00
+    assert len(ff8_text) == len(data_hex) - 2
+    assert ff8_text.get_str() == "Squall, 100 Gil!"
+    assert ff8_text.get_str() == "Squall, 100 Gil!"
+    assert counted_codec == ["decode"]
+
+
+def test_set_str_only_encodes_a_changed_text(game_data, counted_codec):
+    ff8_text = FF8Text(game_data, own_offset=0, data_hex=_text(game_data, "Rinoa") + bytearray(1), id=0)
+    ff8_text.set_str(ff8_text.get_str())
+    assert counted_codec == ["decode"]
+    ff8_text.set_str("Quistis")
+    assert counted_codec == ["decode", "encode"]
+    assert ff8_text.get_data_hex() == _text(game_data, "Quistis") + bytearray(1)
+    assert ff8_text.get_str() == "Quistis"
+
+
+@pytest.mark.parametrize("data_hex, cursor_location_size, first_hex_literal", [
+    (bytes([0x04, 0x00, 0x00]), 2, False),  # The 0x00 argument of {x0400} is kept
+    (bytes([0x45, 0x00, 0x46, 0x00]), 2, False),  # A 0x00 inside the text is removed
+    (bytes([0x0b, 0x20, 0x00, 0x00]), 3, False),
+    (bytes([0x0b, 0x20, 0x00, 0x00]), 2, False),
+    (bytes([0x00, 0x45, 0x00]), 2, True),  # The literal first byte is kept
+    (bytes([0x45, 0x04]), 2, False),  # A control byte missing its argument
+    (bytes([0x00, 0x00]), 2, False),
+    (bytes(), 2, False),
+])
+def test_bytes_are_the_ones_of_the_encoded_text(game_data, data_hex, cursor_location_size, first_hex_literal):
+    """The 0x00 are removed at the byte level as decoding then encoding the text did"""
+    ff8_text = FF8Text(game_data, own_offset=0, data_hex=bytearray(data_hex), id=0,
+                       cursor_location_size=cursor_location_size, first_hex_literal=first_hex_literal)
+    text = game_data.translate_hex_to_str(data_hex, cursor_location_size=cursor_location_size,
+                                          first_hex_literal=first_hex_literal)
+    expected = bytearray(game_data.translate_str_to_hex(text))
+    if text:
+        expected.append(0x00)
+    assert ff8_text.get_data_hex() == expected
+    assert ff8_text.get_str() == text
+
+
+def test_add_keeps_both_texts(game_data):
+    first = FF8Text(game_data, own_offset=0, data_hex=_text(game_data, "Zell") + bytearray(1), id=0)
+    second = FF8Text(game_data, own_offset=5, data_hex=_text(game_data, "Selphie") + bytearray(1), id=1)
+    merged = first + second
+    assert merged.get_str() == "ZellSelphie"
+    assert first.get_str() == "Zell"
+    assert first.get_data_hex() == _text(game_data, "Zell") + bytearray(1)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("nton", "{nt}{on}"),  # The list order would give n{to}n
+    ("ne r", "{ne}{ r}"),
+    ("{Squall} in", "{Squall} {in}"),  # The tags are kept as is
+    ("{in}e ", "{in}{e }"),
+    ("\\ne", "\\ne"),
+    ("", ""),
+])
+def test_compress_text_gives_the_fewest_bytes(text, expected):
+    assert FF8Text.compress_text(text) == expected
+
+
+def test_compress_str_respects_the_compressibility_factor(game_data):
+    text_list = [FF8Text(game_data, own_offset=0, data_hex=_text(game_data, "nton") + bytearray(1), id=id)
+                 for id in range(2)]
+    for compressible, expected in ((0, ["nton", "nton"]), (1, ["{nt}{on}", "nton"]), (2, ["nton", "{nt}{on}"])):
+        for ff8_text in text_list:
+            ff8_text.uncompress_str()
+            ff8_text.compress_str(compressible)
+        assert [ff8_text.get_str() for ff8_text in text_list] == expected
+    text_list[0].compress_str(3)
+    assert len(text_list[0]) == 3
+    text_list[0].uncompress_str()
+    assert text_list[0].get_str() == "nton"
@@ -9,7 +9,7 @@ import pytest
 
 from FF8GameData.font.atlas import ATLAS_COLUMNS, GLYPH_SIZE, FontAtlas
 from FF8GameData.font.textlayout import (DEFAULT_COLOR, MENU_TEXT_LINE_HEIGHT,
-                                         SEED_TEST_LINE_HEIGHT, FontMetrics, layout_text)
+                                         SEED_TEST_LINE_HEIGHT, FontMetrics, TextLayoutCache, layout_text)
 from FF8GameData.gamedata import GameData
 
 PROJECT_ROOT = pathlib.Path(__file__).parent.parent.parent
@@ -62,6 +62,32 @@ def test_overflows_uses_the_callers_envelope(game_data):
     assert layout.overflows(max_width=100, max_lines=8) is False
 
 
+def test_glyph_widths_are_memoized():
+    metrics = FontMetrics.from_tdw_bytes(bytes(8) + bytes([0x21, 0x43]))  # Glyph 0-3: widths 1, 2, 3, 4
+    assert [metrics.glyph_width(code) for code in range(0x20, 0x24)] == [1, 2, 3, 4]
+    assert metrics.glyph_width(0x24) == 8  # Past the table
+    assert metrics.glyph_width(0x20 + 173) == 9 and metrics.glyph_width(0x20 + 174) == 10
+    assert metrics.glyph_width(0x1F) == 0
+
+
+def test_layout_cache_walks_each_encoded_text_once(game_data, monkeypatch):
+    from FF8GameData.font import textlayout
+    walk_list = []
+    layout_text_hex = textlayout.layout_text_hex
+    monkeypatch.setattr(textlayout, "layout_text_hex",
+                        lambda text_hex, *args: walk_list.append(text_hex) or layout_text_hex(text_hex, *args))
+    metrics = FontMetrics(widths=None)
+    layout_cache = TextLayoutCache(game_data, metrics, line_height=SEED_TEST_LINE_HEIGHT)
+    first = layout_cache.layout("AB\\nC")
+    assert layout_cache.layout("AB\\nC") is first
+    assert layout_cache.layout_hex(game_data.translate_str_to_hex("AB\\nC")) is first
+    assert len(walk_list) == len(layout_cache) == 1
+    expected = layout_text("AB\\nC", game_data, metrics, line_height=SEED_TEST_LINE_HEIGHT)
+    assert (first.line_widths, first.height) == (expected.line_widths, expected.height) == ([16, 8], 32)
+    with pytest.raises(ValueError):
+        layout_cache.layout("abc☃")
+
+
 def test_atlas_cell_maths():
     """menu_draw_text: cell = code - 0x20, U = 12*(cell%21), V = 12*(cell/21)."""
     # A fake 21-column atlas where every cell is a distinct solid colour is
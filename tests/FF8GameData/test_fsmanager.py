@@ -0,0 +1,452 @@
+"""Tests for the fs/fi/fl archive reader (FF8GameData/fs/fsmanager.py).
+
+A small synthetic archive is built with known entries (one of them a nested
+archive, as in field.fs) so the tests don't need the original game files.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from FF8GameData.fs import fsmanager, lzs
+from FF8GameData.fs.entrycache import EntryCache
+from FF8GameData.fs.fsmanager import Archive, ArchiveWriter, FsManager, _split_by_packed_length
+from FF8GameData.fs.lzs import Lzs
+
+
+def _literal_lzs(data: bytes) -> bytes:
+    """Valid LZS stream made only of literals (flag byte 0xFF before each 8 bytes)."""
+    out = bytearray()
+    for i in range(0, len(data), 8):
+        chunk = data[i:i + 8]
+        out.append(0xFF if len(chunk) == 8 else (1 << len(chunk)) - 1)
+        out.extend(chunk)
+    return bytes(out)
+
+
+def _pack(entries):
+    """entries: list of (fl path, data, compressed). Return the (fs, fi, fl) bytes."""
+    fs = bytearray()
+    fi = bytearray()
+    fl_lines = []
+    for path, data, compressed in entries:
+        fi += len(data).to_bytes(4, "little") + len(fs).to_bytes(4, "little") + int(compressed).to_bytes(4, "little")
+        if compressed:
+            packed = _literal_lzs(data)
+            fs += len(packed).to_bytes(4, "little") + packed
+        else:
+            fs += data
+        fl_lines.append(path)
+    return bytes(fs), bytes(fi), ("\r\n".join(fl_lines) + "\r\n").encode("utf8")
+
+
+NESTED_ENTRIES = [
+    ("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bcgate1\\bcgate1.msd", b"nested text", True),
+    ("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bcgate1\\chara.one", b"nested chara", False),
+]
+
+ENTRIES = [
+    ("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\chara.one", b"chara one data" * 5, True),
+    ("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent1\\bccent1.msd", b"plain msd", False),
+    ("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bccent2\\bccent2.msd", bytes(range(256)), True),
+]
+
+
+def _write_archive(folder, name, entries, nested_entries=None):
+    if nested_entries:
+        nested_fs, nested_fi, nested_fl = _pack(nested_entries)
+        base = "c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bcgate1"
+        entries = entries + [(base + ".fi", nested_fi, True), (base + ".fl", nested_fl, True),
+                             (base + ".fs", nested_fs, False)]
+    fs, fi, fl = _pack(entries)
+    (folder / f"{name}.fs").write_bytes(fs)
+    (folder / f"{name}.fi").write_bytes(fi)
+    (folder / f"{name}.fl").write_bytes(fl)
+    return Archive.from_folder_and_name(str(folder), name)
+
+
+@pytest.fixture
+def counted_decode(monkeypatch):
+    """Count the LZS decompressions, whichever decoder is used."""
+    calls = []
+    original_decode = Lzs.decode
+    original_decode_bytes = Lzs.decode_bytes
+
+    def decode(self, input_bytes):
+        calls.append(bytes(input_bytes))
+        return original_decode(self, input_bytes)
+
+    def decode_bytes(self, input_bytes, expected_size=None):
+        calls.append(bytes(input_bytes))
+        return original_decode_bytes(self, input_bytes, expected_size)
+
+    monkeypatch.setattr(Lzs, "decode", decode)
+    monkeypatch.setattr(Lzs, "decode_bytes", decode_bytes)
+    return calls
+
+
+class TestEagerAnalysis:
+    def test_entries_are_decoded(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.analyse_data()
+        assert [bytes(data) for data in archive.get_fs_data_analysed()] == [data for _, data, _ in ENTRIES]
+
+    def test_get_all_data_by_name_walks_nested_archives(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.analyse_data(nested=True)
+        found = archive.get_all_data_by_name("chara.one")
+        assert [bytes(data) for _, data in found] == [b"chara one data" * 5, b"nested chara"]
+
+
+class TestLazyAnalysis:
+    def test_nothing_is_decoded_before_access(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.analyse_data(lazy=True)
+        assert archive.is_lazy()
+        assert archive.is_analysed()
+        assert counted_decode == []
+
+    def test_entry_is_decoded_once_on_access(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.analyse_data(lazy=True)
+        assert archive.get_entry_data(2) == bytes(range(256))
+        assert archive.get_entry_data(2) == bytes(range(256))
+        assert len(counted_decode) == 1
+
+    def test_uncompressed_entry_needs_no_decoding(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.analyse_data(lazy=True)
+        assert archive.get_entry_data(1) == b"plain msd"
+        assert counted_decode == []
+
+    def test_entry_of_unanalysed_archive_loads_the_index(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        assert archive.get_entry_data(0) == b"chara one data" * 5
+        assert archive.get_entry_data(1) == b"plain msd"
+        assert len(counted_decode) == 1
+
+    def test_same_data_as_eager(self, tmp_path):
+        eager = _write_archive(tmp_path, "field", ENTRIES)
+        eager.analyse_data()
+        lazy = Archive.from_folder_and_name(str(tmp_path), "field")
+        lazy.analyse_data(lazy=True)
+        assert list(lazy.get_fs_data_analysed()) == [bytes(data) for data in eager.get_fs_data_analysed()]
+
+    def test_cache_is_bounded_lru(self, tmp_path, counted_decode):
+        _write_archive(tmp_path, "field", ENTRIES)
+        archive = Archive(str(tmp_path / "field.fs"), str(tmp_path / "field.fi"), str(tmp_path / "field.fl"), cache_size=1)
+        archive.analyse_data(lazy=True)
+        archive.get_entry_data(0)
+        archive.get_entry_data(2)  # Drops entry 0
+        archive.get_entry_data(2)
+        archive.get_entry_data(0)
+        assert len(counted_decode) == 3
+
+    def test_sequence_view_supports_negative_index_and_bounds(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.analyse_data(lazy=True)
+        fs_data = archive.get_fs_data_analysed()
+        assert len(fs_data) == len(ENTRIES)
+        assert fs_data[-1] == bytes(range(256))
+        with pytest.raises(IndexError):
+            fs_data[len(ENTRIES)]
+
+    def test_nested_archive_is_indexed_lazily(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.analyse_data(nested=True, lazy=True)
+        nested = archive.get_archive_list()[0]
+        assert nested.is_lazy()
+        decoded_for_index = len(counted_decode)  # Only the nested fi and fl
+        assert decoded_for_index == 2
+        assert nested.get_entry_data(0) == b"nested text"
+        assert len(counted_decode) == decoded_for_index + 1
+
+    def test_fs_manager_lazy_lookup_by_name(self, tmp_path, counted_decode):
+        _write_archive(tmp_path, "field", ENTRIES)
+        manager = FsManager(str(tmp_path))
+        manager.analyse_all_archive(lazy=True)
+        found = manager.get_all_data_by_name("bccent2.msd")
+        assert [data for _, data in found] == [bytes(range(256))]
+        assert len(counted_decode) == 1
+
+
+class TestIndexedLookup:
+    def test_find_pattern_in_nested_archives(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.analyse_data(nested=True, lazy=True)
+        found = archive.find_data("*.msd", "mapdata\\bc")
+        assert [data for _, data in found] == [b"plain msd", bytes(range(256)), b"nested text"]
+        assert [data for _, data in archive.find_data("*.msd", "bcgate1")] == [b"nested text"]
+
+    def test_fs_manager_exact_path(self, tmp_path):
+        _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        manager = FsManager(str(tmp_path))
+        manager.analyse_all_archive(nested=True, lazy=True)
+        assert [data for _, data in manager.get_data_by_path(NESTED_ENTRIES[1][0])] == [b"nested chara"]
+        assert manager.get_data_by_path("c:\\missing") == []
+        assert len(manager.find_data("chara.one")) == 2
+
+
+class TestStreamingExtraction:
+    def test_iter_entries_walks_nested_archives_in_place(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        entry_list = [(path, bytes(data)) for path, data in archive.iter_entries(nested=True)]
+        assert entry_list == [(path, data) for path, data, _ in ENTRIES + NESTED_ENTRIES]
+        assert not archive.is_analysed()
+        assert len(list(archive.iter_entries())) == len(ENTRIES) + 3
+
+    def test_extract_then_skip_existing(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.load_data(use_mmap=True)
+        out = tmp_path / "out"
+        assert archive.extract_to_folder(str(out)) == (5, 0)
+        chara = out / "ff8" / "data" / "eng" / "field" / "mapdata" / "bc" / "bcgate1" / "chara.one"
+        assert chara.read_bytes() == b"nested chara"
+        nb_decode = len(counted_decode)
+        assert archive.extract_to_folder(str(out)) == (0, 5)
+        assert len(counted_decode) == nb_decode + 2  # Only the nested fi and fl, to walk the nested archive
+        chara.write_bytes(b"truncated")
+        assert archive.extract_to_folder(str(out)) == (1, 4)
+        assert chara.read_bytes() == b"nested chara"
+
+    def test_extract_path_stays_in_folder(self, tmp_path):
+        assert Archive.get_extract_path("out", "c:\\ff8\\..\\..\\evil.msd") == os.path.join("out", "ff8", "evil.msd")
+        assert Archive.get_extract_path("out", "field\\a.msd") == os.path.join("out", "field", "a.msd")
+
+
+class TestParallelAnalysis:
+    def test_same_data_as_serial(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.analyse_data(nested=True, workers=2)
+        assert not archive.is_lazy()
+        serial = Archive.from_folder_and_name(str(tmp_path), "field")
+        serial.analyse_data(nested=True, lazy=True)
+        assert list(archive.get_fs_data_analysed()) == list(serial.get_fs_data_analysed())
+        nested = archive.get_archive_list()[0]
+        assert list(nested.get_fs_data_analysed()) == [data for _, data, _ in NESTED_ENTRIES]
+
+    def test_nested_files_are_not_decoded_again(self, tmp_path, counted_decode, monkeypatch):
+        _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        job_list = []
+        decode_chunk = fsmanager._decode_chunk
+        monkeypatch.setattr(fsmanager, "_decode_chunk", lambda chunk: job_list.extend(chunk) or decode_chunk(chunk))
+        # No LRU cache: the nested fi/fl decoded for the index must come from the nested archive
+        archive = Archive(str(tmp_path / "field.fs"), str(tmp_path / "field.fi"), str(tmp_path / "field.fl"),
+                          cache_size=0)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            archive.analyse_data_parallel(executor, 2, nested=True)
+        assert len(counted_decode) == 2  # The nested fi and fl, for the index
+        assert len(job_list) == 3  # The 2 compressed entries and the nested text
+        serial = Archive.from_folder_and_name(str(tmp_path), "field")
+        serial.analyse_data(nested=True, lazy=True)
+        assert list(archive.get_fs_data_analysed()) == list(serial.get_fs_data_analysed())
+        assert not archive.is_lazy() and not archive.get_archive_list()[0].is_lazy()
+
+    def test_fs_manager_workers(self, tmp_path):
+        _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        _write_archive(tmp_path, "world", ENTRIES)
+        manager = FsManager(str(tmp_path))
+        manager.analyse_all_archive(nested=True, workers=2)
+        found = manager.get_all_data_by_name("chara.one")
+        assert sorted(bytes(data) for _, data in found) == sorted([b"chara one data" * 5] * 2 + [b"nested chara"])
+
+    def test_chunks_keep_order_and_balance_packed_length(self):
+        job_list = [(bytes(size), i) for i, size in enumerate([100, 10, 10, 80, 20, 100])]
+        chunk_list = _split_by_packed_length(job_list, 3)
+        assert [job for chunk in chunk_list for job in chunk] == job_list
+        assert len(chunk_list) == 3
+        assert _split_by_packed_length([], 4) == []
+
+
+class TestDiskCache:
+    def test_second_run_decodes_nothing(self, tmp_path, counted_decode):
+        _write_archive(tmp_path, "field", ENTRIES)
+        for _ in range(2):
+            archive = Archive.from_folder_and_name(str(tmp_path), "field")
+            archive.set_disk_cache(EntryCache(str(tmp_path / "cache")))
+            archive.analyse_data(lazy=True)
+            assert list(archive.get_fs_data_analysed()) == [data for _, data, _ in ENTRIES]
+        assert len(counted_decode) == 2  # The 2 compressed entries, first run only
+
+    def test_eager_and_nested_use_the_cache(self, tmp_path, counted_decode):
+        _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        for _ in range(2):
+            manager = FsManager(str(tmp_path))
+            manager.set_disk_cache(EntryCache(str(tmp_path / "cache")))
+            manager.analyse_all_archive(nested=True)
+            found = manager.get_all_data_by_name("bcgate1.msd")
+            assert [data for _, data in found] == [b"nested text"]
+        assert len(counted_decode) == 5  # 2 entries, nested fi and fl, nested text
+
+    def test_modified_archive_is_decoded_again(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.set_disk_cache(EntryCache(str(tmp_path / "cache")))
+        archive.analyse_data(lazy=True)
+        archive.get_entry_data(0)
+        new_entries = [(ENTRIES[0][0], b"modified chara", True)] + ENTRIES[1:]
+        updated = _write_archive(tmp_path, "field", new_entries + [("c:\\ff8\\padding", b"x", False)])
+        updated.set_disk_cache(EntryCache(str(tmp_path / "cache")))
+        updated.analyse_data(lazy=True)
+        assert updated.get_entry_data(0) == b"modified chara"
+        assert len(counted_decode) == 2
+
+    def test_parallel_analysis_fills_the_cache(self, tmp_path, counted_decode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.set_disk_cache(EntryCache(str(tmp_path / "cache")))
+        archive.analyse_data(workers=2)
+        again = Archive.from_folder_and_name(str(tmp_path), "field")
+        again.set_disk_cache(EntryCache(str(tmp_path / "cache")))
+        again.analyse_data(lazy=True)
+        assert list(again.get_fs_data_analysed()) == [data for _, data, _ in ENTRIES]
+        assert counted_decode == []
+
+
+class TestMappedLoad:
+    def test_same_data_as_read(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.load_data(use_mmap=True)
+        assert archive.is_mapped()
+        archive.analyse_data()
+        assert [bytes(data) for data in archive.get_fs_data_analysed()] == [data for _, data, _ in ENTRIES]
+
+    def test_uncompressed_entry_is_a_view(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.load_data(use_mmap=True)
+        archive.analyse_data(lazy=True)
+        entry = archive.get_entry_data(1)
+        assert isinstance(entry, memoryview)
+        assert entry == b"plain msd"
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_nested_archive_references_parent(self, tmp_path, lazy):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.load_data(use_mmap=True)
+        archive.analyse_data(nested=True, lazy=lazy)
+        nested = archive.get_archive_list()[0]
+        assert nested.is_mapped()
+        assert nested.get_entry_data(1) == b"nested chara"
+        found = archive.get_all_data_by_name("bcgate1.msd")
+        assert [bytes(data) for _, data in found] == [b"nested text"]
+
+    def test_unload_keeps_given_entries_valid(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.load_data(use_mmap=True)
+        archive.analyse_data(lazy=True)
+        entry = archive.get_entry_data(1)
+        archive.unload_data()
+        assert not archive.is_mapped()
+        assert entry == b"plain msd"
+
+    def test_empty_fs_falls_back_to_read(self, tmp_path):
+        archive = _write_archive(tmp_path, "empty", [])
+        archive.load_data(use_mmap=True)
+        assert not archive.is_mapped()
+
+
+@pytest.fixture
+def counted_encode(monkeypatch):
+    """Count the LZS compressions done by the writer."""
+    calls = []
+    original_encode = lzs.encode
+
+    def encode(input_bytes, *args, **kwargs):
+        calls.append(bytes(input_bytes))
+        return original_encode(input_bytes, *args, **kwargs)
+
+    monkeypatch.setattr(lzs, "encode", encode)
+    return calls
+
+
+class TestArchiveWriter:
+    def test_build_from_entries(self, tmp_path):
+        writer = ArchiveWriter()
+        for path, data, compressed in ENTRIES:
+            writer.add_entry(path, data, compressed)
+        writer.write_to_folder(str(tmp_path / "out"), "field")
+        archive = Archive.from_folder_and_name(str(tmp_path / "out"), "field")
+        archive.analyse_data()
+        assert archive.get_fl_data_analysed() == [path for path, _, _ in ENTRIES]
+        assert [bytes(data) for data in archive.get_fs_data_analysed()] == [data for _, data, _ in ENTRIES]
+        assert [fi.compression_used for fi in archive.get_fi_data_analysed()] == [c for _, _, c in ENTRIES]
+
+    def test_unchanged_archive_is_rewritten_identically(self, tmp_path, counted_encode):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        fs, fi, fl = ArchiveWriter.from_archive(archive).get_archive_data()
+        assert fs == (tmp_path / "field.fs").read_bytes()
+        assert fi == (tmp_path / "field.fi").read_bytes()
+        assert fl == (tmp_path / "field.fl").read_bytes()
+        assert counted_encode == []
+
+    def test_only_changed_entry_is_encoded(self, tmp_path, counted_encode):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        writer = ArchiveWriter.from_archive(archive)
+        writer.set_entry_data(ENTRIES[0][0], b"new chara data")
+        assert writer.get_nb_modified_entry() == 1
+        writer.write_to_folder(str(tmp_path / "out"), "field")
+        assert counted_encode == [b"new chara data"]
+        updated = Archive.from_folder_and_name(str(tmp_path / "out"), "field")
+        updated.analyse_data(lazy=True)
+        assert list(updated.get_fs_data_analysed()) == [b"new chara data", b"plain msd", bytes(range(256))]
+        # The untouched entries are moved, not compressed again
+        assert updated.get_packed_entry(2) == archive.get_packed_entry(2)
+
+    def test_mapped_archive_is_read_when_writing_over_itself(self, tmp_path, monkeypatch):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.load_data(use_mmap=True)
+        read_list = []
+        get_packed_entry = archive.get_packed_entry
+        monkeypatch.setattr(archive, "get_packed_entry", lambda i: read_list.append(i) or get_packed_entry(i))
+        writer = ArchiveWriter.from_archive(archive)
+        assert read_list == []  # Nothing copied up front
+        writer.set_entry_data(ENTRIES[1][0], b"new msd")
+        writer.write_to_folder(str(tmp_path), "field")
+        assert read_list == [0, 2]
+        updated = Archive.from_folder_and_name(str(tmp_path), "field")
+        updated.analyse_data()
+        assert [bytes(data) for data in updated.get_fs_data_analysed()] == [b"chara one data" * 5, b"new msd",
+                                                                          bytes(range(256))]
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["field.fi", "field.fl", "field.fs"]
+        # The mapping is released before the old FS is replaced, as Windows needs
+        assert not archive.is_loaded() and not archive.is_mapped_file(str(tmp_path / "field.fs"))
+
+    def test_writing_over_a_mapped_archive_still_used_replaces_nothing(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        archive.load_data(use_mmap=True)
+        writer = ArchiveWriter.from_archive(archive)
+        writer.set_entry_data(ENTRIES[0][0], b"new chara one")
+        entry = archive.get_entry_data(1)  # An uncompressed entry, a view of the mapped file
+        before = {path.name: path.read_bytes() for path in tmp_path.iterdir()}
+        with pytest.raises(BufferError):
+            writer.write_to_folder(str(tmp_path), "field")
+        assert {path.name: path.read_bytes() for path in tmp_path.iterdir()} == before
+        assert isinstance(entry, memoryview) and bytes(entry) == b"plain msd"
+
+    def test_add_and_remove_entry(self, tmp_path):
+        archive = _write_archive(tmp_path, "field", ENTRIES)
+        writer = ArchiveWriter.from_archive(archive)
+        writer.remove_entry(ENTRIES[1][0])
+        writer.add_entry("c:\\ff8\\data\\eng\\field\\new.msd", b"added", compression_used=False)
+        with pytest.raises(KeyError):
+            writer.set_entry_data(ENTRIES[1][0], b"removed")
+        with pytest.raises(ValueError):
+            writer.add_entry(ENTRIES[0][0], b"duplicate")
+        writer.write_to_folder(str(tmp_path / "out"), "field")
+        updated = Archive.from_folder_and_name(str(tmp_path / "out"), "field")
+        updated.analyse_data()
+        assert updated.get_fl_data_analysed()[-1].endswith("new.msd")
+        assert [bytes(data) for data in updated.get_fs_data_analysed()] == [b"chara one data" * 5, bytes(range(256)), b"added"]
+
+    def test_nested_archive_update(self, tmp_path, counted_encode):
+        archive = _write_archive(tmp_path, "field", ENTRIES, NESTED_ENTRIES)
+        archive.analyse_data(nested=True, lazy=True)
+        nested_writer = ArchiveWriter.from_archive(archive.get_archive_list()[0])
+        nested_writer.set_entry_data(NESTED_ENTRIES[0][0], b"translated text")
+        writer = ArchiveWriter.from_archive(archive)
+        writer.set_nested_archive("c:\\ff8\\data\\eng\\field\\mapdata\\bc\\bcgate1", nested_writer)
+        writer.write_to_folder(str(tmp_path / "out"), "field")
+        # The nested text, then the nested fi and fl of the parent (the nested fs is stored uncompressed)
+        assert len(counted_encode) == 3
+        updated = Archive.from_folder_and_name(str(tmp_path / "out"), "field")
+        updated.analyse_data(nested=True)
+        found = updated.get_all_data_by_name("bcgate1.msd")
+        assert [bytes(data) for _, data in found] == [b"translated text"]
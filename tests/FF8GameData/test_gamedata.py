@@ -0,0 +1,226 @@
+"""Tests for the FF8 text codec of GameData (FF8GameData/gamedata.py).
+
+Only the tables shipped in FF8GameData/Resources are needed, no game file.
+"""
+import csv
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+from PIL import Image
+
+from FF8GameData.gamedata import GameData, GameDataView, get_shared_game_data
+
+PROJECT_ROOT = pathlib.Path(__file__).parent.parent.parent
+
+
+@pytest.fixture(scope="module")
+def game_data():
+    return GameData(str(PROJECT_ROOT / "FF8GameData"))
+
+
+def test_plain_text_uses_the_first_code_of_a_character(game_data):
+    table = game_data.translate_hex_to_str_table
+    text = "Squall, 100 Gil!"
+    assert game_data.translate_str_to_hex(text) == [table.index(char) for char in text]
+
+
+@pytest.mark.parametrize("key, first_byte, first_value", [
+    ("Icons", 0x05, 0x20), ("Colors", 0x06, 0x20), ("GuardianForce", 0x0c, 0x60), ("Locations", 0x0e, 0x20)])
+def test_every_sysfnt_tag_is_encoded(game_data, key, first_byte, first_value):
+    name_list = game_data.sysfnt_data_json[key]
+    for name in name_list:
+        if game_data.sysfnt_data_json['Characters'].count(name):
+            continue  # The character names win
+        expected = [first_byte, first_value + name_list.index(name)]
+        assert game_data.translate_str_to_hex("{" + name + "}") == expected, name
+
+
+def test_character_and_special_value_tags(game_data):
+    characters = game_data.sysfnt_data_json['Characters']
+    assert game_data.translate_str_to_hex("{" + characters[0] + "}") == [0x03, 0x30]
+    assert game_data.translate_str_to_hex("{" + characters[12] + "}") == [0x03, 0x50]
+    code_str, name = next(iter(game_data.sysfnt_data_json['SpecialValues'].items()))
+    if name not in characters:
+        assert game_data.translate_str_to_hex("{" + name + "}") == [0x0a, int(code_str[-2:], 16)]
+
+
+def test_mixed_text_tags_and_line_breaks(game_data):
+    table = game_data.translate_hex_to_str_table
+    encoded = game_data.translate_str_to_hex("Hi{Var0}\n{NewPage}A\n{x0b12}{Wait010}end")
+    assert encoded[:2] == [table.index("H"), table.index("i")]
+    assert encoded[2:10] == [0x04, 0x20, 0x01, table.index("A"), 0x02, 0x0b, 0x12, 0x09]
+    assert encoded[-3:] == [table.index(char) for char in "end"]
+
+
+def test_unknown_character_raises_value_error(game_data):
+    with pytest.raises(ValueError):
+        game_data.translate_str_to_hex("abc☃")
+
+
+def test_jp_tables_are_used_first(game_data):
+    if not game_data.jp_tables:
+        pytest.skip("No JP table")
+    game_data.jp_encoding = True
+    try:
+        for table_idx, table in enumerate(game_data.jp_tables):
+            for char in table[:40]:
+                if not char or any(char in previous for previous in game_data.jp_tables[:table_idx]):
+                    continue
+                expected = [0x20 + table.index(char)] if table_idx == 0 else [0x18 + table_idx, 0x20 + table.index(char)]
+                assert game_data.translate_str_to_hex(char) == expected
+    finally:
+        game_data.jp_encoding = False
+
+
+def _csv_text_list():
+    text_list = []
+    for csv_path in sorted((PROJECT_ROOT / "ShumiTranslator" / "csv").glob("*.csv")):
+        with open(csv_path, newline="", encoding="utf-8") as csv_file:
+            for row in list(csv.reader(csv_file, delimiter="|", quotechar='"'))[1:]:
+                if len(row) > 3 and row[3]:
+                    text_list.append(row[3])
+    return text_list
+
+
+def test_csv_corpus_round_trip(game_data):
+    """Every text of the shipped CSV gives back the same bytes once decoded and encoded again."""
+    text_list = _csv_text_list()
+    assert text_list
+    for text in text_list:
+        encoded = game_data.translate_str_to_hex(text)
+        # The SeeD test texts start with a literal byte (the 0x00 would be dropped otherwise)
+        decoded = game_data.translate_hex_to_str(encoded, first_hex_literal=text.startswith("{x00}"))
+        assert game_data.translate_str_to_hex(decoded) == encoded, text
+
+
+def test_decode_bytes_and_list_alike(game_data):
+    data = [0x20, 0x45, 0x46, 0x00, 0x03, 0x30, 0x06, 0x28, 0x19, 0x30, 0x1f]
+    assert game_data.translate_hex_to_str(data) == game_data.translate_hex_to_str(bytes(data))
+    assert game_data.translate_hex_to_str(data, zero_as_slash_n=True).count("\n") == 1
+    assert game_data.translate_hex_to_str(data).endswith("{x1930}{x1f}")
+
+
+def test_decode_control_codes(game_data):
+    characters = game_data.sysfnt_data_json['Characters']
+    assert game_data.translate_hex_to_str([0x03, 0x50]) == "{" + characters[12] + "}"
+    assert game_data.translate_hex_to_str([0x0b, 0x20]) == "{Cursor_location_id:0x20}"
+    assert game_data.translate_hex_to_str([0x0b, 0x20, 0x21], cursor_location_size=3) == "{Cursor_location_id:0x2021}"
+    assert game_data.translate_hex_to_str([0x09, 0x2a]) == "{Wait010}"
+    assert game_data.translate_hex_to_str([0x05]) == "{x05}"
+    assert game_data.translate_hex_to_str([0x41], first_hex_literal=True) == "{x41}"
+
+
+def test_shared_game_data_is_loaded_once():
+    folder = str(PROJECT_ROOT / "FF8GameData")
+    view_a = get_shared_game_data(folder)
+    view_b = get_shared_game_data(folder)
+    assert view_a is not view_b
+    assert view_a.get_shared_game_data() is view_b.get_shared_game_data()
+    view_a.load_item_data()
+    item_data = view_a.item_data_json
+    view_b.load_item_data()  # Already loaded by the other view
+    assert view_b.item_data_json is item_data
+
+
+def test_shared_game_data_view_attributes_are_independent(game_data):
+    view_a = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
+    view_b = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
+    view_a.jp_encoding = True
+    assert not view_b.jp_encoding
+    assert not view_a.get_shared_game_data().jp_encoding
+    text = "Squall, 100 Gil!{Var0}\n{NewPage}end"
+    assert view_b.translate_str_to_hex(text) == game_data.translate_str_to_hex(text)
+    encoded = game_data.translate_str_to_hex(text)
+    assert view_b.translate_hex_to_str(encoded) == game_data.translate_hex_to_str(encoded)
+
+
+def test_shared_game_data_load_with_argument_stays_in_view():
+    view_a = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
+    view_b = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
+    view_a.load_ai_data("ai_cronos.json")
+    assert "ai_data_json" in vars(view_a)
+    assert "ai_data_json" not in vars(view_b)
+    shared_touched_list = view_a.get_shared_game_data().get_touched_resource_list()
+    assert view_a.get_touched_resource_list() == shared_touched_list + ["ai_data_json"]
+    assert view_b.get_touched_resource_list() == shared_touched_list
+
+
+def test_resources_are_loaded_on_first_access():
+    game_data = GameData(str(PROJECT_ROOT / "FF8GameData"))
+    assert game_data.get_touched_resource_list() == ["sysfnt_data_json"]  # Needed by the text codec
+    assert "item_data_json" not in vars(game_data)
+    item_data = game_data.item_data_json
+    assert item_data
+    game_data.load_item_data()  # Already loaded, nothing done
+    assert game_data.item_data_json is item_data
+    assert game_data.exe_data_json["lang"]["offset"] == 0x108
+    assert game_data.get_touched_resource_list() == ["sysfnt_data_json", "item_data_json", "exe_data_json"]
+    with pytest.raises(AttributeError):
+        game_data.unknown_data_json
+
+
+def test_load_with_argument_always_loads():
+    game_data = GameData(str(PROJECT_ROOT / "FF8GameData"))
+    vanilla_ai = game_data.ai_data_json
+    game_data.load_ai_data("ai_cronos.json")
+    assert game_data.ai_data_json is not vanilla_ai
+    assert game_data.get_touched_resource_list().count("ai_data_json") == 2
+
+
+def test_shared_game_data_loads_resources_on_first_access():
+    view = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
+    magic_data = view.magic_data_json
+    assert view.get_shared_game_data().magic_data_json is magic_data
+    assert "magic_data_json" in view.get_touched_resource_list()
+
+
+def test_view_reads_shared_attributes_once(game_data, monkeypatch):
+    """The codec reads its tables at each character: through a view, only the first read of each one is looked up
+    in the shared GameData."""
+    view = get_shared_game_data(str(PROJECT_ROOT / "FF8GameData"))
+    name_list = []
+    shared_getattr = GameDataView.__getattr__
+
+    def counting_getattr(self, name):
+        name_list.append(name)
+        return shared_getattr(self, name)
+
+    monkeypatch.setattr(GameDataView, "__getattr__", counting_getattr)
+    text_list = _csv_text_list()[:500]
+    encoded_list = [game_data.translate_str_to_hex(text) for text in text_list]
+    for _ in range(3):
+        for text, encoded in zip(text_list, encoded_list):
+            assert view.translate_hex_to_str(encoded) == game_data.translate_hex_to_str(encoded)
+            assert view.translate_str_to_hex(text) == encoded
+    assert len(name_list) == len(set(name_list))
+
+
+def test_card_tiles_are_cropped_on_demand(monkeypatch):
+    game_data = GameData(str(PROJECT_ROOT / "FF8GameData"))
+    opened_list = []
+    image_open = Image.open
+    monkeypatch.setattr(Image, "open", lambda path: opened_list.append(os.path.basename(path)) or image_open(path))
+    card_info_list = game_data.card_data_json["card_info"]
+    assert "img" not in card_info_list[0]
+    assert not opened_list  # Reading the names doesn't decode any image
+    tile = game_data.get_card_image(card_info_list[1])
+    assert tile.size == (64, 64)
+    assert game_data.get_card_image(card_info_list[1]) is tile
+    game_data.get_card_image(card_info_list[2])
+    assert game_data.get_card_type_image(game_data.card_data_json["card_type"][0]).size == (128, 128)
+    assert opened_list == ["cards_00.png", "text_0.png"]  # Each sheet decoded once
+    with Image.open(str(PROJECT_ROOT / "FF8GameData" / "Resources" / "image" / "cards_00.png")) as sheet:
+        left, upper = card_info_list[2]["img_x"] * 64, card_info_list[2]["img_y"] * 64
+        expected = sheet.crop((left, upper, left + 64, upper + 64))
+        assert game_data.get_card_image(card_info_list[2]).tobytes() == expected.tobytes()
+
+
+def test_gamedata_imports_standalone():
+    # gamedatatest.py and Ifrit/IfritXlsx/dat_to_txt.py import it as a plain module from its own folder
+    result = subprocess.run([sys.executable, "-c", "from gamedata import GameData; GameData('.').load_kernel_data()"],
+                            cwd=PROJECT_ROOT / "FF8GameData", capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert not (PROJECT_ROOT / "FF8GameData" / "Resources" / "bundle").exists()
@@ -0,0 +1,92 @@
+"""Tests for the batch text encode/decode of whole sections (GameData.encode_text_list, ListFF8Text.set_text_list)."""
+import pathlib
+
+import pytest
+
+from FF8GameData.GenericSection.listff8text import ListFF8Text
+from FF8GameData.GenericSection.offsetandtext import SectionOffsetAndText
+from FF8GameData.gamedata import GameData
+
+PROJECT_ROOT = pathlib.Path(__file__).parent.parent.parent
+
+TEXT_LIST = ["Squall", "Potion", "", "Rinoa{NewPage}Hi", "Potion", "Potion", "{NewPage}A"]
+
+
+@pytest.fixture(scope="module")
+def game_data():
+    return GameData(str(PROJECT_ROOT / "FF8GameData"))
+
+
+def _offset_and_text(game_data, text_list, deduplicate=False):
+    """A section with one offset (from the start of the section) per text"""
+    data_hex, offset_list = game_data.encode_text_list(text_list)
+    header = bytearray()
+    for offset in offset_list:
+        header.extend((offset + 2 * len(text_list)).to_bytes(2, byteorder="little"))
+    return SectionOffsetAndText(game_data, header + data_hex, nb_offset=len(text_list), deduplicate=deduplicate)
+
+
+def test_encode_text_list_is_the_texts_one_after_the_other(game_data):
+    data_hex, offset_list = game_data.encode_text_list(TEXT_LIST)
+    expected = bytearray()
+    for text, offset in zip(TEXT_LIST, offset_list):
+        assert offset == len(expected)
+        expected.extend(game_data.translate_str_to_hex(text) + ([0x00] if text else []))
+    assert data_hex == expected
+    assert game_data.decode_text_list(data_hex, offset_list) == TEXT_LIST
+
+
+def test_deduplicate_shares_the_offset_of_identical_texts(game_data):
+    data_hex, offset_list = game_data.encode_text_list(TEXT_LIST)
+    dedup_data_hex, dedup_offset_list = game_data.encode_text_list(TEXT_LIST, deduplicate=True)
+    assert len(dedup_data_hex) == len(data_hex) - len(game_data.translate_str_to_hex("Potion")) - 1
+    assert dedup_offset_list[4] == dedup_offset_list[1]
+    assert dedup_offset_list[5] != dedup_offset_list[4]  # Two following equal offsets would give an empty text
+    assert game_data.decode_text_list(dedup_data_hex, dedup_offset_list) == TEXT_LIST
+
+
+def test_decode_text_list_with_unordered_offsets(game_data):
+    data_hex, offset_list = game_data.encode_text_list(["Zell", "Selphie", "Irvine"])
+    assert game_data.decode_text_list(data_hex, offset_list[::-1] + offset_list[1:2]) == ["Irvine", "Selphie", "Zell",
+                                                                                          "Selphie"]
+    # The same offset as the next one is an empty text, as read by ListFF8Text.init_text
+    assert game_data.decode_text_list(data_hex, offset_list[:1] + offset_list) == ["", "Zell", "Selphie", "Irvine"]
+
+
+def test_set_text_list_keeps_the_none(game_data, monkeypatch):
+    section = _offset_and_text(game_data, TEXT_LIST)
+    call_list = []
+    encode_text_list = game_data.encode_text_list
+    monkeypatch.setattr(game_data, "encode_text_list", lambda *args: call_list.append(args) or encode_text_list(*args))
+    section.set_text_list(["Quistis", None, None, "Edea", None, None, None])
+    assert len(call_list) == 1
+    assert [text.get_str() for text in section.get_text_list()] == ["Quistis"] + TEXT_LIST[1:3] + ["Edea"] + TEXT_LIST[4:]
+    assert section.get_text_list()[0].get_data_hex() == bytearray(game_data.translate_str_to_hex("Quistis") + [0x00])
+
+
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_section_saved_then_reloaded(game_data, deduplicate):
+    section = _offset_and_text(game_data, TEXT_LIST, deduplicate=deduplicate)
+    section.update_data_hex()
+    reloaded = _offset_and_text(game_data, TEXT_LIST)
+    if not deduplicate:  # Same bytes as before the batch API
+        assert section.get_data_hex() == reloaded.get_data_hex()
+    else:
+        assert len(section.get_data_hex()) < len(reloaded.get_data_hex())
+    reloaded = SectionOffsetAndText(game_data, section.get_data_hex(), nb_offset=len(TEXT_LIST))
+    assert [text.get_str() for text in reloaded.get_text_list()] == TEXT_LIST
+
+
+@pytest.mark.parametrize("offset_list", [[0, 8, 16], [0, 8, 16, 0xFFFF], [16, 8, 0], [0, 16, 8, 8], [0, 8, 8, 16]])
+def test_init_text_cuts_the_texts_as_decode_text_list(game_data, offset_list):
+    # Each text padded to 8 bytes, and bytes that are not text after the last one
+    data_hex = bytearray()
+    for text in ["Squall", "Rinoa", "Irvine"]:
+        data_hex.extend(bytes(game_data.translate_str_to_hex(text)).ljust(8, b"\x00"))
+    data_hex.extend(game_data.translate_str_to_hex("AB"))
+    text_section = ListFF8Text(game_data, data_hex, id=0, own_offset=0, name="")
+    text_section.init_text(offset_list)
+    text_list = game_data.decode_text_list(data_hex, offset_list)
+    assert [text.get_str() for text in text_section.get_text_list()] == text_list
+    if offset_list[-1] == 16:  # The end of the last text is its first 0x00, the bytes after it are not read
+        assert text_list[-1] == "Irvine"
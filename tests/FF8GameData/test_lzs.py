@@ -0,0 +1,189 @@
+"""Tests for the shared LZSS codec (FF8GameData/fs/lzs.py).
+
+decode_bytes must give exactly what the original generator decode gives, on
+hand-made token streams covering every back-reference case. The fs archives,
+Hyne's save files and Alexander's stages all go through the same codec, so the
+correctness and throughput matrices run every entry point on the same payloads.
+"""
+import random
+
+import pytest
+
+from Alexander import stagefs
+from FF8GameData.fs import lzs
+from FF8GameData.fs.lzs import Lzs, LzsLevel
+from Hyne import hynemanager
+
+
+def _random_stream(nb_group, seed):
+    """Random but valid LZS stream: each flag byte drives 8 literals or back-references."""
+    rng = random.Random(seed)
+    stream = bytearray()
+    for _ in range(nb_group):
+        flags = rng.randrange(256)
+        stream.append(flags)
+        for bit in range(8):
+            if flags & (1 << bit):
+                stream.append(rng.randrange(256))
+            else:
+                ring_pos = rng.randrange(Lzs.N)
+                stream.append(ring_pos & 0xFF)
+                stream.append(((ring_pos >> 4) & 0xF0) | rng.randrange(16))
+    return bytes(stream)
+
+
+def _generator_decode(data):
+    return bytes(Lzs().decode(data))
+
+
+class TestDecodeBytes:
+    def test_original_example(self):
+        original_hex = bytes(
+            b'\xF5\x10\xEB\xF0\x09\xEB\xF0\x0C\x04\x00\x00\xFF\x40\x01\xF0\x00\x00\x01\x02\x00\xFF\xFF\xFF\xFE\xFF'
+            b'\xFC\xFF\xDE\xFB\xFF\xFA\xFF\xF7\xFF\x9C\xF3\xF4\xFF\xFF\x7B\xEF\xF1\xFF\x5A')
+        assert Lzs().decode_bytes(original_hex) == _generator_decode(original_hex)
+
+    def test_all_literals(self):
+        assert Lzs().decode_bytes(bytes([0xFF]) + b"ABCDEFGH") == b"ABCDEFGH"
+
+    def test_overlapping_back_reference(self):
+        # Literal 'A' at ring position 0xFEE, then a reference to it of length 0x0F + 3 = 18: RLE fill
+        assert Lzs().decode_bytes(bytes([0x01, 0x41, 0xEE, 0xFF])) == b"A" * 19
+
+    def test_reference_before_output_start_reads_zeros(self):
+        # Reference to ring position 0, far behind the start: the ring starts zero-filled
+        assert Lzs().decode_bytes(bytes([0x00, 0x00, 0x02])) == bytes(5)
+
+    def test_truncated_stream_stops_cleanly(self):
+        stream = _random_stream(20, seed=3)[:-1]
+        assert Lzs().decode_bytes(stream) == _generator_decode(stream)
+
+    def test_empty_input(self):
+        assert Lzs().decode_bytes(b"") == b""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_result_as_generator(self, seed):
+        stream = _random_stream(2000, seed)
+        assert Lzs().decode_bytes(stream) == _generator_decode(stream)
+
+    @pytest.mark.parametrize("size_delta", [-100, 0, 100])
+    def test_expected_size_only_preallocates(self, size_delta):
+        stream = _random_stream(200, seed=7)
+        expected = _generator_decode(stream)
+        assert Lzs().decode_bytes(stream, expected_size=len(expected) + size_delta) == expected
+
+    def test_memoryview_input(self):
+        stream = _random_stream(100, seed=11)
+        assert Lzs().decode_bytes(memoryview(stream)) == _generator_decode(stream)
+
+
+# ---------------------------------------------------------------------------
+# Shared matrix: every decoder entry point against every encoder entry point
+# ---------------------------------------------------------------------------
+
+DECODERS = {
+    "fs-decode-bytes": lambda data: bytes(Lzs().decode_bytes(data)),
+    "fs-generator": _generator_decode,
+    "codec": lambda data: bytes(lzs.decode(data)),
+    "hyne": hynemanager.lzss_decompress,
+    "alexander": stagefs.lzss_decompress,
+}
+
+ENCODERS = {
+    "codec": lambda data: bytes(lzs.encode(data)),
+    "fast": lambda data: bytes(lzs.encode(data, level=LzsLevel.FAST)),
+    "lazy": lambda data: bytes(lzs.encode(data, level=LzsLevel.LAZY)),
+    "tree": lambda data: bytes(lzs.encode(data, level=LzsLevel.TREE)),
+    "max": lambda data: bytes(lzs.encode(data, level=LzsLevel.MAX)),
+    "literal": lambda data: bytes(lzs.encode_literal(data)),
+    "fs-class": lambda data: bytes(Lzs().encode(data)),
+    "hyne": hynemanager.lzss_compress,
+}
+
+
+def _payloads():
+    rng = random.Random(1234)
+    text = b"The quick brown fox jumps over the lazy dog. " * 40
+    save_like = bytes(300) + bytes(rng.randrange(8) for _ in range(700)) + bytes(1000)
+    return {
+        "empty": b"",
+        "one-byte": b"\x42",
+        "zeros": bytes(5000),
+        "text": text,
+        "save-like": save_like,
+        "random": bytes(rng.randrange(256) for _ in range(3000)),
+        "long-run-then-repeat": bytes([7]) + bytes(4095) + bytes([7]) + bytes(50),
+    }
+
+
+PAYLOADS = _payloads()
+
+
+@pytest.mark.parametrize("decoder_name", DECODERS)
+@pytest.mark.parametrize("encoder_name", ENCODERS)
+@pytest.mark.parametrize("payload_name", PAYLOADS)
+def test_roundtrip_matrix(decoder_name, encoder_name, payload_name):
+    payload = PAYLOADS[payload_name]
+    assert DECODERS[decoder_name](ENCODERS[encoder_name](payload)) == payload
+
+
+@pytest.mark.parametrize("decoder_name", DECODERS)
+def test_decoders_agree_on_random_streams(decoder_name):
+    stream = _random_stream(500, seed=99)
+    assert DECODERS[decoder_name](stream) == _generator_decode(stream)
+
+
+@pytest.mark.parametrize("ring_fill", [0x00, 0x20])
+@pytest.mark.parametrize("ring_start", [lzs.RING_START, 0x000, 0x7FF])
+def test_ring_parameters_roundtrip(ring_fill, ring_start):
+    payload = PAYLOADS["save-like"] + PAYLOADS["text"]
+    encoded = lzs.encode(payload, ring_fill=ring_fill, ring_start=ring_start)
+    assert lzs.decode(encoded, ring_fill=ring_fill, ring_start=ring_start) == payload
+
+
+def test_ring_fill_is_what_precedes_the_output():
+    # A reference far behind the start reads the initial fill
+    assert lzs.decode(bytes([0x00, 0x00, 0x00]), ring_fill=0x20) == b"   "
+
+
+def test_encoder_uses_back_references():
+    assert len(lzs.encode(PAYLOADS["text"])) < len(PAYLOADS["text"]) // 4
+    assert len(lzs.encode(PAYLOADS["zeros"])) < len(PAYLOADS["zeros"]) // 8  # 18 bytes per 2-byte reference
+
+
+def test_truncate_stops_at_expected_size():
+    encoded = lzs.encode(PAYLOADS["text"])
+    assert lzs.decode(encoded, expected_size=10, truncate=True) == PAYLOADS["text"][:10]
+
+
+@pytest.mark.parametrize("decoder_name", [name for name in DECODERS if name != "fs-generator"])
+def test_throughput_matrix(decoder_name):
+    """Every entry point goes through the one-call decoder and gives the bytes of the per-byte generator
+    (the speed is compared by benchmark.py, not here)."""
+    stream = _random_stream(20000, seed=5)
+    assert DECODERS[decoder_name](stream) == _generator_decode(stream)
+
+
+@pytest.mark.parametrize("level", list(LzsLevel))
+@pytest.mark.parametrize("ring_fill", [0x00, 0x20])
+def test_levels_roundtrip_with_ring_fill(level, ring_fill):
+    payload = bytes([ring_fill]) * 40 + PAYLOADS["text"] + bytes([ring_fill]) * 40
+    encoded = lzs.encode(payload, ring_fill=ring_fill, level=level)
+    assert lzs.decode(encoded, ring_fill=ring_fill) == payload
+
+
+def test_levels_trade_ratio_for_speed():
+    """FAST only follows a few chain links, MAX searches the whole window and parses optimally."""
+    payload = PAYLOADS["text"] + PAYLOADS["save-like"] + PAYLOADS["random"]
+    sizes = {level: len(lzs.encode(payload, level=level)) for level in LzsLevel}
+    assert sizes[LzsLevel.MAX] <= sizes[LzsLevel.LAZY] <= sizes[LzsLevel.FAST]
+    assert sizes[LzsLevel.MAX] <= sizes[LzsLevel.TREE]
+
+
+def test_fast_level_gives_the_same_data_a_bit_bigger():
+    """Only what FAST gives is checked here, its speed is compared by benchmark.py."""
+    payload = b" ".join(bytes([65 + i % 26]) * (i % 7 + 1) + b"%d" % i for i in range(8000))
+    tree_output = lzs.encode(payload, level=LzsLevel.TREE)
+    fast_output = lzs.encode(payload, level=LzsLevel.FAST)
+    assert lzs.decode(fast_output) == lzs.decode(tree_output) == payload
+    assert len(fast_output) < len(tree_output) * 1.2
@@ -0,0 +1,97 @@
+"""Tests for the json resource bundles (FF8GameData/resourcebundle.py, GameData.read_json_resource)."""
+import json
+import os
+import pathlib
+
+import pytest
+
+from FF8GameData.gamedata import GameData, SectionType
+from FF8GameData.resourcebundle import build_resource_bundle
+
+PROJECT_ROOT = pathlib.Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def game_data_folder(tmp_path):
+    """Copy of the resources, so the bundles are built aside"""
+    resource_folder = tmp_path / "FF8GameData" / "Resources"
+    (resource_folder / "json").mkdir(parents=True)
+    source_folder = PROJECT_ROOT / "FF8GameData" / "Resources"
+    for json_name, _ in GameData.get_json_resource_list():
+        (resource_folder / "json" / json_name).write_bytes((source_folder / "json" / json_name).read_bytes())
+    for text_name in ("sysfnt.txt", "sysfnt_jp.txt"):
+        (resource_folder / text_name).write_bytes((source_folder / text_name).read_bytes())
+    return str(tmp_path / "FF8GameData")
+
+
+@pytest.fixture
+def counted_json_load(monkeypatch):
+    call_list = []
+    json_load = json.load
+
+    def load(*args, **kwargs):
+        call_list.append(args)
+        return json_load(*args, **kwargs)
+
+    monkeypatch.setattr(json, "load", load)
+    return call_list
+
+
+def _json_path(game_data_folder, json_name):
+    return os.path.join(game_data_folder, "Resources", "json", json_name)
+
+
+def test_loading_writes_no_bundle(game_data_folder):
+    game_data = GameData(game_data_folder)
+    game_data.load_all()
+    assert not os.path.exists(os.path.join(game_data_folder, "Resources", "bundle"))
+
+
+def test_build_gives_the_same_data_as_the_json(game_data_folder, counted_json_load):
+    bundle_path_list = build_resource_bundle(game_data_folder)
+    assert len(bundle_path_list) == len(GameData.get_json_resource_list())
+    assert all(bundle_path.endswith(".pickle") for bundle_path in bundle_path_list)
+    counted_json_load.clear()
+    for json_name, post_process in GameData.get_json_resource_list():
+        json_path = _json_path(game_data_folder, json_name)
+        with open(json_path, encoding="utf8") as json_file:
+            expected = json.load(json_file)
+        if post_process:
+            post_process(expected)
+        assert GameData.read_json_resource(json_path, post_process) == expected, json_name
+    # Only the json of the expected values were parsed
+    assert len(counted_json_load) == len(GameData.get_json_resource_list())
+    kernel_data = GameData.read_json_resource(_json_path(game_data_folder, "kernel_bin_data.json"),
+                                              GameData._convert_kernel_data)
+    assert {section["type"] for section in kernel_data["sections"]} <= {SectionType.DATA, SectionType.FF8_TEXT}
+
+
+def test_modified_json_falls_back_to_json(game_data_folder, counted_json_load):
+    build_resource_bundle(game_data_folder)
+    json_path = _json_path(game_data_folder, "stat.json")
+    stat_data = GameData.read_json_resource(json_path)
+    counted_json_load.clear()
+    with open(json_path, "w", encoding="utf8") as json_file:
+        json.dump({"stat": "modified"}, json_file)
+    assert GameData.read_json_resource(json_path) == {"stat": "modified"}
+    assert stat_data != {"stat": "modified"} and len(counted_json_load) == 1
+
+
+def test_converter_change_makes_bundle_stale(game_data_folder, counted_json_load, monkeypatch):
+    build_resource_bundle(game_data_folder)
+    json_path = _json_path(game_data_folder, "exe.json")
+    counted_json_load.clear()
+    GameData.read_json_resource(json_path, GameData._convert_exe_data)
+    assert not counted_json_load
+    monkeypatch.setattr(GameData, "RESOURCE_CONVERTER_VERSION", GameData.RESOURCE_CONVERTER_VERSION + 1)
+    GameData.read_json_resource(json_path, GameData._convert_exe_data)
+    assert len(counted_json_load) == 1
+
+
+def test_corrupted_bundle_is_ignored(game_data_folder):
+    build_resource_bundle(game_data_folder)
+    json_path = _json_path(game_data_folder, "item.json")
+    with open(GameData.get_resource_bundle_path(json_path), "wb") as bundle_file:
+        bundle_file.write(b"not a pickle")
+    with open(json_path, encoding="utf8") as json_file:
+        assert GameData.read_json_resource(json_path) == json.load(json_file)
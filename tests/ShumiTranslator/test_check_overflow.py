@@ -0,0 +1,51 @@
+"""shumi-translator check-overflow: every text of a translation CSV laid out and checked against its box.
+
+The box of a section comes from a reference CSV (the vanilla texts) or from --max-width/--max-lines.
+Runs with the uniform fallback widths, no game file needed.
+"""
+import pathlib
+import sys
+
+project_root = pathlib.Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from Cli.shumi_translator import ShumiTranslatorCliTool
+
+HEADER = "Section data name|Section Widget id|Text Sub id|Text\n"
+
+
+def _write_csv(path, row_list):
+    path.write_text(HEADER + "".join(f"{name}|{widget}|{sub}|{text}\n" for name, widget, sub, text in row_list),
+                    encoding="utf-8")
+    return str(path)
+
+
+def _run(argv) -> int:
+    tool = ShumiTranslatorCliTool()
+    return tool.execute(tool.build_parser().parse_args(argv))
+
+
+def test_reference_gives_the_box_of_each_section(tmp_path, capsys):
+    reference = _write_csv(tmp_path / "en.csv", [("Item", 0, 0, "Potion"), ("Item", 0, 1, "Phoenix Down"),
+                                                 ("Help", 1, 0, "Short\\nhelp")])
+    translation = _write_csv(tmp_path / "fr.csv", [("Item", 0, 0, "Potion"), ("Item", 0, 1, "Queue de Phenix"),
+                                                   ("Help", 1, 0, "Aide\\ncourt"), ("Help", 1, 1, "A\\nB\\nC")])
+    assert _run(["check-overflow", "-c", translation, "-r", reference]) == 1
+    out = capsys.readouterr().out
+    assert "Item|0|1: width 120/96 px, lines 1/1" in out  # 8 px per glyph without sysfnt.tdw
+    assert "Help|1|1: width 8/40 px, lines 3/2" in out
+    assert "Item|0|0" not in out and "Help|1|0" not in out
+    assert "2 overflowing text(s)" in out
+
+
+def test_explicit_box_and_unencodable_text(tmp_path, capsys):
+    translation = _write_csv(tmp_path / "fr.csv", [("Item", 0, 0, "Potion"), ("Item", 0, 1, "Potion☃")])
+    assert _run(["check-overflow", "-c", translation, "--max-width", "48"]) == 1
+    out = capsys.readouterr().out
+    assert "Item|0|1: can't be encoded" in out
+    assert _run(["check-overflow", "-c", translation, "--max-lines", "1"]) == 1  # Still not encodable
+    translation = _write_csv(tmp_path / "fr.csv", [("Item", 0, 0, "Potion")])
+    assert _run(["check-overflow", "-c", translation, "--max-width", "48"]) == 0
+    assert _run(["check-overflow", "-c", translation, "--max-width", "47"]) == 1
+    assert _run(["check-overflow", "-c", translation]) == 1  # No box given
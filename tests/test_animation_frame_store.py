@@ -0,0 +1,177 @@
+"""The bone data of an animation's frames lives in one AnimationFrameStore (one array per value for all the
+frames), each AnimationFrame being a view of its frame. The views must behave as the former per-bone lists of
+RotationType / RotationVectorDataSupp / Matrix4x4 objects did.
+
+Runs on the .dat files shipped in GFtoDat/, no extracted game file needed.
+"""
+import copy
+import gc
+import math
+import os
+
+import numpy as np
+
+from FF8GameData.dat.monsteranalyser import MonsterAnalyser
+from FF8GameData.monsterdata import AnimationFrame, Matrix4x4, RotationType, RotationVectorDataSupp
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GF_DAT_DIR = os.path.join(REPO, "GFtoDat")
+
+
+def _load(name="Moomba.dat"):
+    enemy = MonsterAnalyser(game_data=None)
+    enemy.load_file_data(os.path.join(GF_DAT_DIR, name), game_data=None)
+    enemy.analyse_loaded_data(game_data=None, lazy=True)
+    return enemy
+
+
+def _object_matrices(frame, bones):
+    """The bone matrices of a frame computed with Matrix4x4 objects only, as set_bone_matrix always did"""
+    world_list = []
+    for bone_index, bone in enumerate(bones):
+        rotation = frame.rotation_vector_data[bone_index]
+        local = Matrix4x4.MultiplyColumnMajor(Matrix4x4.CreateRotationY(-rotation[1].get_rotate_deg()),
+                                              Matrix4x4.CreateRotationX(-rotation[0].get_rotate_deg()))
+        local = Matrix4x4.MultiplyColumnMajor(Matrix4x4.CreateRotationZ(-rotation[2].get_rotate_deg()), local)
+        if bone.parent_id == 0xFFFF:
+            world = local
+            world.M41 = world.M42 = world.M43 = 0.0
+        else:
+            parent = world_list[bone.parent_id]
+            world = Matrix4x4.MultiplyRowMajor(parent, local)
+            size = bones[bone.parent_id].get_size()
+            world.M41 = parent.M13 * size + parent.M41
+            world.M42 = parent.M23 * size + parent.M42
+            world.M43 = parent.M33 * size + parent.M43
+        world.M14 = world.M24 = world.M34 = 0.0
+        world.M44 = 0.0
+        world_list.append(world)
+    return world_list
+
+
+def test_frames_share_one_store():
+    enemy = _load()
+    gc.collect()
+    nb_object = len(gc.get_objects())
+    animation = max(enemy.animation_data.animations, key=lambda anim: anim.get_nb_frame())
+    frame_list = animation.frames
+    gc.collect()
+    # A handful of objects per frame (the frame and its position), none per bone
+    assert len(gc.get_objects()) - nb_object < 10 * len(frame_list) + 100 < len(frame_list) * len(enemy.bone_data.bones)
+    store = frame_list[0]._store
+    assert all(frame._store is store for frame in frame_list)
+    nb_bones = len(enemy.bone_data.bones)
+    assert store.rotation.shape == (len(frame_list), nb_bones, 3)
+    assert store.bone_matrix.shape == (len(frame_list), nb_bones, 4, 4)
+    assert store.bone_matrix.dtype == np.float32
+
+
+def test_matrices_match_matrix4x4():
+    enemy = _load()
+    bones = enemy.bone_data.bones
+    for frame in enemy.animation_data.animations[0].frames:
+        expected = _object_matrices(frame, bones)
+        for matrix, expected_matrix in zip(frame.bone_matrices, expected):
+            assert np.allclose(matrix.to_list()[:12], expected_matrix.to_list()[:12], atol=1e-4)
+            assert np.allclose(matrix.to_list()[12:15], expected_matrix.to_list()[12:15], atol=1e-4)
+
+
+def test_views_write_to_the_store():
+    enemy = _load()
+    bones = enemy.bone_data.bones
+    frame = enemy.animation_data.animations[0].frames[2]
+    rotation = frame.rotation_vector_data[3][1]
+    rotation.rotate_raw(1024)
+    assert frame._store.rotation[2, 3, 1] == 1024
+    assert frame.rotation_vector_data[3][1].get_rotate_deg() == 90.0
+    frame.rotation_vector_data[4] = [RotationType(True, 2, 10), RotationType(False, 0, 0), RotationType(True, 1, -5)]
+    assert [(r.is_rotation_type_available, r.rotation_type_bits, r.get_rotate_raw())
+            for r in frame.rotation_vector_data[4]] == [(True, 2, 10), (False, 0, 0), (True, 1, -5)]
+    frame.rotation_vector_data_supp[0].set_scale_factor(1, 2.0)
+    assert frame._store.scale_flag[2, 0].tolist() == [False, True, False]
+    assert frame.rotation_vector_data_supp[0].get_scale_factors() == (1.0, 2.0, 1.0)
+    frame.set_all_bones_matrix(bones)
+    expected = _object_matrices(frame, bones)
+    assert math.isclose(frame.bone_matrices[4].M41, expected[4].M41, abs_tol=1e-4)
+
+
+def test_deepcopy_detaches_the_frame():
+    enemy = _load()
+    animation = enemy.animation_data.animations[0]
+    frame = animation.frames[1]
+    copied = copy.deepcopy(frame)
+    assert copied._store is not frame._store and copied._store.get_nb_frame() == 1
+    raw = frame.rotation_vector_data[0][0].get_rotate_raw()
+    copied.rotation_vector_data[0][0].rotate_raw(raw + 1)
+    assert frame.rotation_vector_data[0][0].get_rotate_raw() == raw
+    assert [m.to_list() for m in copied.bone_matrices] == [m.to_list() for m in frame.bone_matrices]
+    supp_list = copy.deepcopy(frame.rotation_vector_data_supp)
+    assert all(type(supp) is RotationVectorDataSupp for supp in supp_list)
+
+
+def test_set_nb_bones_and_free_matrices():
+    frame = AnimationFrame(3)
+    frame.rotation_vector_data = [[RotationType(True, 0, raw)] * 3 for raw in (1, 2, 3)]
+    frame.set_nb_bones(5)
+    assert [rotation[0].get_rotate_raw() for rotation in frame.rotation_vector_data] == [1, 2, 3, 0, 0]
+    assert len(frame.bone_matrices) == len(frame.bone_acc_scale) == 5
+    frame.rotation_vector_data = frame.rotation_vector_data[:1]
+    assert len(frame.rotation_vector_data_supp) == 1
+    frame.free_matrices()
+    assert frame.bone_matrices is None and frame._store.bone_matrix is None
+    frame._reset_matrix_lists(1)
+    assert frame.bone_matrices[0].to_list() == Matrix4x4().to_list()
+
+
+def test_edited_animation_saved():
+    enemy = _load()
+    animation = enemy.animation_data.animations[0]
+    original = animation.to_binary()
+    frame = animation.frames[0]
+    assert animation.to_binary() == original  # Same bytes from the frames
+    saved_raw = frame.rotation_vector_data[0][2].get_rotate_raw()
+    frame.rotation_vector_data[0][2].rotate_raw(saved_raw + 8)
+    animation._recompute_frame_storage_types()
+    assert animation.to_binary() != original
+    frame.rotation_vector_data[0][2].rotate_raw(saved_raw)
+    animation._recompute_frame_storage_types()
+    assert len(animation.to_binary()) <= len(original)
+
+
+def _shares_one_store(animation):
+    store = animation.frames[0]._store
+    return store.get_nb_frame() == len(animation.frames) and all(
+        frame._store is store and frame._frame_index == frame_index
+        for frame_index, frame in enumerate(animation.frames))
+
+
+def test_animation_set_nb_bones_keeps_one_store():
+    enemy = _load()
+    bones = enemy.bone_data.bones
+    animation = enemy.animation_data.animations[0]
+    raw_list = [frame.rotation_vector_data[1][0].get_rotate_raw() for frame in animation.frames]
+    animation.set_nb_bones(len(bones) + 1)
+    assert _shares_one_store(animation)
+    assert animation.frames[0]._store.get_nb_bones() == len(bones) + 1
+    assert [frame.rotation_vector_data[1][0].get_rotate_raw() for frame in animation.frames] == raw_list
+    new_bone = copy.deepcopy(bones[1])
+    bones.append(new_bone)
+    frame = animation.frames[-1]
+    frame.mode_bit = 1
+    frame.rotation_vector_data_supp[len(bones) - 1].set_scale_factor(0, 2.0)
+    animation.set_all_bones_matrix(bones)
+    assert frame.bone_acc_scale[len(bones) - 1][0] == 2.0
+
+
+def test_fps_conversion_and_copy_keep_one_store():
+    enemy = _load()
+    bones = enemy.bone_data.bones
+    animation = enemy.animation_data.animations[0]
+    nb_frame = animation.get_nb_frame()
+    animation.create_interpolated_frames(bones, factor=2)
+    assert animation.get_nb_frame() == 2 * nb_frame - 1
+    assert _shares_one_store(animation)
+    assert animation.frames[0]._store.has_matrix.all()
+    copied = copy.deepcopy(animation)
+    assert _shares_one_store(copied) and copied.frames[0]._store is not animation.frames[0]._store
+    assert copied.to_binary() == animation.to_binary()
@@ -0,0 +1,36 @@
+"""The benchmarks of benchmark.py run and time both ways, on the .dat files shipped in GFtoDat/ and on small
+generated data, so they don't rot while nothing else imports them."""
+import os
+
+from FF8GameData.fs.lzs import LzsLevel
+
+import benchmark
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GF_DAT_DIR = os.path.join(REPO, "GFtoDat")
+
+
+def test_load_file_data_benchmark_runs():
+    per_byte_time, load_time = benchmark.benchmark_load_file_data(GF_DAT_DIR, "Moomba.dat", nb_run=1)
+    assert per_byte_time > 0 and load_time > 0
+
+
+def test_animation_decode_benchmark_runs():
+    bit_reader_time, analyze_time = benchmark.benchmark_animation_decode(GF_DAT_DIR, "Moomba.dat", nb_run=1)
+    assert bit_reader_time > 0 and analyze_time > 0
+
+
+def test_bone_matrices_benchmark_runs():
+    per_bone_time, batched_time = benchmark.benchmark_bone_matrices(GF_DAT_DIR, "Moomba.dat", nb_run=1)
+    assert per_bone_time > 0 and batched_time > 0
+
+
+def test_lzs_decode_benchmark_runs():
+    generator_time, bulk_time = benchmark.benchmark_lzs_decode(uncompressed_size=64 * 1024)
+    assert generator_time > 0 and bulk_time > 0
+
+
+def test_lzs_encode_benchmark_runs():
+    results = benchmark.benchmark_lzs_encode(b" ".join(b"word%d" % (i % 97) for i in range(2000)), nb_run=1)
+    assert set(results) == set(LzsLevel)
+    assert all(encode_time > 0 and size > 0 for encode_time, size in results.values())
@@ -0,0 +1,117 @@
+"""bonematrix computes the bone matrices of every frame of an animation at once, one batched operation per level of
+the skeleton. They must be the ones the Matrix4x4 objects give, bone per bone, for the battle (.dat) and the field
+(.mch) skeletons.
+
+Runs on the .dat files shipped in GFtoDat/, no extracted game file needed.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from FF8GameData.dat import bonematrix
+from FF8GameData.dat.monsteranalyser import MonsterAnalyser
+from FF8GameData.mch import mchanalyser
+from FF8GameData.monsterdata import AnimationFrame, Bone, Matrix4x4
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GF_DAT_DIR = os.path.join(REPO, "GFtoDat")
+
+
+def _load(name):
+    enemy = MonsterAnalyser(game_data=None)
+    enemy.load_file_data(os.path.join(GF_DAT_DIR, name), game_data=None)
+    enemy.analyse_loaded_data(game_data=None, lazy=True)
+    return enemy
+
+
+def _as_array(matrix_list):
+    return np.array([matrix.to_list() for matrix in matrix_list]).reshape(-1, 4, 4)
+
+
+def _bone(parent_id, size_raw):
+    bone = Bone()
+    bone.parent_id = parent_id
+    bone.set_size_raw(size_raw)
+    return bone
+
+
+def test_hierarchy_levels():
+    # Bone 0 is stored after its parent, bone 2 is a second root
+    level_list = bonematrix.get_hierarchy_levels([3, 0, 0xFFFF, 0xFFFF, 1])
+    assert [level.tolist() for level in level_list] == [[2, 3], [0], [1], [4]]
+    assert bonematrix.get_hierarchy_levels([]) == []
+    for parent_id_list in ([1, 0], [0], [0xFFFF, 5]):
+        with pytest.raises(ValueError):
+            bonematrix.get_hierarchy_levels(parent_id_list)
+
+
+@pytest.mark.parametrize("name", ["Moomba.dat", "Shiva.dat"])
+def test_battle_matrices_match_set_bone_matrix(name):
+    enemy = _load(name)
+    bones = enemy.bone_data.bones
+    animation = max(enemy.animation_data.animations, key=lambda anim: anim.get_nb_frame())
+    frame_list = animation.frames
+    expected_list = []
+    for frame in frame_list:
+        for bone_id, bone in enumerate(bones):
+            parent_size = bones[bone.parent_id].get_size() if bone.parent_id != 0xFFFF else 0
+            frame.set_bone_matrix(bone.parent_id, parent_size, bone_id)
+        expected_list.append((_as_array(frame.bone_chain_matrices), np.array(list(frame.bone_acc_scale)),
+                              _as_array(frame.bone_matrices)))
+    animation.set_all_bones_matrix(bones)
+    for frame, (chain, acc_scale, world) in zip(frame_list, expected_list):
+        np.testing.assert_allclose(_as_array(frame.bone_chain_matrices), chain, atol=1e-5)
+        np.testing.assert_allclose(np.array(list(frame.bone_acc_scale)), acc_scale, atol=1e-5)
+        np.testing.assert_allclose(_as_array(frame.bone_matrices), world, atol=1e-4)
+
+
+def test_battle_scaled_bones_match_set_bone_matrix():
+    bones = [_bone(0xFFFF, 0), _bone(0, 2048), _bone(1, -1024), _bone(0, 512)]
+    rng = np.random.default_rng(25)
+    frame = AnimationFrame(len(bones))
+    frame.mode_bit = 1
+    for bone_id in range(len(bones)):
+        for axis in range(3):
+            frame.rotation_vector_data[bone_id][axis].rotate_raw(int(rng.integers(-4096, 4096)))
+            frame.rotation_vector_data_supp[bone_id].set_scale_raw(axis, int(rng.integers(512, 2048)))
+    for bone_id, bone in enumerate(bones):
+        parent_size = bones[bone.parent_id].get_size() if bone.parent_id != 0xFFFF else 0
+        frame.set_bone_matrix(bone.parent_id, parent_size, bone_id)
+    world = _as_array(frame.bone_matrices)
+    acc_scale = np.array(list(frame.bone_acc_scale))
+    assert not np.allclose(acc_scale, 1.0)
+    frame.set_all_bones_matrix(bones)
+    np.testing.assert_allclose(np.array(list(frame.bone_acc_scale)), acc_scale, atol=1e-5)
+    np.testing.assert_allclose(_as_array(frame.bone_matrices), world, atol=1e-5)
+
+
+def test_field_matrices_match_matrix4x4():
+    bones = [_bone(0xFFFF, 0), _bone(0, 2048), _bone(1, 1500), _bone(0, -700)]
+    rng = np.random.default_rng(8)
+    frame_list = []
+    for _ in range(3):
+        frame = AnimationFrame(len(bones))
+        for bone_id in range(len(bones)):
+            for axis in range(3):
+                frame.rotation_vector_data[bone_id][axis].rotate_raw(int(rng.integers(-2048, 2048)))
+        frame_list.append(frame)
+    mchanalyser.compute_frame_list_matrices(frame_list, bones)
+    for frame in frame_list:
+        world_list = []
+        for bone_id, bone in enumerate(bones):
+            rotation = frame.rotation_vector_data[bone_id]
+            local = Matrix4x4.MultiplyRowMajor(Matrix4x4.CreateRotationX(rotation[0].get_rotate_deg()),
+                                               Matrix4x4.MultiplyRowMajor(
+                                                   Matrix4x4.CreateRotationY(rotation[1].get_rotate_deg()),
+                                                   Matrix4x4.CreateRotationZ(rotation[2].get_rotate_deg())))
+            if bone.parent_id != 0xFFFF:
+                parent, parent_size = world_list[bone.parent_id], bones[bone.parent_id].get_size()
+            else:
+                parent, parent_size = mchanalyser._pre_root_matrix(), 0.0
+            world = Matrix4x4.MultiplyRowMajor(parent, local)
+            world.M41 = parent.M13 * parent_size + parent.M41
+            world.M42 = parent.M23 * parent_size + parent.M42
+            world.M43 = parent.M33 * parent_size + parent.M43
+            world_list.append(world)
+        np.testing.assert_allclose(_as_array(frame.bone_matrices), _as_array(world_list), atol=1e-5)
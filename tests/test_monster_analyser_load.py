@@ -0,0 +1,103 @@
+"""MonsterAnalyser.load_file_data reads a .dat in one go and keeps each section as a view into
+that buffer (SectionRawDataList) until the section is accessed, instead of reading the file byte
+per byte and copying every section out of it.
+
+Runs on the .dat files shipped in GFtoDat/, no extracted game file needed.
+"""
+import copy
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+_APP = QApplication.instance() or QApplication([])
+
+from Ifrit.ifritmanager import IfritManager
+from FF8GameData.dat.monsteranalyser import MonsterAnalyser, SectionRawDataList
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GF_DAT_DIR = os.path.join(REPO, "GFtoDat")
+GF_FILE_LIST = ["Moomba.dat", "Quezacotl.dat"]
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return IfritManager(os.path.join(REPO, "FF8GameData"))
+
+
+def _read(name):
+    with open(os.path.join(GF_DAT_DIR, name), "rb") as f:
+        return f.read()
+
+
+def test_read_file_is_the_whole_file():
+    path = os.path.join(GF_DAT_DIR, "Moomba.dat")
+    file_raw_data = MonsterAnalyser.read_file(path)
+    assert isinstance(file_raw_data, bytearray)
+    assert file_raw_data == _read("Moomba.dat")
+
+
+@pytest.mark.parametrize("name", GF_FILE_LIST)
+def test_sections_are_views_until_accessed(manager, name):
+    manager.init_from_file(os.path.join(GF_DAT_DIR, name))
+    enemy = manager.enemy
+    raw = _read(name)
+    pos = enemy.header_data['section_pos'][:enemy.header_data['nb_section']] + [len(raw)]
+    # Parsing only reads the sections through get_view, none is copied by the load
+    for i in range(enemy.header_data['nb_section']):
+        assert enemy.section_raw_data.is_view(i)
+        assert enemy.section_raw_data.get_view(i) == raw[pos[i]:pos[i + 1]]
+    section = enemy.section_raw_data[6]
+    assert isinstance(section, bytearray) and not enemy.section_raw_data.is_view(6)
+    assert section == raw[pos[6]:pos[7]]
+    section.extend(b"\x00")  # Its own copy, editable
+    assert enemy.file_raw_data == raw
+    section[-1:] = b""
+    assert enemy.get_bytes(manager.game_data) == raw
+
+
+def test_section_list_can_be_copied():
+    raw = bytearray(b"headersection1")
+    view = memoryview(raw).toreadonly()
+    section_list = SectionRawDataList([view[0:6], view[6:]])
+    for copied in (copy.copy(section_list), copy.deepcopy(section_list)):
+        assert isinstance(copied, SectionRawDataList)
+        assert list(copied) == [bytearray(b"header"), bytearray(b"section1")]
+        copied[0].extend(b"!")
+    assert section_list.is_view(0) and section_list.get_view(0) == b"header"
+    assert section_list[1:] == [bytearray(b"section1")]
+
+
+def _load(manager, name, lazy):
+    enemy = MonsterAnalyser(manager.game_data)
+    enemy.load_file_data(os.path.join(GF_DAT_DIR, name), manager.game_data)
+    enemy.analyse_loaded_data(manager.game_data, manager.decompiler, lazy=lazy)
+    return enemy
+
+
+@pytest.mark.parametrize("name", GF_FILE_LIST)
+def test_lazy_analyse_only_parses_accessed_sections(manager, name):
+    enemy = _load(manager, name, lazy=True)
+    section_data_name_list = list(MonsterAnalyser.SECTION_DATA_BY_ENTITY[enemy.entity_type].values())
+    assert not any(enemy.is_section_data_parsed(name) for name in section_data_name_list)
+    monster_name = enemy.info_stat_data['monster_name'].get_str()
+    assert enemy.is_section_data_parsed('info_stat_data')
+    assert not enemy.is_section_data_parsed('animation_data')
+    eager_enemy = _load(manager, name, lazy=False)
+    assert monster_name == eager_enemy.info_stat_data['monster_name'].get_str()
+    assert [text.get_str() for text in enemy.battle_script_data['battle_text']] == \
+           [text.get_str() for text in eager_enemy.battle_script_data['battle_text']]
+    assert enemy.get_bytes(manager.game_data) == _read(name)
+    assert not enemy.is_section_data_parsed('animation_data')  # Saved as read
+    assert len(enemy.animation_data.animations) == len(eager_enemy.animation_data.animations) > 0
+    assert enemy.get_bytes(manager.game_data) == eager_enemy.get_bytes(manager.game_data) == _read(name)
+
+
+def test_lazy_section_set_before_access_is_not_parsed(manager):
+    enemy = _load(manager, "Moomba.dat", lazy=True)
+    eager_enemy = _load(manager, "Moomba.dat", lazy=False)
+    enemy.seq_animation_data = copy.deepcopy(eager_enemy.seq_animation_data)
+    assert enemy.is_section_data_parsed('seq_animation_data')
+    assert enemy.get_bytes(manager.game_data) == _read("Moomba.dat")
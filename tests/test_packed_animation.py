@@ -0,0 +1,106 @@
+"""AnimationSection.analyze decodes each animation in one pass into NumPy arrays (PackedAnimation) and only builds
+the AnimationFrame objects when they are accessed. The frames built must be the ones the former BitReader parsing
+(Animation.add_frame) gave, and both must write back the section bytes.
+
+Runs on the .dat files shipped in GFtoDat/, no extracted game file needed.
+"""
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from FF8GameData.dat.monsteranalyser import MonsterAnalyser
+from FF8GameData.monsterdata import Animation, AnimationSection, BitReader, PackedAnimation
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GF_DAT_DIR = os.path.join(REPO, "GFtoDat")
+GF_FILE_LIST = sorted(os.path.basename(path) for path in glob.glob(os.path.join(GF_DAT_DIR, "*.dat")))
+
+
+def _load_animation_section(name):
+    """Raw animation section and bone section of a GFtoDat monster"""
+    analyser = MonsterAnalyser(game_data=None)
+    analyser.load_file_data(os.path.join(GF_DAT_DIR, name), game_data=None)
+    analyser.analyse_loaded_data(game_data=None, lazy=True)
+    return bytes(analyser.section_raw_data.get_view(3)), analyser.bone_data
+
+
+def _bit_reader_animation_list(data, bone_section):
+    animation_list = []
+    for anim_idx in range(int.from_bytes(data[0:4], byteorder="little")):
+        anim_start = int.from_bytes(data[4 + anim_idx * 4: 8 + anim_idx * 4], byteorder="little")
+        anim = Animation()
+        bit_reader = BitReader(data, start_byte=anim_start + 1)
+        for frame_index in range(data[anim_start]):
+            anim.add_frame(bit_reader, bone_section)
+        animation_list.append(anim)
+    return animation_list
+
+
+def _frame_values(frame):
+    matrix_list = [[getattr(matrix, f"M{i}{j}") for i in range(1, 5) for j in range(1, 5)]
+                   for matrix in frame.bone_matrices]
+    return ([(position.position_type_bits, position.get_pos_raw()) for position in frame.position],
+            frame.mode_bit,
+            [[(rotation.is_rotation_type_available, rotation.rotation_type_bits, rotation.get_rotate_raw())
+              for rotation in bone_rotation] for bone_rotation in frame.rotation_vector_data],
+            [(supp.unk_flag1, supp.unk1, supp.unk_flag2, supp.unk2, supp.unk_flag3, supp.unk3)
+             for supp in frame.rotation_vector_data_supp],
+            matrix_list)
+
+
+@pytest.mark.parametrize("name", GF_FILE_LIST)
+def test_packed_animation_matches_bit_reader(name):
+    data, bone_section = _load_animation_section(name)
+    animation_section = AnimationSection()
+    animation_section.analyze(data, bone_section)
+    packed_binary = animation_section.to_binary()
+    assert not any(anim.is_expanded() for anim in animation_section.animations)
+    bit_reader_animation_list = _bit_reader_animation_list(data, bone_section)
+    assert len(animation_section.animations) == len(bit_reader_animation_list)
+    for anim, bit_reader_anim in zip(animation_section.animations, bit_reader_animation_list):
+        assert anim.get_nb_frame() == bit_reader_anim.get_nb_frame()
+        packed = anim.packed
+        assert anim.to_binary()[:len(packed.raw_data)] == bit_reader_anim.to_binary()
+        assert [_frame_values(frame) for frame in anim.frames] == \
+               [_frame_values(frame) for frame in bit_reader_anim.frames]
+        assert anim.is_expanded() and anim.packed is None
+    # Same bytes written from the arrays and from the frames, the ones of the file but for the unread bits ending an
+    # animation (zero-filled, see AnimationSection.analyze)
+    bit_reader_section = AnimationSection()
+    bit_reader_section.nb_animations = animation_section.nb_animations
+    bit_reader_section.animations = bit_reader_animation_list
+    for anim, bit_reader_anim in zip(animation_section.animations, bit_reader_animation_list):
+        bit_reader_anim.original_tail = anim.original_tail
+    assert packed_binary == animation_section.to_binary() == bit_reader_section.to_binary()
+    assert len(packed_binary) == len(data)
+    if name != "Griever.dat":
+        assert packed_binary == data
+
+
+def test_packed_arrays():
+    data, bone_section = _load_animation_section("Moomba.dat")
+    anim_start = int.from_bytes(data[4:8], byteorder="little")
+    packed, end_byte = PackedAnimation.decode(data, anim_start, len(bone_section.bones))
+    frame_list = _bit_reader_animation_list(data, bone_section)[0].frames
+    nb_bones = len(bone_section.bones)
+    assert packed.rotation_delta.shape == (len(frame_list), nb_bones, 3)
+    assert end_byte == anim_start + len(packed.raw_data)
+    assert packed.get_rotation().tolist() == [[[rotation.get_rotate_raw() for rotation in bone_rotation]
+                                               for bone_rotation in frame.rotation_vector_data] for frame in frame_list]
+    assert packed.get_position().tolist() == [[position.get_pos_raw() for position in frame.position]
+                                              for frame in frame_list]
+    assert not packed.rotation_delta[~packed.rotation_available].any()
+
+
+def test_freed_matrices_are_not_built_with_the_frames():
+    data, bone_section = _load_animation_section("Moomba.dat")
+    animation_section = AnimationSection()
+    animation_section.analyze(data, bone_section)
+    animation_section.free_bone_matrices()
+    assert not animation_section.matrices_built
+    assert all(frame.bone_matrices is None for frame in animation_section.animations[0].frames)
+    animation_section.build_bone_matrices(bone_section.bones)
+    assert animation_section.animations[0].frames[0].bone_matrices is not None
+    assert animation_section.animations[1].frames[0].bone_matrices is not None